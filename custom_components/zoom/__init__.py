@@ -2,12 +2,13 @@
 
 from __future__ import annotations
 
+import asyncio
 from copy import deepcopy
 from logging import getLogger
+import time
 
 from aiohttp.client_exceptions import ClientResponseError
 from aiohttp.web_exceptions import HTTPUnauthorized
-from homeassistant.components.event import DOMAIN as EVT_DOMAIN
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import (
     CONF_CLIENT_ID,
@@ -16,9 +17,8 @@ from homeassistant.const import (
     CONF_NAME,
     Platform,
 )
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers import config_entry_oauth2_flow, config_validation as cv
-from homeassistant.helpers.dispatcher import async_dispatcher_send
 from homeassistant.helpers.entity_registry import (
     async_entries_for_config_entry,
     async_get as async_get_entity_registry,
@@ -29,22 +29,41 @@ import voluptuous as vol
 from .api import ZoomAPI
 from .common import (
     ZoomOAuth2Implementation,
-    ZoomUserProfileDataUpdateCoordinator,
     ZoomWebhookRequestView,
+    clear_keyed_hmacs,
     valid_external_url,
 )
-from .config_flow import ZoomOAuth2FlowHandler
 from .const import (
     API,
+    CONF_ALLOWED_NETWORKS,
     CONF_SECRET_TOKEN,
     CONF_VERIFICATION_TOKEN,
+    CONF_WEBHOOK_RATE_LIMIT,
+    DATA_API_SEMAPHORE,
+    DATA_POLL_SCHEDULER,
+    DATA_PROFILER,
+    DATA_WEBHOOK_LIMITER,
+    DATA_WEBHOOK_METRICS,
+    DEFAULT_NAME,
     DOMAIN,
+    EVENT_TYPES,
+    MAX_CONCURRENT_API_REQUESTS,
+    MEETING_TRACKER,
+    METRICS,
     OAUTH2_AUTHORIZE,
     OAUTH2_TOKEN,
-    SIGNAL_NEW_ZOOM_EVENT_TYPE,
+    PRESENCE_STATS,
+    STARTUP_TIMINGS,
     USER_PROFILE_COORDINATOR,
-    ZOOM_SCHEMA,
 )
+from .coordinator import ZoomUserProfileDataUpdateCoordinator
+from .limiter import DEFAULT_SOURCE_RATE, ZoomWebhookLimiter, parse_networks
+from .meetings import ZoomMeetingTracker
+from .metrics import ZoomEntryMetrics, ZoomWebhookMetrics
+from .models import ZoomProfile
+from .presence import ZoomPresenceStats
+from .profiling import async_setup_profiling
+from .scheduler import ZoomPollScheduler
 
 _LOGGER = getLogger(__name__)
 
@@ -60,7 +79,15 @@ def ensure_all_have_unique_names(value: list[dict[str, str]]) -> list[dict[str,
     return value
 
 
-SCHEMA = ZOOM_SCHEMA.schema
+SCHEMA = {
+    vol.Optional(CONF_NAME, default=DEFAULT_NAME): vol.Coerce(str),
+    vol.Required(CONF_CLIENT_ID): vol.Coerce(str),
+    vol.Required(CONF_CLIENT_SECRET): vol.Coerce(str),
+    # secret_token is preferred; verification_token is deprecated but supported for
+    # migration
+    vol.Optional(CONF_SECRET_TOKEN): vol.Coerce(str),
+    vol.Optional(CONF_VERIFICATION_TOKEN): vol.Coerce(str),
+}
 CONFIG_SCHEMA = vol.Schema(
     {
         DOMAIN: vol.All(
@@ -72,7 +99,7 @@ CONFIG_SCHEMA = vol.Schema(
     extra=vol.ALLOW_EXTRA,
 )
 
-PLATFORMS = [Platform.BINARY_SENSOR, Platform.EVENT]
+PLATFORMS = [Platform.BINARY_SENSOR, Platform.EVENT, Platform.SENSOR]
 
 
 def remove_verification_token_from_entry(
@@ -88,6 +115,14 @@ def remove_verification_token_from_entry(
 
 async def async_setup(hass: HomeAssistant, config: ConfigType):
     """Set up the Zoom component."""
+    # The webhook view is shared by all config entries, so it is only registered
+    # once per Home Assistant instance
+    webhook_metrics = hass.data[DATA_WEBHOOK_METRICS] = ZoomWebhookMetrics()
+    limiter = hass.data[DATA_WEBHOOK_LIMITER] = ZoomWebhookLimiter()
+    profiler = async_setup_profiling(hass)
+    hass.http.register_view(ZoomWebhookRequestView(webhook_metrics, profiler, limiter))
+    hass.data[DATA_POLL_SCHEDULER] = ZoomPollScheduler(hass)
+
     if DOMAIN not in config:
         return True
 
@@ -107,8 +142,9 @@ async def async_setup(hass: HomeAssistant, config: ConfigType):
                 app[CONF_NAME],
             )
 
-        ZoomOAuth2FlowHandler.async_register_implementation(
+        config_entry_oauth2_flow.async_register_implementation(
             hass,
+            DOMAIN,
             ZoomOAuth2Implementation(
                 hass,
                 DOMAIN,
@@ -146,6 +182,33 @@ async def async_setup(hass: HomeAssistant, config: ConfigType):
     return True
 
 
+@callback
+def _async_update_limiter(hass: HomeAssistant) -> None:
+    """Apply the webhook options of all config entries to the shared limiter."""
+    limiter: ZoomWebhookLimiter = hass.data[DATA_WEBHOOK_LIMITER]
+    entries = hass.config_entries.async_entries(DOMAIN)
+    limiter.allowed_networks = {
+        entry.entry_id: parse_networks(entry.options.get(CONF_ALLOWED_NETWORKS, []))
+        for entry in entries
+    }
+    # Requests are rate limited before it is known which config entry they are for,
+    # so the highest rate of any config entry applies
+    limiter.set_source_rate(
+        max(
+            (
+                entry.options.get(CONF_WEBHOOK_RATE_LIMIT, DEFAULT_SOURCE_RATE)
+                for entry in entries
+            ),
+            default=DEFAULT_SOURCE_RATE,
+        )
+    )
+
+
+async def _async_options_updated(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Apply options that aren't handled by the platforms."""
+    _async_update_limiter(hass)
+
+
 async def async_migrate_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Migrate old config entry to new version."""
     _LOGGER.debug("Migrating Zoom config entry from version %s", entry.version)
@@ -192,6 +255,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
         entry.async_start_reauth(hass, data=reauth_data)
         return False
 
+    setup_start = time.monotonic()
     hass.data.setdefault(DOMAIN, {})
     hass.data[DOMAIN].setdefault(entry.entry_id, {})
     try:
@@ -211,10 +275,25 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
             entry.data[CONF_SECRET_TOKEN],
             entry.data[CONF_NAME],
         )
-        ZoomOAuth2FlowHandler.async_register_implementation(hass, implementation)
-
-    api = ZoomAPI(config_entry_oauth2_flow.OAuth2Session(hass, entry, implementation))
+        config_entry_oauth2_flow.async_register_implementation(
+            hass, DOMAIN, implementation
+        )
 
+    # Config entries are set up concurrently and share Home Assistant's aiohttp
+    # session, so a single semaphore caps the startup burst against the Zoom API
+    if (request_semaphore := hass.data.get(DATA_API_SEMAPHORE)) is None:
+        request_semaphore = hass.data[DATA_API_SEMAPHORE] = asyncio.Semaphore(
+            MAX_CONCURRENT_API_REQUESTS
+        )
+    metrics = hass.data[DOMAIN][entry.entry_id][METRICS] = ZoomEntryMetrics()
+    api = ZoomAPI(
+        config_entry_oauth2_flow.OAuth2Session(hass, entry, implementation),
+        request_semaphore,
+        metrics,
+        hass.data[DATA_PROFILER],
+    )
+
+    profile_start = time.monotonic()
     try:
         my_profile = await api.async_get_my_user_profile()
     except (HTTPUnauthorized, ClientResponseError) as err:
@@ -226,37 +305,79 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
         entry.async_start_reauth(hass, data=dict(entry.data))
         return False
 
+    profile_time = time.monotonic() - profile_start
+
+    # Seed the coordinator with the profile we just fetched instead of fetching it
+    # again
     coordinator = ZoomUserProfileDataUpdateCoordinator(hass, api)
-    await coordinator.async_refresh()
+    coordinator.async_set_updated_data(ZoomProfile.from_dict(my_profile))
     hass.data[DOMAIN][entry.entry_id][USER_PROFILE_COORDINATOR] = coordinator
     hass.data[DOMAIN][entry.entry_id][API] = api
-    new_data = entry.data.copy()
-    new_data[CONF_ID] = my_profile.get("id")  # type: ignore
-    hass.config_entries.async_update_entry(entry, data=new_data)  # type: ignore
 
-    # Register view
-    hass.http.register_view(ZoomWebhookRequestView())
+    # Rebuild the active meetings from the last snapshot, then keep them up to date
+    # from webhook events
+    meeting_tracker = ZoomMeetingTracker(hass, entry.entry_id)
+    await meeting_tracker.async_load()
+    entry.async_on_unload(meeting_tracker.async_start())
+    hass.data[DOMAIN][entry.entry_id][MEETING_TRACKER] = meeting_tracker
+
+    # The presence binary sensor adds to the restored statistics as its status
+    # changes
+    presence_stats = ZoomPresenceStats(hass, entry.entry_id)
+    await presence_stats.async_load()
+    hass.data[DOMAIN][entry.entry_id][PRESENCE_STATS] = presence_stats
+
+    # Only write to config entry storage when the ID actually changed
+    if entry.data.get(CONF_ID) != (my_id := my_profile.get("id")):
+        hass.config_entries.async_update_entry(
+            entry, data={**entry.data, CONF_ID: my_id}
+        )
+
+    # Index the event types that already have an entity with a single pass over the
+    # entity registry (unique ID format: zoom_{name}|{event_type}). The event
+    # platform and the webhook view share this index.
+    ent_reg = async_get_entity_registry(hass)
+    hass.data[DOMAIN][entry.entry_id][EVENT_TYPES] = {
+        ent_entry.unique_id.split("|", 1)[1]
+        for ent_entry in async_entries_for_config_entry(ent_reg, entry.entry_id)
+        if ent_entry.domain == Platform.EVENT and "|" in ent_entry.unique_id
+    }
 
     # Forward config entry setups for all defined platforms
+    platforms_start = time.monotonic()
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    platforms_time = time.monotonic() - platforms_start
 
-    # Re-add any existing event entities for this config entry by obtaining their
-    # event type from their unique IDs
-    ent_reg = async_get_entity_registry(hass)
-    for event_type in {
-        ent_entry.unique_id.split("|")[-1]
-        for ent_entry in async_entries_for_config_entry(ent_reg, entry.entry_id)
-        if ent_entry.domain == EVT_DOMAIN
-    }:
-        async_dispatcher_send(
-            hass, f"{SIGNAL_NEW_ZOOM_EVENT_TYPE}|{entry.entry_id}", event_type
-        )
+    # The webhook view is shared, so its limiter follows the options of all config
+    # entries
+    _async_update_limiter(hass)
+    entry.async_on_unload(entry.add_update_listener(_async_options_updated))
+
+    hass.data[DOMAIN][entry.entry_id][STARTUP_TIMINGS] = timings = {
+        "profile": round(profile_time, 3),
+        "platforms": round(platforms_time, 3),
+        "total": round(time.monotonic() - setup_start, 3),
+    }
+    _LOGGER.debug("Set up Zoom config entry %s in %s", entry.title, timings)
 
     return True
 
 
 async def async_unload_entry(hass: HomeAssistant, config_entry: ConfigEntry):
     """Unload a config entry."""
-    hass.data[DOMAIN].pop(config_entry.entry_id)
-
-    return True
+    if unload_ok := await hass.config_entries.async_unload_platforms(
+        config_entry, PLATFORMS
+    ):
+        entry_data = hass.data[DOMAIN].pop(config_entry.entry_id)
+        await entry_data[MEETING_TRACKER].async_unload()
+        await entry_data[PRESENCE_STATS].async_unload()
+        # The HMACs of the remaining entries are keyed again on their next request
+        clear_keyed_hmacs()
+
+    return unload_ok
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove data persisted for a config entry."""
+    await ZoomMeetingTracker(hass, entry.entry_id).async_remove()
+    await ZoomPresenceStats(hass, entry.entry_id).async_remove()
@@ -1,13 +1,23 @@
 """API for Zoom Automation bound to Home Assistant OAuth."""
 from __future__ import annotations
 
+import asyncio
 import logging
+import time
 from typing import Any
 
 from aiohttp.web import HTTPUnauthorized
 from homeassistant.helpers import config_entry_oauth2_flow
 
-from .const import BASE_URL, CONTACT_LIST_URL, USER_PROFILE_URL
+from .const import (
+    BASE_URL,
+    CONTACT_LIST_URL,
+    MAX_CONCURRENT_API_REQUESTS,
+    USER_PROFILE_URL,
+)
+from .metrics import ZoomEntryMetrics
+from .models import ZoomContact
+from .profiling import ZoomProfiler
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -15,9 +25,21 @@ _LOGGER = logging.getLogger(__name__)
 class ZoomAPI:
     """Provide Zoom Automation authentication tied to an OAuth2 based config entry."""
 
-    def __init__(self, oauth_session: config_entry_oauth2_flow.OAuth2Session) -> None:
+    def __init__(
+        self,
+        oauth_session: config_entry_oauth2_flow.OAuth2Session,
+        request_semaphore: asyncio.Semaphore | None = None,
+        metrics: ZoomEntryMetrics | None = None,
+        profiler: ZoomProfiler | None = None,
+    ) -> None:
         """Initialize Zoom auth."""
         self._oauth_session = oauth_session
+        self._metrics = metrics or ZoomEntryMetrics()
+        self._profiler = profiler
+        # Shared across config entries to cap concurrent requests to the Zoom API
+        self._request_semaphore = request_semaphore or asyncio.Semaphore(
+            MAX_CONCURRENT_API_REQUESTS
+        )
 
     async def async_get_access_token(self) -> dict:
         """Return a valid access token."""
@@ -25,27 +47,45 @@ class ZoomAPI:
 
         return self._oauth_session.token
 
+    async def _async_get_json(self, name: str, url: str, **kwargs: Any) -> Any:
+        """Make a GET request to the Zoom API and return the JSON response."""
+        stats = self._metrics.api[name]
+        async with self._request_semaphore:
+            start = time.perf_counter()
+            stats.calls += 1
+            try:
+                resp = await self._oauth_session.async_request(
+                    "get", url, raise_for_status=True, **kwargs
+                )
+                return await resp.json()
+            except Exception:
+                stats.errors += 1
+                raise
+            finally:
+                duration = time.perf_counter() - start
+                stats.latency.observe(duration)
+                if self._profiler and self._profiler.enabled:
+                    self._profiler.record(f"api.{name}", duration)
+
     async def async_get_my_user_profile(self) -> dict[str, Any]:
         """Get user profile for this authentication."""
-        resp = await self._oauth_session.async_request(
-            "get", f"{BASE_URL}{USER_PROFILE_URL}", raise_for_status=True
+        return await self._async_get_json(
+            "user_profile", f"{BASE_URL}{USER_PROFILE_URL}"
         )
-        return await resp.json()
 
     async def async_get_contact_user_profile(self, id: str | None) -> dict[str, str]:
         """Get presence status for user with given ID."""
-        resp = await self._oauth_session.async_request(
-            "get",
+        return await self._async_get_json(
+            "contact_profile",
             f"{BASE_URL}{CONTACT_LIST_URL}/{id}",
             params={"query_presence_status": "true"},
-            raise_for_status=True,
         )
-        return await resp.json()
 
     async def async_get_contacts(
         self, contact_types: list[str] = ["external"], limit: int = None
-    ) -> list[dict[str, str]]:
-        contacts = []
+    ) -> list[ZoomContact]:
+        """Get the contacts of the given types, with their presence status."""
+        contacts: list[ZoomContact] = []
 
         for contact_type in contact_types:
             next_page_token = None
@@ -53,23 +93,24 @@ class ZoomAPI:
             while (next_page_token or next_page_token is None) and (
                 not limit or len(contacts) < limit
             ):
-                params = {"type": contact_type, "page_size": 50}
+                params = {
+                    "type": contact_type,
+                    "page_size": 50,
+                    "query_presence_status": "true",
+                }
                 if next_page_token:
                     params["next_page_token"] = next_page_token
                 try:
-                    resp = await self._oauth_session.async_request(
-                        "get",
-                        f"{BASE_URL}{CONTACT_LIST_URL}",
-                        params=params,
-                        raise_for_status=True,
+                    resp_json = await self._async_get_json(
+                        "contacts", f"{BASE_URL}{CONTACT_LIST_URL}", params=params
                     )
                 except HTTPUnauthorized:
                     return []
 
-                resp_json = await resp.json()
-                for item in resp_json["contacts"]:
-                    item.update({"contact_type": contact_type})
-                contacts.extend(resp_json["contacts"])
+                contacts.extend(
+                    ZoomContact.from_contact_dict(item, contact_type)
+                    for item in resp_json["contacts"]
+                )
 
                 next_page_token = resp_json.get("next_page_token")
 
@@ -1,6 +1,7 @@
 """Sensor platform for Zoom."""
 from __future__ import annotations
 
+from dataclasses import dataclass
 from datetime import timedelta
 from logging import getLogger
 from typing import Any
@@ -12,34 +13,47 @@ from homeassistant.components.binary_sensor import (
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_ID, CONF_NAME
-from homeassistant.core import Event, HomeAssistant
+from homeassistant.core import Event, HomeAssistant, callback
 from homeassistant.helpers.dispatcher import (
     async_dispatcher_connect,
     async_dispatcher_send,
 )
-from homeassistant.helpers.event import async_track_time_interval
-from homeassistant.helpers.restore_state import RestoreEntity
+from homeassistant.helpers.restore_state import ExtraStoredData, RestoreEntity
 from homeassistant.util import slugify
 
-from .common import ZoomAPI, ZoomUserProfileDataUpdateCoordinator, get_contact_name
+from .api import ZoomAPI
+from .common import get_contact_name
 from .const import (
     API,
     ATTR_EVENT,
+    ATTR_EVENT_TS,
+    ATTR_LAST_EVENT_TS,
     CONF_CONNECTIVITY_ON_STATUSES,
     CONNECTIVITY_EVENT,
     CONNECTIVITY_ID,
     CONNECTIVITY_STATUS,
+    DATA_POLL_SCHEDULER,
     DEFAULT_CONNECTIVITY_ON_STATUSES,
     DOMAIN,
     HA_ZOOM_EVENT,
+    METRICS,
+    PRESENCE_STATS,
     USER_PROFILE_COORDINATOR,
 )
+from .coordinator import ZoomUserProfileDataUpdateCoordinator
+from .metrics import ZoomEntryMetrics
+from .models import ZoomProfile
+from .presence import ZoomPresenceStats
+from .scheduler import is_unreachable_error
 
 _LOGGER = getLogger(__name__)
 
 SCAN_INTERVAL = timedelta(seconds=30)
 PARALLEL_UPDATES = 5
 
+# Shared so the attributes cache can tell that the profile is still missing
+_NO_PROFILE = ZoomProfile()
+
 
 async def async_setup_entry(
     hass: HomeAssistant, config_entry: ConfigEntry, async_add_entities
@@ -52,7 +66,23 @@ async def async_setup_entry(
             options={CONF_CONNECTIVITY_ON_STATUSES: DEFAULT_CONNECTIVITY_ON_STATUSES},
         )
     entity = ZoomAuthenticatedUserBinarySensor(hass, config_entry)
-    async_add_entities([entity], update_before_add=True)
+    async_add_entities([entity])
+
+
+@dataclass
+class ZoomPresenceExtraStoredData(ExtraStoredData):
+    """Extra stored data for Zoom presence binary sensors."""
+
+    last_event_ts: int | None
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a dict representation of the extra data."""
+        return {ATTR_LAST_EVENT_TS: self.last_event_ts}
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> ZoomPresenceExtraStoredData:
+        """Create extra stored data from a dict."""
+        return cls(last_event_ts=data.get(ATTR_LAST_EVENT_TS))
 
 
 def get_data_from_path(data: dict[str, Any], path: list[str]) -> str | None:
@@ -76,21 +106,36 @@ class ZoomBaseBinarySensor(RestoreEntity, BinarySensorEntity):
             config_entry.entry_id
         ][USER_PROFILE_COORDINATOR]
         self._api: ZoomAPI = hass.data[DOMAIN][config_entry.entry_id][API]
+        self._metrics: ZoomEntryMetrics = hass.data[DOMAIN][config_entry.entry_id][
+            METRICS
+        ]
         self._name: str = config_entry.data[CONF_NAME]
-        self._profile = None
+        self._profile: ZoomProfile | None = None
         self._zoom_event_state = None
         self._is_on = False
+        self._on_statuses = frozenset(
+            config_entry.options[CONF_CONNECTIVITY_ON_STATUSES]
+        )
+        # Attributes are only rebuilt when the profile or the Zoom status changes
+        self._attributes: dict[str, Any] | None = None
+        self._attributes_profile: ZoomProfile | None = None
+        self._attributes_status: str | None = None
+        # State, availability and attributes last written to the state machine
+        self._written_state: tuple[bool, bool, dict[str, Any] | None] | None = None
 
         self._attr_device_class = BinarySensorDeviceClass.CONNECTIVITY
         self._attr_unique_id = f"{DOMAIN}_{slugify(self._name)}"
         self._attr_available = True
         self._attr_should_poll = False
 
-    async def _async_update(self, now) -> None:
+    async def _async_update(self) -> None:
         """Update state of entity."""
         if self.id:
+            self._metrics.polls += 1
             try:
-                self._profile = await self._api.async_get_contact_user_profile(self.id)
+                self._profile = ZoomProfile.from_dict(
+                    await self._api.async_get_contact_user_profile(self.id)
+                )
                 # If API call succeeds but we are unavailable, that means we just regained
                 # connectivity to Zoom so we should do a single poll to update status.
                 if not self._attr_available:
@@ -98,18 +143,27 @@ class ZoomBaseBinarySensor(RestoreEntity, BinarySensorEntity):
                         "We can reach Zoom again, polling for current status in case "
                         "we missed updates"
                     )
-                    self._set_state(self._profile["presence_status"])
+                    self._set_state(self._profile.presence_status)
                     self._attr_available = True
-                    self.async_write_ha_state()
-            except:
+                    self._async_write_state_if_changed()
+            except Exception as err:
                 # If API call fails we can assume we can't talk to Zoom
+                self._metrics.poll_failures += 1
                 if self._attr_available:
                     _LOGGER.warning(
                         "Unable to reach Zoom, we may miss status updates until we "
                         "can connect again"
                     )
-                    self._attr_available = False
-                    self.async_write_ha_state()
+                    self._async_set_unreachable()
+                # Let the scheduler tell the other entities if Zoom is down for all
+                if is_unreachable_error(err):
+                    raise
+
+    @callback
+    def _async_set_unreachable(self) -> None:
+        """Mark the entity unavailable until a poll reaches Zoom again."""
+        self._attr_available = False
+        self._async_write_state_if_changed()
 
     async def _restore_state(self) -> None:
         """Restore state from last known state."""
@@ -126,7 +180,12 @@ class ZoomBaseBinarySensor(RestoreEntity, BinarySensorEntity):
 
     async def _async_update_options(self) -> None:
         """Update options if the update signal comes from this entity."""
-        self.async_write_ha_state()
+        self._on_statuses = frozenset(
+            self._config_entry.options[CONF_CONNECTIVITY_ON_STATUSES]
+        )
+        if self._zoom_event_state is not None:
+            self._set_state(self._zoom_event_state)
+        self._async_write_state_if_changed()
 
     async def async_added_to_hass(self) -> None:
         """Register callbacks when entity is added."""
@@ -148,51 +207,71 @@ class ZoomBaseBinarySensor(RestoreEntity, BinarySensorEntity):
 
         # Update state when coordinator updates
         self.async_on_remove(
-            self._coordinator.async_add_listener(self.async_write_ha_state)
+            self._coordinator.async_add_listener(self._async_write_state_if_changed)
         )
 
-        # Manually set an update interval so we can disable it if needed
+        # Poll in a slot of the shared scheduler so the polls of all entities are
+        # spread out instead of firing together
         self.async_on_remove(
-            async_track_time_interval(
-                self._hass, self._async_update, timedelta(seconds=30)
+            self._hass.data[DATA_POLL_SCHEDULER].async_register(
+                self.entity_id, self._async_update, self._async_set_unreachable
             )
         )
 
+        # Start from the last known state and fetch the current status in the
+        # background so platform setup doesn't wait on the Zoom API
+        await self._restore_state()
         if self.id:
-            try:
-                self._profile = await self._api.async_get_contact_user_profile(self.id)
-                status = self._profile["presence_status"]
-                _LOGGER.debug("Retrieved initial Zoom status: %s", status)
-                self._set_state(status)
-                self.async_write_ha_state()
-            except HTTPUnauthorized:
-                _LOGGER.debug(
-                    "User is unauthorized to query presence status, restoring state.",
-                    exc_info=True,
-                )
-                await self._restore_state()
-            except:
-                _LOGGER.warning(
-                    "Error retrieving initial zoom status, restoring state.",
-                    exc_info=True,
-                )
-                await self._restore_state()
+            self._config_entry.async_create_background_task(
+                self.hass,
+                self._async_fetch_initial_status(),
+                f"{DOMAIN} initial status {self.entity_id}",
+            )
         else:
-            _LOGGER.debug("ID is unknown, restoring state.")
-            await self._restore_state()
+            _LOGGER.debug("ID is unknown, keeping restored state.")
+
+    async def _async_fetch_initial_status(self) -> None:
+        """Fetch the current presence status."""
+        try:
+            self._profile = ZoomProfile.from_dict(
+                await self._api.async_get_contact_user_profile(self.id)
+            )
+        except HTTPUnauthorized:
+            _LOGGER.debug(
+                "User is unauthorized to query presence status, keeping restored "
+                "state.",
+                exc_info=True,
+            )
+            return
+        except Exception:
+            _LOGGER.warning(
+                "Error retrieving initial zoom status, keeping restored state.",
+                exc_info=True,
+            )
+            return
+
+        status = self._profile.presence_status
+        _LOGGER.debug("Retrieved initial Zoom status: %s", status)
+        self._set_state(status)
+        self._async_write_state_if_changed()
 
     def _set_state(self, zoom_event_state: str | None) -> None:
         """Set Zoom and HA state."""
         self._zoom_event_state = zoom_event_state
-        self._is_on = (
-            self._zoom_event_state
-            and self._zoom_event_state
-            in self._config_entry.options[CONF_CONNECTIVITY_ON_STATUSES]
-        )
+        self._is_on = zoom_event_state in self._on_statuses
         _LOGGER.debug(
             "Set Zoom state to %s and HA state to %s", zoom_event_state, self._is_on
         )
 
+    @callback
+    def _async_write_state_if_changed(self) -> None:
+        """Write the state unless neither it nor the attributes changed."""
+        state = (self._is_on, self.available, self.extra_state_attributes)
+        if state == self._written_state:
+            return
+        self._written_state = state
+        self.async_write_ha_state()
+
     @property
     def is_on(self) -> bool:
         """Return true if the binary sensor is on."""
@@ -206,38 +285,47 @@ class ZoomBaseBinarySensor(RestoreEntity, BinarySensorEntity):
         return "mdi:video-off"
 
     @property
-    def profile(self) -> dict[str, str]:
+    def profile(self) -> ZoomProfile:
         """Get user profile."""
-        return self._profile or {}
+        return self._profile or _NO_PROFILE
 
     @property
     def first_name(self) -> str | None:
         """Return the first name."""
-        return self.profile.get("first_name")
+        return self.profile.first_name
 
     @property
     def last_name(self) -> str | None:
         """Return the last name."""
-        return self.profile.get("last_name")
+        return self.profile.last_name
 
     @property
     def id(self) -> str | None:
         """Return the id."""
-        return self._config_entry.data.get(CONF_ID) or self.profile.get("id")
+        return self._config_entry.data.get(CONF_ID) or self.profile.id
 
     @property
     def email(self) -> str | None:
         """Return the email."""
-        return self.profile.get("email")
+        return self.profile.email
 
     @property
     def account_id(self) -> str | None:
         """Return the account_id."""
-        return self.profile.get("account_id")
+        return self.profile.account_id
 
     @property
     def extra_state_attributes(self) -> dict[str, Any] | None:
         """Return additional state attributes."""
+        profile = self.profile
+        if (
+            profile is self._attributes_profile
+            and self._zoom_event_state == self._attributes_status
+        ):
+            return self._attributes
+        self._attributes_profile = profile
+        self._attributes_status = self._zoom_event_state
+
         data = {}
 
         for prop in ["id", "first_name", "last_name", "email", "account_id"]:
@@ -248,7 +336,8 @@ class ZoomBaseBinarySensor(RestoreEntity, BinarySensorEntity):
         if self._zoom_event_state:
             data["status"] = self._zoom_event_state
 
-        return data if data else None
+        self._attributes = data if data else None
+        return self._attributes
 
 
 class ZoomAuthenticatedUserBinarySensor(ZoomBaseBinarySensor):
@@ -258,6 +347,11 @@ class ZoomAuthenticatedUserBinarySensor(ZoomBaseBinarySensor):
         """Initialize Zoom user profile binary sensor for authenticated user."""
         super().__init__(hass, config_entry)
         self._attr_name = f"Zoom - {self._name}"
+        self._stats: ZoomPresenceStats = hass.data[DOMAIN][config_entry.entry_id][
+            PRESENCE_STATS
+        ]
+        # Highest event_ts of the presence events applied so far
+        self._last_event_ts: int | None = None
 
     async def async_event_received(self, event: Event) -> None:
         """Update status if event received for this entity."""
@@ -267,8 +361,39 @@ class ZoomAuthenticatedUserBinarySensor(ZoomBaseBinarySensor):
             and status[ATTR_EVENT] == CONNECTIVITY_EVENT
             and get_data_from_path(status, CONNECTIVITY_ID).lower() == self.id.lower()
         ):
+            # Zoom retries and delayed deliveries can arrive after a newer status,
+            # so drop them instead of flipping the sensor back
+            if (event_ts := status.get(ATTR_EVENT_TS)) is not None:
+                if self._last_event_ts is not None and event_ts <= self._last_event_ts:
+                    self._metrics.stale_presence_events += 1
+                    _LOGGER.debug(
+                        "Ignoring presence event from %s, a newer one from %s was "
+                        "already applied",
+                        event_ts,
+                        self._last_event_ts,
+                    )
+                    return
+                self._last_event_ts = event_ts
             self._set_state(get_data_from_path(status, CONNECTIVITY_STATUS))
-            self.async_write_ha_state()
+            self._async_write_state_if_changed()
+
+    def _set_state(self, zoom_event_state: str | None) -> None:
+        """Set Zoom and HA state, and add the change to the presence statistics."""
+        super()._set_state(zoom_event_state)
+        self._stats.async_set_status(zoom_event_state, self._is_on)
+
+    async def _restore_state(self) -> None:
+        """Restore state and the last presence event timestamp."""
+        await super()._restore_state()
+        if extra_data := await self.async_get_last_extra_data():
+            self._last_event_ts = ZoomPresenceExtraStoredData.from_dict(
+                extra_data.as_dict()
+            ).last_event_ts
+
+    @property
+    def extra_restore_state_data(self) -> ZoomPresenceExtraStoredData:
+        """Return extra state data to be stored for restoration."""
+        return ZoomPresenceExtraStoredData(last_event_ts=self._last_event_ts)
 
     async def async_added_to_hass(self) -> None:
         """Register callbacks when entity is added."""
@@ -284,9 +409,9 @@ class ZoomAuthenticatedUserBinarySensor(ZoomBaseBinarySensor):
         return not self.available
 
     @property
-    def profile(self) -> dict[str, str]:
+    def profile(self) -> ZoomProfile:
         """Get user profile."""
-        return self._profile or self._coordinator.data or {}
+        return self._profile or self._coordinator.data or _NO_PROFILE
 
 
 class ZoomContactUserBinarySensor(ZoomBaseBinarySensor):
@@ -2,48 +2,70 @@
 
 from __future__ import annotations
 
-from datetime import timedelta
+from collections import Counter
+from functools import lru_cache
 import hashlib
 import hmac
 from http import HTTPStatus
+import logging
 from logging import getLogger
 import time
 from typing import Any
 
 from aiohttp.web import Request, Response, json_response
-from homeassistant.components.event import DOMAIN as EVT_DOMAIN
+from homeassistant.components.http import MAX_CLIENT_SIZE
 from homeassistant.components.http.view import HomeAssistantView
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers import config_entry_oauth2_flow
 from homeassistant.helpers.dispatcher import async_dispatcher_send
-from homeassistant.helpers.entity_registry import (
-    EntityRegistry,
-    async_entries_for_config_entry,
-    async_get as async_get_entity_registry,
-)
 from homeassistant.helpers.network import NoURLAvailableError, get_url
-from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.util.json import json_loads
 import voluptuous as vol
 
-from .api import ZoomAPI
 from .const import (
     ATTR_EVENT,
+    ATTR_EVENT_TS,
     ATTR_PAYLOAD,
     CONF_SECRET_TOKEN,
     DOMAIN,
+    EVENT_TYPES,
     HA_URL,
     HA_ZOOM_EVENT,
+    METRICS,
     SIGNAL_NEW_ZOOM_EVENT_TYPE,
     VALIDATION_EVENT,
-    WEBHOOK_RESPONSE_SCHEMA,
 )
+from .limiter import FORBIDDEN_SOURCE, ZoomWebhookLimiter
+from .metrics import (
+    STAGE_DISCOVERY,
+    STAGE_FIRE,
+    STAGE_PARSE,
+    STAGE_TOTAL,
+    STAGE_VERIFY,
+    ZoomWebhookMetrics,
+)
+from .models import ZoomProfile
+from .profiling import ZoomProfiler
 
 _LOGGER = getLogger(__name__)
 
 UNKNOWN_EVENT_MSG = "Received data that doesn't look like a Zoom webhook event"
 # Maximum age for webhook timestamps (5 minutes) to prevent replay attacks
 WEBHOOK_TIMESTAMP_MAX_AGE_SECONDS = 300
+# Minimum number of seconds between log messages for the same kind of rejected
+# webhook request
+REJECTION_LOG_INTERVAL = 60
+# Number of bytes of a rejected request body that are logged
+MAX_LOGGED_BODY_LENGTH = 200
+# Largest body of a request with a stale timestamp that is read to find the config
+# entry it was meant for. Bigger stale requests are rejected without being counted.
+MAX_STALE_ATTRIBUTED_SIZE = 16 * 1024
+# Limits on the nesting depth and on the number of keys and list items of a webhook
+# payload, so a single event can't cost the integration unbounded work. A
+# recording.completed event with a thousand recording files stays well within them.
+MAX_PAYLOAD_DEPTH = 32
+MAX_PAYLOAD_KEYS = 20000
 
 
 def valid_external_url(hass: HomeAssistant) -> bool:
@@ -65,17 +87,17 @@ def valid_external_url(hass: HomeAssistant) -> bool:
         return False
 
 
-def get_contact_name(contact: dict) -> str:
+def get_contact_name(contact: ZoomProfile) -> str | None:
     """Determine contact name from available first name, last naame, and email."""
     contact_name = ""
-    if contact["first_name"]:
-        contact_name = f"{contact['first_name']} "
-    if contact["last_name"]:
-        contact_name += f"{contact['last_name']} "
+    if contact.first_name:
+        contact_name = f"{contact.first_name} "
+    if contact.last_name:
+        contact_name += f"{contact.last_name} "
 
     if contact_name:
-        return f"{contact_name}({contact['email']})"
-    return contact["email"]
+        return f"{contact_name}({contact.email})"
+    return contact.email
 
 
 class ZoomOAuth2Implementation(config_entry_oauth2_flow.LocalOAuth2Implementation):
@@ -122,35 +144,150 @@ def _get_hashed_hex_msg(key: str, message: str) -> str:
     return hmac_.hexdigest()
 
 
-def _find_entry_with_signature(
-    hass: HomeAssistant, signature: str, signature_msg: str
-) -> tuple[ConfigEntry | None, str | None]:
-    """Find config entry with signature if it exists."""
-    for entry in hass.config_entries.async_entries(DOMAIN):
-        secret_token = entry.data.get(CONF_SECRET_TOKEN)
-        if secret_token and hmac.compare_digest(
-            f"v0={_get_hashed_hex_msg(str(secret_token), signature_msg)}", signature
-        ):
-            return entry, str(secret_token)
-    return None, None
+@lru_cache(maxsize=32)
+def _get_keyed_hmac(key: str) -> hmac.HMAC:
+    """
+    Return a HMAC keyed with a secret token.
+
+    Keying pads and hashes the key, so requests start from a copy of the cached
+    HMAC instead. The cached HMAC itself must never be updated.
+    """
+    return hmac.new(key.encode(), digestmod=hashlib.sha256)
+
+
+def clear_keyed_hmacs() -> None:
+    """Drop the cached HMACs so secret tokens aren't kept after an entry unloads."""
+    _get_keyed_hmac.cache_clear()
+
+
+class _SignatureCandidates:
+    """
+    Compute the signature of a webhook request for every config entry at once.
+
+    The signed message (v0:{timestamp}:{body}) is fed into one HMAC per config
+    entry with a secret token as the body is read, so the signatures are ready as
+    soon as the body is and the body is never copied to build the message.
+    """
+
+    __slots__ = ("_candidates", "elapsed")
+
+    def __init__(self, hass: HomeAssistant, timestamp: str) -> None:
+        """Initialize."""
+        # Time spent computing and comparing signatures, in seconds
+        self.elapsed = 0.0
+        prefix = f"v0:{timestamp}:".encode()
+        self._candidates: list[tuple[ConfigEntry, str, hmac.HMAC]] = []
+        for entry in hass.config_entries.async_entries(DOMAIN):
+            if secret_token := entry.data.get(CONF_SECRET_TOKEN):
+                secret_token = str(secret_token)
+                hmac_ = _get_keyed_hmac(secret_token).copy()
+                hmac_.update(prefix)
+                self._candidates.append((entry, secret_token, hmac_))
+
+    def update(self, chunk: bytes) -> None:
+        """Feed a chunk of the body to the HMACs."""
+        start = time.perf_counter()
+        for _, _, hmac_ in self._candidates:
+            hmac_.update(chunk)
+        self.elapsed += time.perf_counter() - start
+
+    def find_entry(self, signature: str) -> tuple[ConfigEntry | None, str | None]:
+        """Find the config entry whose secret token matches the signature."""
+        start = time.perf_counter()
+        try:
+            for entry, secret_token, hmac_ in self._candidates:
+                if hmac.compare_digest(f"v0={hmac_.hexdigest()}", signature):
+                    return entry, secret_token
+            return None, None
+        finally:
+            self.elapsed += time.perf_counter() - start
+
+
+def _check_payload_size(payload: dict[str, Any]) -> None:
+    """Raise vol.Invalid if a payload is nested too deep or has too many keys."""
+    # Walk the payload one nesting level at a time so no depth has to be tracked
+    # per container
+    keys = 0
+    level: list[dict[str, Any] | list[Any]] = [payload]
+    for _ in range(MAX_PAYLOAD_DEPTH):
+        children: list[dict[str, Any] | list[Any]] = []
+        append = children.append
+        for container in level:
+            keys += len(container)
+            for value in container.values() if type(container) is dict else container:
+                if type(value) is dict or type(value) is list:
+                    append(value)
+        if keys > MAX_PAYLOAD_KEYS:
+            raise vol.Invalid(f"payload has more than {MAX_PAYLOAD_KEYS} keys")
+        if not (level := children):
+            return
+    raise vol.Invalid(f"payload is nested deeper than {MAX_PAYLOAD_DEPTH}")
+
+
+def validate_webhook_data(data: Any) -> dict[str, Any]:
+    """
+    Validate a decoded webhook request.
+
+    Only the fields the integration relies on are checked, and the request is
+    returned as is unless event or event_ts need to be coerced.
+    """
+    if not isinstance(data, dict):
+        raise vol.Invalid("expected a dictionary")
+    try:
+        event = data[ATTR_EVENT]
+        event_ts = data[ATTR_EVENT_TS]
+        payload = data[ATTR_PAYLOAD]
+    except KeyError as err:
+        raise vol.Invalid(f"required key not provided @ data['{err.args[0]}']") from err
+    if not isinstance(payload, dict):
+        raise vol.Invalid(
+            f"expected a dictionary for dictionary value @ data['{ATTR_PAYLOAD}']"
+        )
+    _check_payload_size(payload)
+
+    if type(event) is not str or type(event_ts) is not int:
+        try:
+            data = {**data, ATTR_EVENT: str(event), ATTR_EVENT_TS: int(event_ts)}
+        except (TypeError, ValueError) as err:
+            raise vol.Invalid(
+                f"expected int for dictionary value @ data['{ATTR_EVENT_TS}']"
+            ) from err
+    return data
 
 
 def _new_event_entity_needed(
-    ent_reg: EntityRegistry, entry: ConfigEntry, event_type: str
+    hass: HomeAssistant, entry: ConfigEntry, event_type: str
 ) -> bool:
     """
     Determine if a new event entity is needed for the given event type.
 
-    If an entity for the event type already exists for the config entry, return False.
-    Otherwise, return True.
+    If an entity for the event type already exists for the config entry, return
+    False. Otherwise, return True, including for event types that are queued for an
+    entity so the entity starts out with the latest event.
     """
-    return not (
-        (existing_entities := async_entries_for_config_entry(ent_reg, entry.entry_id))
-        and any(
-            ent.domain == EVT_DOMAIN and event_type in ent.unique_id
-            for ent in existing_entities
-        )
-    )
+    entry_data = hass.data.get(DOMAIN, {}).get(entry.entry_id, {})
+    if (known_event_types := entry_data.get(EVENT_TYPES)) is None:
+        # The config entry isn't set up (yet), so there is no platform to add the
+        # entity and the event is only fired
+        return False
+    return event_type not in known_event_types
+
+
+class _BodyExcerpt:
+    """Request body that is only decoded and truncated if a message is emitted."""
+
+    __slots__ = ("body",)
+
+    def __init__(self, body: bytes) -> None:
+        """Initialize."""
+        self.body = body
+
+    def __str__(self) -> str:
+        """Return the start of the body."""
+        text = self.body[:MAX_LOGGED_BODY_LENGTH].decode(errors="replace")
+        if len(self.body) <= MAX_LOGGED_BODY_LENGTH:
+            return text
+        return f"{text}... ({len(self.body)} bytes)"
 
 
 class ZoomWebhookRequestView(HomeAssistantView):
@@ -160,26 +297,162 @@ class ZoomWebhookRequestView(HomeAssistantView):
     cors_allowed = True
     url = HA_URL
     name = HA_URL[1:].replace("/", ":")
-    _ent_reg: EntityRegistry | None = None
+
+    def __init__(
+        self,
+        metrics: ZoomWebhookMetrics,
+        profiler: ZoomProfiler,
+        limiter: ZoomWebhookLimiter,
+    ) -> None:
+        """Initialize."""
+        self._metrics = metrics
+        self._profiler = profiler
+        self._limiter = limiter
+        self._rejections_logged_at: dict[str, float] = {}
+        self._rejections_not_logged: Counter[str] = Counter()
+
+    def _respond(
+        self,
+        outcome: str,
+        start: float,
+        size: int,
+        event_type: str | None = None,
+        response: Response | None = None,
+    ) -> Response:
+        """Record the outcome of a request and return the response to send."""
+        duration = time.perf_counter() - start
+        self._metrics.record_request(outcome, duration, event_type, size)
+        if self._profiler.enabled:
+            self._profiler.record(f"webhook.{STAGE_TOTAL}", duration)
+        # Respond with a 200 status code unless told otherwise so we don't leak
+        # information about this endpoint
+        if response is None:
+            response = Response(status=HTTPStatus.OK)
+        return response
+
+    def _observe(self, stage: str, start: float) -> None:
+        """Record how long a stage of handling a request took."""
+        self._observe_duration(stage, time.perf_counter() - start)
+
+    def _observe_duration(self, stage: str, duration: float) -> None:
+        """Record the duration of a stage of handling a request."""
+        self._metrics.stages[stage].observe(duration)
+        if self._profiler.enabled:
+            self._profiler.record(f"webhook.{stage}", duration)
+
+    def _log_rejection(self, outcome: str, level: int, msg: str, *args: Any) -> None:
+        """
+        Log a rejected request.
+
+        The first rejection of each kind is logged, after that at most one every
+        REJECTION_LOG_INTERVAL seconds along with how many weren't logged, so junk
+        traffic can't flood the log.
+        """
+        if not _LOGGER.isEnabledFor(level):
+            return
+        now = time.monotonic()
+        if (
+            last_logged_at := self._rejections_logged_at.get(outcome)
+        ) is not None and now - last_logged_at < REJECTION_LOG_INTERVAL:
+            self._rejections_not_logged[outcome] += 1
+            return
+        self._rejections_logged_at[outcome] = now
+        if not_logged := self._rejections_not_logged.pop(outcome, 0):
+            msg = f"{msg} (%s similar request(s) since the last message)"
+            args = (*args, not_logged)
+        _LOGGER.log(level, msg, *args)
+
+    async def _async_read_body(
+        self,
+        request: Request,
+        candidates: _SignatureCandidates,
+        max_size: int,
+    ) -> bytes | None:
+        """
+        Read the request body, feeding each chunk to the signature HMACs.
+
+        Returns None if the body is larger than max_size.
+        """
+        chunks: list[bytes] = []
+        size = 0
+        async for chunk in request.content.iter_any():
+            if (size := size + len(chunk)) > max_size:
+                return None
+            chunks.append(chunk)
+            candidates.update(chunk)
+        # Joining a single chunk returns it without a copy
+        return b"".join(chunks)
+
+    async def _async_record_stale_timestamp(
+        self, hass: HomeAssistant, request: Request, timestamp: str, signature: str
+    ) -> None:
+        """
+        Count a stale request against the config entry whose secret token signed it.
+
+        Zoom signs the timestamp along with the body, so only stale requests that
+        really came from Zoom are counted. Only requests up to
+        MAX_STALE_ATTRIBUTED_SIZE are read, so replayed junk stays cheap to reject.
+        """
+        if (request.content_length or 0) > MAX_STALE_ATTRIBUTED_SIZE:
+            return
+        candidates = _SignatureCandidates(hass, timestamp)
+        if (
+            await self._async_read_body(request, candidates, MAX_STALE_ATTRIBUTED_SIZE)
+            is None
+        ):
+            return
+        entry, _ = candidates.find_entry(signature)
+        if entry and (
+            metrics := hass.data.get(DOMAIN, {}).get(entry.entry_id, {}).get(METRICS)
+        ):
+            metrics.stale_timestamps += 1
 
     async def post(self, request: Request) -> Response:
         """Respond to requests from the device."""
-        if not self._ent_reg:
-            self._ent_reg = async_get_entity_registry(request.app["hass"])
-
-        text = await request.text()
+        start = time.perf_counter()
         hass: HomeAssistant = request.app["hass"]
         headers = request.headers
-
-        _LOGGER.debug("Webhook request received: %s (Headers: %s)", text, dict(headers))
+        # Rejected requests are sized without reading their body
+        size = request.content_length or 0
+
+        # Shed floods before spending anything on the body
+        if shed_outcome := self._limiter.check(request.remote):
+            self._log_rejection(
+                shed_outcome,
+                logging.WARNING,
+                "Shed Zoom webhook request from %s (%s)",
+                request.remote,
+                shed_outcome,
+            )
+            if shed_outcome == FORBIDDEN_SOURCE:
+                return self._respond(shed_outcome, start, size)
+            # Zoom retries deliveries that fail, so rate limited requests aren't lost
+            # if they were genuine
+            return self._respond(
+                shed_outcome,
+                start,
+                size,
+                response=Response(status=HTTPStatus.TOO_MANY_REQUESTS),
+            )
 
         # If either Zoom header is missing, this is not a valid webhook request
         if not (
             (signature := headers.get("x-zm-signature"))
             and (timestamp := headers.get("x-zm-request-timestamp"))
         ):
-            _LOGGER.info("%s: %s (Headers: %s)", UNKNOWN_EVENT_MSG, text, headers)
-            return Response(status=HTTPStatus.OK)
+            body = await request.read()
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug(
+                    "Webhook request received: %s (Headers: %s)", body, dict(headers)
+                )
+            self._log_rejection(
+                "missing_headers",
+                logging.INFO,
+                "%s: %s",
+                UNKNOWN_EVENT_MSG,
+                _BodyExcerpt(body),
+            )
+            return self._respond("missing_headers", start, len(body))
 
         _LOGGER.debug("Zoom headers present, validating timestamp")
 
@@ -188,81 +461,122 @@ class ZoomWebhookRequestView(HomeAssistantView):
             request_time = int(timestamp)
             current_time = int(time.time())
             if abs(current_time - request_time) > WEBHOOK_TIMESTAMP_MAX_AGE_SECONDS:
-                _LOGGER.warning(
+                self._log_rejection(
+                    "stale_timestamp",
+                    logging.WARNING,
                     "Received Zoom webhook request with stale timestamp "
                     "(request: %s, current: %s, max_age: %s)",
                     request_time,
                     current_time,
                     WEBHOOK_TIMESTAMP_MAX_AGE_SECONDS,
                 )
-                return Response(status=HTTPStatus.OK)
+                await self._async_record_stale_timestamp(
+                    hass, request, timestamp, signature
+                )
+                return self._respond("stale_timestamp", start, size)
         except ValueError:
-            _LOGGER.warning(
-                "Received Zoom webhook request with invalid timestamp: %s", timestamp
+            self._log_rejection(
+                "invalid_timestamp",
+                logging.WARNING,
+                "Received Zoom webhook request with invalid timestamp: %s",
+                timestamp,
             )
-            return Response(status=HTTPStatus.OK)
-
-        _LOGGER.debug("Timestamp valid, parsing JSON payload")
-
-        try:
-            request_dict = await request.json()
-        except Exception as err:
-            _LOGGER.info(
-                "%s: %s (Headers: %s) (Error: %s)",
-                UNKNOWN_EVENT_MSG,
-                text,
-                headers,
-                err,
+            return self._respond("invalid_timestamp", start, size)
+
+        # The signature of every config entry is computed while the body is read
+        candidates = _SignatureCandidates(hass, timestamp)
+        if (
+            body := await self._async_read_body(request, candidates, MAX_CLIENT_SIZE)
+        ) is None:
+            self._log_rejection(
+                "body_too_large",
+                logging.WARNING,
+                "Received Zoom webhook request with a body larger than %s bytes",
+                MAX_CLIENT_SIZE,
             )
-            return Response(status=HTTPStatus.OK)
+            return self._respond("body_too_large", start, size)
+        size = len(body)
 
-        try:
-            data = WEBHOOK_RESPONSE_SCHEMA(request_dict)
-        except vol.Error as err:
-            _LOGGER.info(
-                "%s: %s (Headers: %s) (Error: %s)",
-                UNKNOWN_EVENT_MSG,
-                text,
-                headers,
-                err,
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "Webhook request received: %s (Headers: %s)", body, dict(headers)
             )
-            return Response(status=HTTPStatus.OK)
-
-        event_type = data.get(ATTR_EVENT, "unknown")
-        _LOGGER.debug(
-            "Payload validated (event: %s), verifying signature against config entries",
-            event_type,
-        )
 
-        # Find the first config entry where the secret token can be used to
-        # match the signature header from the webhook validation request
-        entry, secret_token = _find_entry_with_signature(
-            hass, signature, f"v0:{timestamp}:{text}"
-        )
+        # Find the first config entry where the secret token can be used to match
+        # the signature header. This happens before decoding the body, which holds
+        # the GIL for as long as it takes, so that only requests from Zoom can make
+        # the event loop wait on a large body.
+        entry, secret_token = candidates.find_entry(signature)
+        self._observe_duration(STAGE_VERIFY, candidates.elapsed)
 
         # This means that we do not have a config entry with the correct secret token
         if not entry:
             # if we get here, there was no found config entry with a matching secret
             # token and we have to fail the validation request. We still respond with
             # a 200 status code so we don't leak information about this endpoint.
-            num_entries = len(hass.config_entries.async_entries(DOMAIN))
-            _LOGGER.warning(
-                "Received Zoom webhook request (event: %s) that doesn't match any "
-                "of the %s configured secret token(s)",
-                event_type,
-                num_entries,
+            self._log_rejection(
+                "unmatched_signature",
+                logging.WARNING,
+                "Received Zoom webhook request that doesn't match any of the %s "
+                "configured secret token(s)",
+                len(hass.config_entries.async_entries(DOMAIN)),
             )
-            return Response(status=HTTPStatus.OK)
+            return self._respond("unmatched_signature", start, size)
         assert secret_token
 
+        # The allowed networks of the config entry can only be applied now that it
+        # is known which config entry the request is for
+        if not self._limiter.is_allowed(entry.entry_id, request.remote):
+            self._log_rejection(
+                FORBIDDEN_SOURCE,
+                logging.WARNING,
+                "Received Zoom webhook request for %s from %s, which is outside the "
+                "allowed networks",
+                entry.title,
+                request.remote,
+            )
+            return self._respond(FORBIDDEN_SOURCE, start, size)
+
         _LOGGER.debug(
-            "Signature verified for config entry %s (user: %s)",
+            "Signature verified for config entry %s (user: %s), parsing JSON payload",
             entry.entry_id,
             entry.title,
         )
 
+        parse_start = time.perf_counter()
+        try:
+            request_dict = json_loads(body)
+        except ValueError as err:
+            self._log_rejection(
+                "invalid_json",
+                logging.INFO,
+                "%s: %s (Error: %s)",
+                UNKNOWN_EVENT_MSG,
+                _BodyExcerpt(body),
+                err,
+            )
+            return self._respond("invalid_json", start, size)
+
+        try:
+            data = validate_webhook_data(request_dict)
+        except vol.Error as err:
+            self._log_rejection(
+                "invalid_schema",
+                logging.INFO,
+                "%s: %s (Error: %s)",
+                UNKNOWN_EVENT_MSG,
+                _BodyExcerpt(body),
+                err,
+            )
+            return self._respond("invalid_schema", start, size)
+        self._observe(STAGE_PARSE, parse_start)
+
+        event_type = data.get(ATTR_EVENT, "unknown")
+        _LOGGER.debug("Payload validated (event: %s)", event_type)
+
         # If we haven't already registered an entity for this event type, do so now
-        if _new_event_entity_needed(self._ent_reg, entry, event_type):
+        discovery_start = time.perf_counter()
+        if _new_event_entity_needed(hass, entry, event_type):
             _LOGGER.info(
                 "Received new Zoom event type '%s' for config entry %s (user: %s)",
                 event_type,
@@ -275,6 +589,7 @@ class ZoomWebhookRequestView(HomeAssistantView):
                 event_type,
                 data,
             )
+        self._observe(STAGE_DISCOVERY, discovery_start)
 
         # Pass events that are not webhook validation requests on to the integration
         if event_type != VALIDATION_EVENT:
@@ -284,77 +599,39 @@ class ZoomWebhookRequestView(HomeAssistantView):
                 entry.title,
                 data,
             )
+            fire_start = time.perf_counter()
             hass.bus.async_fire(
                 f"{HA_ZOOM_EVENT}", {**data, "ha_config_entry_id": entry.entry_id}
             )
-            return Response(status=HTTPStatus.OK)
+            self._observe(STAGE_FIRE, fire_start)
+            return self._respond("accepted", start, size, event_type)
 
         # Handle webhook validation request
         payload = data.get(ATTR_PAYLOAD) or {}
         plain_token = payload.get("plainToken")
         if not isinstance(plain_token, str) or not plain_token:
-            _LOGGER.warning(
+            self._log_rejection(
+                "invalid_validation_request",
+                logging.WARNING,
                 "Received Zoom webhook validation request with missing or invalid "
-                "plainToken: %s (Headers: %s)",
-                text,
-                headers,
+                "plainToken: %s",
+                _BodyExcerpt(body),
             )
-            return Response(status=HTTPStatus.OK)
+            return self._respond("invalid_validation_request", start, size, event_type)
 
         _LOGGER.debug(
             "Responding to webhook validation request for %s",
             entry.title,
         )
-        return json_response(
-            {
-                "plainToken": plain_token,
-                "encryptedToken": _get_hashed_hex_msg(secret_token, plain_token),
-            }
-        )
-
-
-class ZoomUserProfileDataUpdateCoordinator(DataUpdateCoordinator):
-    """Define an object to hold Zoom user profile data."""
-
-    def __init__(self, hass: HomeAssistant, api: ZoomAPI) -> None:
-        """Initialize."""
-        super().__init__(
-            hass,
-            _LOGGER,
-            name=DOMAIN,
-            update_interval=timedelta(days=1),
-            update_method=self._async_update_data,
-        )
-        self._api = api
-
-    async def _async_update_data(self) -> dict[str, Any]:
-        """Update data via library."""
-        try:
-            return await self._api.async_get_my_user_profile()
-        except Exception as err:
-            raise UpdateFailed(f"Error fetching user profile: {err}") from err
-
-
-class ZoomContactListDataUpdateCoordinator(DataUpdateCoordinator):
-    """Define an object to hold Zoom contact list data."""
-
-    def __init__(
-        self, hass: HomeAssistant, api: ZoomAPI, contact_types: list[str] | None = None
-    ) -> None:
-        """Initialize."""
-        super().__init__(
-            hass,
-            _LOGGER,
-            name=DOMAIN,
-            update_interval=timedelta(hours=1),
-            update_method=self._async_update_data,
+        return self._respond(
+            "validation",
+            start,
+            size,
+            event_type,
+            json_response(
+                {
+                    "plainToken": plain_token,
+                    "encryptedToken": _get_hashed_hex_msg(secret_token, plain_token),
+                }
+            ),
         )
-        self._api = api
-        self._contact_types = contact_types or ["external"]
-
-    async def _async_update_data(self) -> list[dict[str, str]]:
-        """Update data via library."""
-        try:
-            return await self._api.async_get_contacts(self._contact_types)
-        except Exception as err:
-            raise UpdateFailed(f"Error fetching contacts: {err}") from err
@@ -14,14 +14,19 @@ import voluptuous as vol
 from .common import ZoomOAuth2Implementation, valid_external_url
 from .const import (
     ALL_CONNECTIVITY_STATUSES,
+    CONF_ALLOWED_NETWORKS,
     CONF_CONNECTIVITY_ON_STATUSES,
+    CONF_EVENT_TYPES,
     CONF_SECRET_TOKEN,
     CONF_VERIFICATION_TOKEN,
+    CONF_WEBHOOK_RATE_LIMIT,
     DEFAULT_NAME,
     DOMAIN,
     OAUTH2_AUTHORIZE,
     OAUTH2_TOKEN,
+    ZOOM_EVENT_TYPES,
 )
+from .limiter import DEFAULT_SOURCE_RATE, parse_networks
 
 # UI schema requires secret_token (unlike YAML schema which allows verification_token for migration)
 UI_ZOOM_SCHEMA = vol.Schema(
@@ -47,8 +52,20 @@ class ZoomOptionsFlow(config_entries.OptionsFlow):
         self, user_input: dict[str, Any] = None
     ) -> dict[str, Any]:
         """Manage the zoom options."""
+        errors = {}
         if user_input is not None:
-            return self.async_create_entry(title="", data=user_input)
+            try:
+                networks = parse_networks(user_input.get(CONF_ALLOWED_NETWORKS, ""))
+            except ValueError:
+                errors[CONF_ALLOWED_NETWORKS] = "invalid_network"
+            else:
+                return self.async_create_entry(
+                    title="",
+                    data={
+                        **user_input,
+                        CONF_ALLOWED_NETWORKS: [str(network) for network in networks],
+                    },
+                )
 
         return self.async_show_form(
             step_id="init",
@@ -59,9 +76,26 @@ class ZoomOptionsFlow(config_entries.OptionsFlow):
                         default=self.config_entry.options[
                             CONF_CONNECTIVITY_ON_STATUSES
                         ],
-                    ): cv.multi_select(ALL_CONNECTIVITY_STATUSES)
+                    ): cv.multi_select(ALL_CONNECTIVITY_STATUSES),
+                    vol.Optional(
+                        CONF_EVENT_TYPES,
+                        default=self.config_entry.options.get(CONF_EVENT_TYPES, []),
+                    ): cv.multi_select(ZOOM_EVENT_TYPES),
+                    vol.Optional(
+                        CONF_ALLOWED_NETWORKS,
+                        default=", ".join(
+                            self.config_entry.options.get(CONF_ALLOWED_NETWORKS, [])
+                        ),
+                    ): str,
+                    vol.Optional(
+                        CONF_WEBHOOK_RATE_LIMIT,
+                        default=self.config_entry.options.get(
+                            CONF_WEBHOOK_RATE_LIMIT, DEFAULT_SOURCE_RATE
+                        ),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=1, max=1000)),
                 }
             ),
+            errors=errors,
         )
 
 
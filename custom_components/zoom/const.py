@@ -1,17 +1,20 @@
 """Constants for the Zoom integration."""
 
-from homeassistant.const import CONF_CLIENT_ID, CONF_CLIENT_SECRET, CONF_NAME
-import voluptuous as vol
-
 API = "api"
 DOMAIN = "zoom"
 DEFAULT_NAME = "Zoom"
 
 HA_URL = f"/api/{DOMAIN}"
 
+CONF_ALLOWED_NETWORKS = "allowed_networks"
+CONF_CONFIG_ENTRY_ID = "config_entry_id"
 CONF_CONNECTIVITY_ON_STATUSES = "connectivity_on_statuses"
+CONF_EVENT_TYPE = "event_type"
+CONF_EVENT_TYPES = "event_types"
 CONF_VERIFICATION_TOKEN = "verification_token"
 CONF_SECRET_TOKEN = "secret_token"
+CONF_WEBHOOK_RATE_LIMIT = "webhook_rate_limit"
+CONF_PAYLOAD = "payload"
 
 OAUTH2_AUTHORIZE = "https://zoom.us/oauth/authorize"
 OAUTH2_TOKEN = "https://zoom.us/oauth/token"
@@ -22,21 +25,28 @@ USER_PROFILE_COORDINATOR = "user_profile_coordinator"
 CONTACT_LIST_URL = "chat/users/me/contacts"
 CONTACT_LIST_COORDINATOR = "contact_list_coordinator"
 EVENT_MANAGER = "event_manager"
+EVENT_TYPES = "event_types"
+MEETING_TRACKER = "meeting_tracker"
+METRICS = "metrics"
+PRESENCE_STATS = "presence_stats"
+STARTUP_TIMINGS = "startup_timings"
+# hass.data key for the index of attached Zoom automation triggers
+DATA_TRIGGER_INDEX = f"{DOMAIN}_trigger_index"
+# hass.data key for the semaphore shared by the API clients of all config entries
+DATA_API_SEMAPHORE = f"{DOMAIN}_api_semaphore"
+# hass.data key for the webhook view's performance counters
+DATA_WEBHOOK_METRICS = f"{DOMAIN}_webhook_metrics"
+# hass.data key for the opt-in profiler of the webhook and API paths
+DATA_PROFILER = f"{DOMAIN}_profiler"
+# hass.data key for the webhook view's flood protection
+DATA_WEBHOOK_LIMITER = f"{DOMAIN}_webhook_limiter"
+# hass.data key for the scheduler of the presence polls of all config entries
+DATA_POLL_SCHEDULER = f"{DOMAIN}_poll_scheduler"
+# Limit on requests in flight to the Zoom API across all config entries
+MAX_CONCURRENT_API_REQUESTS = 10
 # Dispatcher signal for notifying event platform of new event types
 SIGNAL_NEW_ZOOM_EVENT_TYPE = f"{DOMAIN}_new_event_type"
 
-ZOOM_SCHEMA = vol.Schema(
-    {
-        vol.Optional(CONF_NAME, default=DEFAULT_NAME): vol.Coerce(str),
-        vol.Required(CONF_CLIENT_ID): vol.Coerce(str),
-        vol.Required(CONF_CLIENT_SECRET): vol.Coerce(str),
-        # secret_token is preferred; verification_token is deprecated but supported for migration
-        vol.Optional(CONF_SECRET_TOKEN): vol.Coerce(str),
-        vol.Optional(CONF_VERIFICATION_TOKEN): vol.Coerce(str),
-    },
-    extra=vol.ALLOW_EXTRA,
-)
-
 ATTR_EVENT = "event"
 ATTR_EVENT_TS = "event_ts"
 ATTR_LAST_EVENT_TS = "last_event_ts"
@@ -52,6 +62,11 @@ CONNECTIVITY_ID = [ATTR_PAYLOAD, ATTR_OBJECT, ATTR_ID]
 
 VALIDATION_EVENT = "endpoint.url_validation"
 
+MEETING_STARTED_EVENT = "meeting.started"
+MEETING_ENDED_EVENT = "meeting.ended"
+PARTICIPANT_JOINED_EVENT = "meeting.participant_joined"
+PARTICIPANT_LEFT_EVENT = "meeting.participant_left"
+
 # Zoom presence statuses from user.presence_status_updated webhook event
 # https://developers.zoom.us/docs/api/users/events/#tag/user/postuser.presence_status_updated
 ALL_CONNECTIVITY_STATUSES = [
@@ -67,13 +82,35 @@ ALL_CONNECTIVITY_STATUSES = [
 ]
 DEFAULT_CONNECTIVITY_ON_STATUSES = ["In_Meeting", "Presenting", "On_Phone_Call"]
 
-HA_ZOOM_EVENT = f"{DOMAIN}_webhook"
+# Zoom webhook event types whose event entities can be created ahead of time
+# https://developers.zoom.us/docs/api/rest/reference/zoom-api/events/
+ZOOM_EVENT_TYPES = [
+    "meeting.created",
+    "meeting.updated",
+    "meeting.deleted",
+    "meeting.started",
+    "meeting.ended",
+    "meeting.participant_joined",
+    "meeting.participant_left",
+    "meeting.participant_joined_waiting_room",
+    "meeting.sharing_started",
+    "meeting.sharing_ended",
+    "recording.started",
+    "recording.stopped",
+    "recording.completed",
+    "webinar.started",
+    "webinar.ended",
+    "webinar.participant_joined",
+    "webinar.participant_left",
+    "user.updated",
+    "user.signed_in",
+    "user.signed_out",
+    "phone.callee_ringing",
+    "phone.callee_answered",
+    "phone.callee_ended",
+    "phone.caller_connected",
+    "phone.caller_ended",
+    "chat_message.sent",
+]
 
-WEBHOOK_RESPONSE_SCHEMA = vol.Schema(
-    {
-        vol.Required(ATTR_EVENT): vol.Coerce(str),
-        vol.Required(ATTR_PAYLOAD): dict,
-        vol.Required(ATTR_EVENT_TS): vol.Coerce(int),
-    },
-    extra=vol.ALLOW_EXTRA,
-)
+HA_ZOOM_EVENT = f"{DOMAIN}_webhook"
@@ -0,0 +1,68 @@
+"""Data update coordinators for Zoom."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+from logging import getLogger
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+
+from .api import ZoomAPI
+from .const import DOMAIN
+from .models import ZoomContact, ZoomProfile
+
+_LOGGER = getLogger(__name__)
+
+
+class ZoomUserProfileDataUpdateCoordinator(DataUpdateCoordinator):
+    """Define an object to hold Zoom user profile data."""
+
+    def __init__(self, hass: HomeAssistant, api: ZoomAPI) -> None:
+        """Initialize."""
+        super().__init__(
+            hass,
+            _LOGGER,
+            name=DOMAIN,
+            update_interval=timedelta(days=1),
+            update_method=self._async_update_data,
+        )
+        self._api = api
+
+    async def _async_update_data(self) -> ZoomProfile:
+        """Update data via library."""
+        try:
+            return ZoomProfile.from_dict(await self._api.async_get_my_user_profile())
+        except Exception as err:
+            raise UpdateFailed(f"Error fetching user profile: {err}") from err
+
+
+class ZoomContactListDataUpdateCoordinator(DataUpdateCoordinator):
+    """Define an object to hold Zoom contact list data."""
+
+    def __init__(
+        self, hass: HomeAssistant, api: ZoomAPI, contact_types: list[str] | None = None
+    ) -> None:
+        """Initialize."""
+        super().__init__(
+            hass,
+            _LOGGER,
+            name=DOMAIN,
+            update_interval=timedelta(hours=1),
+            update_method=self._async_update_data,
+        )
+        self._api = api
+        self._contact_types = contact_types or ["external"]
+        # Contacts by ID, rebuilt along with the list
+        self.contacts_by_id: dict[str, ZoomContact] = {}
+
+    async def _async_update_data(self) -> list[ZoomContact]:
+        """Update data via library."""
+        try:
+            contacts = await self._api.async_get_contacts(self._contact_types)
+        except Exception as err:
+            raise UpdateFailed(f"Error fetching contacts: {err}") from err
+        self.contacts_by_id = {
+            contact.id: contact for contact in contacts if contact.id is not None
+        }
+        return contacts
@@ -0,0 +1,71 @@
+"""Diagnostics support for Zoom."""
+
+from __future__ import annotations
+
+from collections import Counter
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_CLIENT_ID, CONF_CLIENT_SECRET, CONF_ID
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.entity_registry import (
+    async_entries_for_config_entry,
+    async_get as async_get_entity_registry,
+)
+
+from .const import (
+    CONF_SECRET_TOKEN,
+    CONF_VERIFICATION_TOKEN,
+    DATA_POLL_SCHEDULER,
+    DATA_PROFILER,
+    DATA_WEBHOOK_LIMITER,
+    DATA_WEBHOOK_METRICS,
+    DOMAIN,
+    EVENT_TYPES,
+    METRICS,
+    STARTUP_TIMINGS,
+)
+from .metrics import ZoomEntryMetrics, ZoomWebhookMetrics
+
+TO_REDACT = {
+    CONF_CLIENT_ID,
+    CONF_CLIENT_SECRET,
+    CONF_ID,
+    CONF_SECRET_TOKEN,
+    CONF_VERIFICATION_TOKEN,
+    "token",
+    "title",
+    "unique_id",
+}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    entry_data = hass.data[DOMAIN][entry.entry_id]
+    metrics: ZoomEntryMetrics = entry_data[METRICS]
+    webhook_metrics: ZoomWebhookMetrics = hass.data[DATA_WEBHOOK_METRICS]
+
+    ent_entries = async_entries_for_config_entry(
+        async_get_entity_registry(hass), entry.entry_id
+    )
+
+    return {
+        "entry": async_redact_data(entry.as_dict(), TO_REDACT),
+        "startup_timings": entry_data.get(STARTUP_TIMINGS),
+        # The webhook view is shared, so its counters cover all config entries
+        "webhook": webhook_metrics.as_dict(),
+        "webhook_limiter": hass.data[DATA_WEBHOOK_LIMITER].as_dict(),
+        "profiling": hass.data[DATA_PROFILER].as_dict(),
+        # Polls of all config entries share one scheduler
+        "poll_scheduler": hass.data[DATA_POLL_SCHEDULER].as_dict(),
+        **metrics.as_dict(),
+        "entities": {
+            "total": len(ent_entries),
+            "disabled": sum(1 for ent in ent_entries if ent.disabled),
+            "by_domain": dict(Counter(ent.domain for ent in ent_entries)),
+            "event_types": len(entry_data[EVENT_TYPES]),
+        },
+    }
@@ -6,16 +6,14 @@ from dataclasses import dataclass
 from logging import getLogger
 from typing import Any
 
-from homeassistant.components.event import DOMAIN as EVENT_DOMAIN, EventEntity
+from homeassistant.components.event import EventEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_NAME, EntityCategory
-from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.core import CALLBACK_TYPE, Event, HassJob, HomeAssistant, callback
 from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.entity_registry import (
-    async_entries_for_config_entry,
-    async_get as async_get_entity_registry,
-)
+from homeassistant.helpers.event import async_call_later
+from homeassistant.helpers.json import json_bytes
 from homeassistant.helpers.restore_state import ExtraStoredData, RestoreEntity
 from homeassistant.util import slugify
 
@@ -24,9 +22,12 @@ from .const import (
     ATTR_EVENT_TS,
     ATTR_LAST_EVENT_TS,
     ATTR_LAST_PAYLOAD,
+    ATTR_OBJECT,
     ATTR_PAYLOAD,
+    CONF_EVENT_TYPES,
     CONNECTIVITY_EVENT,
     DOMAIN,
+    EVENT_TYPES,
     HA_ZOOM_EVENT,
     SIGNAL_NEW_ZOOM_EVENT_TYPE,
     VALIDATION_EVENT,
@@ -35,6 +36,14 @@ from .const import (
 # Event types disabled by default (redundant with other entities or internal)
 _DISABLED_BY_DEFAULT_EVENTS = {VALIDATION_EVENT, CONNECTIVITY_EVENT}
 
+# Newly discovered event types are collected for this many seconds and then added
+# as a single batch of entities
+DISCOVERY_BATCH_WINDOW = 0.5
+
+# Largest serialized payload (in bytes) kept in the restore data. Larger payloads are
+# projected down to the scalar fields of the payload and its `object`.
+MAX_RESTORED_PAYLOAD_SIZE = 4096
+
 _LOGGER = getLogger(__name__)
 
 
@@ -61,6 +70,24 @@ class ZoomEventExtraStoredData(ExtraStoredData):
         )
 
 
+def _scalar_fields(data: dict[str, Any]) -> dict[str, Any]:
+    """Return the fields of a dict that aren't containers."""
+    return {k: v for k, v in data.items() if not isinstance(v, (dict, list))}
+
+
+def compact_payload(payload: dict[str, Any] | None) -> dict[str, Any] | None:
+    """Return a payload that is bounded in size for storing in the restore data."""
+    if payload is None or len(json_bytes(payload)) <= MAX_RESTORED_PAYLOAD_SIZE:
+        return payload
+
+    projected = _scalar_fields(payload)
+    if isinstance(obj := payload.get(ATTR_OBJECT), dict):
+        projected[ATTR_OBJECT] = _scalar_fields(obj)
+    if len(json_bytes(projected)) <= MAX_RESTORED_PAYLOAD_SIZE:
+        return projected
+    return None
+
+
 def get_zoom_dict(data: dict[str, Any]) -> dict[str, Any]:
     """Extract Zoom-specific data from the webhook event data."""
     return {k: v for k, v in data.items() if k in (ATTR_EVENT_TS, ATTR_PAYLOAD)}
@@ -72,20 +99,75 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up Zoom event entities."""
+    # Event types that already have an entity listening for their events. This index
+    # is built from the entity registry during setup and shared with the webhook
+    # view, which keeps sending the events of other types so the latest one is kept.
+    known_event_types: set[str] = hass.data[DOMAIN][config_entry.entry_id][EVENT_TYPES]
+    # Event types waiting to be added in the next batch, with their initial data
+    pending_event_types: dict[str, dict[str, Any] | None] = {}
+    # Entities of past batches that may not be listening for their events yet
+    adding_event_entities: dict[str, ZoomWebhookEventEntity] = {}
+    cancel_flush: CALLBACK_TYPE | None = None
 
     @callback
-    def async_add_event_entity(
-        event_type: str, data: dict[str, Any] | None = None
-    ) -> None:
-        """Add a new event entity when a new event type is discovered."""
-        # Only handle events for this config entry
+    def async_flush_event_entities(_now: Any = None) -> None:
+        """Add all queued event entities in a single batch."""
+        nonlocal cancel_flush
+        cancel_flush = None
+        if not pending_event_types:
+            return
         _LOGGER.info(
-            "Creating event entity for Zoom event type: %s (config entry: %s)",
-            event_type,
+            "Creating event entities for Zoom event types: %s (config entry: %s)",
+            ", ".join(pending_event_types),
             config_entry.entry_id,
         )
-        entity = ZoomWebhookEventEntity(config_entry, event_type, data)
-        async_add_entities([entity])
+        # Forget the entities of past batches that are listening by now
+        for event_type in known_event_types.intersection(adding_event_entities):
+            del adding_event_entities[event_type]
+        entities = []
+        for event_type, data in pending_event_types.items():
+            entity = ZoomWebhookEventEntity(
+                config_entry, event_type, known_event_types, data
+            )
+            adding_event_entities[event_type] = entity
+            entities.append(entity)
+        pending_event_types.clear()
+        async_add_entities(entities)
+
+    flush_job = HassJob(
+        async_flush_event_entities,
+        f"{DOMAIN} event entity discovery",
+        cancel_on_shutdown=True,
+    )
+
+    @callback
+    def async_add_event_entity(
+        event_type: str, data: dict[str, Any] | None = None
+    ) -> None:
+        """Queue a new event entity when a new event type is discovered."""
+        nonlocal cancel_flush
+        # Keep the most recent data for a queued event type so the entity starts
+        # out with the latest event once it is added
+        if event_type in pending_event_types:
+            if data:
+                pending_event_types[event_type] = data
+            return
+        if event_type in known_event_types:
+            return
+        if entity := adding_event_entities.get(event_type):
+            if data:
+                entity.async_set_init_data(data)
+            return
+
+        pending_event_types[event_type] = data
+        if cancel_flush is None:
+            cancel_flush = async_call_later(hass, DISCOVERY_BATCH_WINDOW, flush_job)
+
+    @callback
+    def async_cancel_flush() -> None:
+        """Cancel a scheduled batch when the config entry is unloaded."""
+        if cancel_flush:
+            cancel_flush()
 
     # Listen for dispatcher signal to add new entities
     config_entry.async_on_unload(
@@ -95,28 +177,35 @@ async def async_setup_entry(
             async_add_event_entity,
         )
     )
+    config_entry.async_on_unload(async_cancel_flush)
 
-    # Recreate existing event entities from the registry and add validation entity
-    ent_reg = async_get_entity_registry(hass)
+    async def async_options_updated(
+        hass: HomeAssistant, config_entry: ConfigEntry
+    ) -> None:
+        """Add entities for event types that were added to the options."""
+        for event_type in config_entry.options.get(CONF_EVENT_TYPES, []):
+            async_add_event_entity(event_type)
 
-    # Extract event types from existing entities (format: zoom_{name}|{event_type})
-    existing_event_types = {
-        entity.unique_id.split("|", 1)[1]
-        for entity in async_entries_for_config_entry(ent_reg, config_entry.entry_id)
-        if entity.domain == EVENT_DOMAIN and "|" in entity.unique_id
-    }
+    config_entry.async_on_unload(
+        config_entry.add_update_listener(async_options_updated)
+    )
 
-    # Always include these events:
+    # Recreate existing event entities from the registry index and always include
+    # these events:
     # - VALIDATION_EVENT: sent by Zoom every 72 hours for revalidation
     # - CONNECTIVITY_EVENT: used by the binary sensor for presence tracking
-    existing_event_types.add(VALIDATION_EVENT)
-    existing_event_types.add(CONNECTIVITY_EVENT)
+    known_event_types.add(VALIDATION_EVENT)
+    known_event_types.add(CONNECTIVITY_EVENT)
+
+    # Pre-provision the event types the user expects to receive so the first
+    # webhook of each type doesn't have to wait for entity creation
+    known_event_types.update(config_entry.options.get(CONF_EVENT_TYPES, []))
 
     # Create entities for all event types
     async_add_entities(
         [
-            ZoomWebhookEventEntity(config_entry, event_type)
-            for event_type in existing_event_types
+            ZoomWebhookEventEntity(config_entry, event_type, known_event_types)
+            for event_type in known_event_types
         ]
     )
 
@@ -132,14 +221,18 @@ class ZoomWebhookEventEntity(EventEntity, RestoreEntity):
         self,
         config_entry: ConfigEntry,
         event_type: str,
+        known_event_types: set[str],
         data: dict[str, Any] | None = None,
     ) -> None:
         """Initialize the event entity."""
         self._config_entry = config_entry
         self._event_type = event_type
+        self._known_event_types = known_event_types
         self._init_data: dict[str, Any] | None = data
         self._last_payload: dict[str, Any] | None = None
         self._last_event_ts: int | None = None
+        # Built lazily and only rebuilt after the last event changes
+        self._restore_data: ZoomEventExtraStoredData | None = None
 
         # Disable by default for events that are redundant or internal
         self._attr_entity_registry_enabled_default = (
@@ -176,10 +269,12 @@ class ZoomWebhookEventEntity(EventEntity, RestoreEntity):
     @property
     def extra_restore_state_data(self) -> ZoomEventExtraStoredData:
         """Return extra state data to be stored for restoration."""
-        return ZoomEventExtraStoredData(
-            last_payload=self._last_payload,
-            last_event_ts=self._last_event_ts,
-        )
+        if self._restore_data is None:
+            self._restore_data = ZoomEventExtraStoredData(
+                last_payload=compact_payload(self._last_payload),
+                last_event_ts=self._last_event_ts,
+            )
+        return self._restore_data
 
     @callback
     def _filter_event(self, event_data: dict[str, Any]) -> bool:
@@ -202,26 +297,30 @@ class ZoomWebhookEventEntity(EventEntity, RestoreEntity):
         ):
             self._last_event_ts = state.attributes[ATTR_EVENT_TS]
             self._last_payload = state.attributes[ATTR_PAYLOAD]
+            self._restore_data = None
 
         # Trigger the event (updates entity state timestamp)
         self._trigger_event(self._event_type, get_zoom_dict(data))
         self.async_write_ha_state()
 
+    @callback
+    def async_set_init_data(self, data: dict[str, Any]) -> None:
+        """Replace the initial data with a later event received while being added."""
+        self._init_data = data
+
     async def async_added_to_hass(self) -> None:
         """Register event listener when entity is added."""
         await super().async_added_to_hass()
 
-        # Fire event for initial data if present (only possible when receiving this
-        # event type for the first time)
-        if self._init_data:
-            self._trigger_event(self._event_type, get_zoom_dict(self._init_data))
-            self.async_write_ha_state()
-            self._init_data = None
-        # Restore previous state if available
-        elif extra_data := await self.async_get_last_extra_data():
+        # Restore previous state if available (only when there is no initial data,
+        # which is only possible when receiving this event type for the first time)
+        if not self._init_data and (
+            extra_data := await self.async_get_last_extra_data()
+        ):
             restored = ZoomEventExtraStoredData.from_dict(extra_data.as_dict())
             self._last_payload = restored.last_payload
             self._last_event_ts = restored.last_event_ts
+            self._restore_data = restored
             _LOGGER.debug(
                 "Restored state for %s: event_ts=%s",
                 self.entity_id,
@@ -229,6 +328,13 @@ class ZoomWebhookEventEntity(EventEntity, RestoreEntity):
             )
             self.async_write_ha_state()
 
+        # Fire event for initial data if present, which may have been replaced by a
+        # later event while the state was being restored
+        if self._init_data:
+            self._trigger_event(self._event_type, get_zoom_dict(self._init_data))
+            self.async_write_ha_state()
+            self._init_data = None
+
         self.async_on_remove(
             self.hass.bus.async_listen(
                 HA_ZOOM_EVENT,
@@ -236,3 +342,6 @@ class ZoomWebhookEventEntity(EventEntity, RestoreEntity):
                 self._filter_event,
             )
         )
+        # The webhook view stops sending the events of this type now that they reach
+        # the listener
+        self._known_event_types.add(self._event_type)
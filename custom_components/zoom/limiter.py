@@ -0,0 +1,168 @@
+"""Flood protection for the unauthenticated Zoom webhook endpoint."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from ipaddress import IPv4Network, IPv6Network, ip_address, ip_network
+from time import monotonic
+from typing import Any
+
+# Requests per second accepted from a single client IP unless the options of a
+# config entry raise it. Zoom sends a burst of participant events when a large
+# meeting starts, so each bucket holds BURST_SECONDS worth of requests.
+DEFAULT_SOURCE_RATE = 50
+BURST_SECONDS = 10
+# All client IPs together may send this many times the rate of a single one
+GLOBAL_RATE_FACTOR = 5
+# Number of client IPs whose buckets are kept
+MAX_TRACKED_SOURCES = 1024
+
+# Outcomes of requests that are shed before their body is read
+FORBIDDEN_SOURCE = "forbidden_source"
+SOURCE_RATE_LIMITED = "source_rate_limited"
+GLOBAL_RATE_LIMITED = "global_rate_limited"
+
+
+def parse_networks(value: str | Iterable[str]) -> list[IPv4Network | IPv6Network]:
+    """Parse comma separated CIDR ranges, raising ValueError if one is invalid."""
+    if isinstance(value, str):
+        value = value.split(",")
+    return [
+        ip_network(network, strict=False)
+        for network in (network.strip() for network in value)
+        if network
+    ]
+
+
+class TokenBucket:
+    """Token bucket that refills continuously."""
+
+    __slots__ = ("burst", "rate", "tokens", "updated")
+
+    def __init__(self, rate: float, burst: float, now: float) -> None:
+        """Initialize a full bucket."""
+        self.rate = rate
+        self.burst = burst
+        self.tokens = burst
+        self.updated = now
+
+    def take(self, now: float) -> bool:
+        """Take a token if one is available."""
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        if self.tokens < 1:
+            return False
+        self.tokens -= 1
+        return True
+
+    def is_full(self, now: float) -> bool:
+        """Return whether the bucket has refilled completely."""
+        return self.tokens + (now - self.updated) * self.rate >= self.burst
+
+
+class ZoomWebhookLimiter:
+    """
+    Decide which webhook requests to shed before their body is read.
+
+    Each client IP gets its own bucket so a single flooding source is shed without
+    using up the global bucket that protects the event loop from everyone else.
+    Behind a reverse proxy that Home Assistant trusts, the client IP is the
+    forwarded address of the request.
+
+    Which config entry a request is for is only known once its signature has been
+    verified, so allowed networks only shed a request early when it is outside the
+    networks of every config entry and every config entry has some.
+    """
+
+    def __init__(self) -> None:
+        """Initialize."""
+        # Allowed networks of each config entry, empty if it accepts any network
+        self.allowed_networks: dict[str, list[IPv4Network | IPv6Network]] = {}
+        self.source_rate: float = DEFAULT_SOURCE_RATE
+        self._global = TokenBucket(
+            self.global_rate, self.global_rate * BURST_SECONDS, monotonic()
+        )
+        self._sources: dict[str, TokenBucket] = {}
+
+    @property
+    def global_rate(self) -> float:
+        """Return the requests per second accepted from all client IPs together."""
+        return self.source_rate * GLOBAL_RATE_FACTOR
+
+    def set_source_rate(self, rate: float) -> None:
+        """Change the requests per second accepted from a single client IP."""
+        self.source_rate = rate
+        self._global.rate = self.global_rate
+        self._global.burst = self.global_rate * BURST_SECONDS
+        for bucket in self._sources.values():
+            bucket.rate = rate
+            bucket.burst = rate * BURST_SECONDS
+
+    def check(self, remote: str | None) -> str | None:
+        """Return the outcome to shed a request from remote with, or None to accept."""
+        if (
+            self.allowed_networks
+            and all(self.allowed_networks.values())
+            and not any(
+                self._is_allowed(networks, remote)
+                for networks in self.allowed_networks.values()
+            )
+        ):
+            return FORBIDDEN_SOURCE
+
+        now = monotonic()
+        key = remote or "unknown"
+        if (bucket := self._sources.get(key)) is None:
+            if len(self._sources) >= MAX_TRACKED_SOURCES:
+                self._prune(now)
+            bucket = self._sources[key] = TokenBucket(
+                self.source_rate, self.source_rate * BURST_SECONDS, now
+            )
+        if not bucket.take(now):
+            return SOURCE_RATE_LIMITED
+        if not self._global.take(now):
+            return GLOBAL_RATE_LIMITED
+        return None
+
+    def is_allowed(self, entry_id: str, remote: str | None) -> bool:
+        """Return whether a config entry accepts requests from remote."""
+        if not (networks := self.allowed_networks.get(entry_id)):
+            return True
+        return self._is_allowed(networks, remote)
+
+    @staticmethod
+    def _is_allowed(
+        networks: list[IPv4Network | IPv6Network], remote: str | None
+    ) -> bool:
+        """Return whether remote is in one of the networks."""
+        if remote is None:
+            return False
+        try:
+            address = ip_address(remote)
+        except ValueError:
+            return False
+        return any(address in network for network in networks)
+
+    def _prune(self, now: float) -> None:
+        """Forget sources whose bucket has refilled, or the oldest half if none has."""
+        self._sources = {
+            key: bucket
+            for key, bucket in self._sources.items()
+            if not bucket.is_full(now)
+        }
+        if len(self._sources) >= MAX_TRACKED_SOURCES:
+            keys = list(self._sources)[: MAX_TRACKED_SOURCES // 2]
+            for key in keys:
+                del self._sources[key]
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a dict representation of the limiter."""
+        return {
+            "allowed_networks": {
+                entry_id: [str(network) for network in networks]
+                for entry_id, networks in self.allowed_networks.items()
+            },
+            "source_rate": self.source_rate,
+            "global_rate": self.global_rate,
+            "tracked_sources": len(self._sources),
+        }
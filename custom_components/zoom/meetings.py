@@ -0,0 +1,217 @@
+"""Active meeting tracking for Zoom."""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from logging import getLogger
+from typing import Any
+
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+
+from .const import (
+    ATTR_EVENT,
+    ATTR_ID,
+    ATTR_OBJECT,
+    ATTR_PAYLOAD,
+    DOMAIN,
+    HA_ZOOM_EVENT,
+    MEETING_ENDED_EVENT,
+    MEETING_STARTED_EVENT,
+    PARTICIPANT_JOINED_EVENT,
+    PARTICIPANT_LEFT_EVENT,
+)
+
+_LOGGER = getLogger(__name__)
+
+STORAGE_VERSION = 1
+# Delay before writing the snapshot so bursts of participant events result in one
+# write
+SAVE_DELAY = 10
+# Number of ended meetings remembered so participant events that Zoom delivers after
+# meeting.ended don't bring the meeting back
+RECENTLY_ENDED_KEPT = 100
+
+MEETING_EVENTS = {
+    MEETING_STARTED_EVENT,
+    MEETING_ENDED_EVENT,
+    PARTICIPANT_JOINED_EVENT,
+    PARTICIPANT_LEFT_EVENT,
+}
+
+
+@dataclass
+class ZoomActiveMeeting:
+    """Represents a meeting that is currently in progress."""
+
+    topic: str | None = None
+    start_time: str | None = None
+    participants: set[str] = field(default_factory=set)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a dict representation of the meeting."""
+        return {
+            "topic": self.topic,
+            "start_time": self.start_time,
+            "participants": sorted(self.participants),
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> ZoomActiveMeeting:
+        """Create a meeting from a dict."""
+        return cls(
+            topic=data.get("topic"),
+            start_time=data.get("start_time"),
+            participants=set(data.get("participants", [])),
+        )
+
+
+def get_participant_key(participant: dict[str, Any]) -> str | None:
+    """Return the most specific identifier available for a meeting participant."""
+    for key in ("participant_uuid", "user_id", ATTR_ID, "user_name"):
+        if value := participant.get(key):
+            return str(value)
+    return None
+
+
+class ZoomMeetingTracker:
+    """Track active meetings and their participants from webhook events."""
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        """Initialize."""
+        self._hass = hass
+        self._entry_id = entry_id
+        self._store: Store[dict[str, Any]] = Store(
+            hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}.meetings"
+        )
+        self._listeners: list[CALLBACK_TYPE] = []
+        self._save_pending = False
+        self.meetings: dict[str, ZoomActiveMeeting] = {}
+        # Ended meeting IDs, oldest first
+        self._recently_ended: OrderedDict[str, None] = OrderedDict()
+
+    @property
+    def participant_count(self) -> int:
+        """Return the number of participants across all active meetings."""
+        return sum(len(meeting.participants) for meeting in self.meetings.values())
+
+    async def async_load(self) -> None:
+        """Rebuild the active meetings from the last persisted snapshot."""
+        if not (data := await self._store.async_load()):
+            return
+        self.meetings = {
+            meeting_id: ZoomActiveMeeting.from_dict(meeting)
+            for meeting_id, meeting in data.get("meetings", {}).items()
+        }
+        self._recently_ended = OrderedDict.fromkeys(data.get("recently_ended", []))
+        _LOGGER.debug(
+            "Restored %s active meeting(s) for config entry %s",
+            len(self.meetings),
+            self._entry_id,
+        )
+
+    async def async_unload(self) -> None:
+        """
+        Write a pending snapshot right away.
+
+        Otherwise the delayed write could recreate the snapshot after the config
+        entry has been removed.
+        """
+        if self._save_pending:
+            await self._store.async_save(self._data_to_save())
+
+    async def async_remove(self) -> None:
+        """Remove the persisted snapshot."""
+        await self._store.async_remove()
+
+    @callback
+    def async_start(self) -> CALLBACK_TYPE:
+        """Start tracking meetings from webhook events."""
+        return self._hass.bus.async_listen(
+            HA_ZOOM_EVENT, self._async_handle_event, self._filter_event
+        )
+
+    @callback
+    def async_add_listener(self, update_callback: CALLBACK_TYPE) -> Callable[[], None]:
+        """Listen for changes to the active meetings."""
+        self._listeners.append(update_callback)
+
+        @callback
+        def remove_listener() -> None:
+            """Remove update listener."""
+            self._listeners.remove(update_callback)
+
+        return remove_listener
+
+    @callback
+    def _filter_event(self, event_data: dict[str, Any]) -> bool:
+        """Filter webhook events down to meeting events for this config entry."""
+        return (
+            event_data.get("ha_config_entry_id") == self._entry_id
+            and event_data.get(ATTR_EVENT) in MEETING_EVENTS
+        )
+
+    @callback
+    def _async_handle_event(self, event: Event) -> None:
+        """Apply a meeting event to the active meetings."""
+        event_type = event.data[ATTR_EVENT]
+        obj = event.data.get(ATTR_PAYLOAD, {}).get(ATTR_OBJECT) or {}
+        if (meeting_id := obj.get(ATTR_ID)) is None:
+            return
+        meeting_id = str(meeting_id)
+
+        if event_type == MEETING_ENDED_EVENT:
+            self._recently_ended[meeting_id] = None
+            self._recently_ended.move_to_end(meeting_id)
+            if len(self._recently_ended) > RECENTLY_ENDED_KEPT:
+                self._recently_ended.popitem(last=False)
+            if self.meetings.pop(meeting_id, None) is None:
+                # Only the ended meetings changed, which listeners don't show
+                self._async_schedule_save()
+                return
+        else:
+            if (meeting := self.meetings.get(meeting_id)) is None:
+                # Zoom doesn't deliver events in order, so only a start or a join
+                # adds a meeting, and only a start adds a meeting that just ended.
+                # Meetings that started before we were listening are added when
+                # someone joins them.
+                if event_type == MEETING_STARTED_EVENT:
+                    self._recently_ended.pop(meeting_id, None)
+                elif (
+                    event_type != PARTICIPANT_JOINED_EVENT
+                    or meeting_id in self._recently_ended
+                ):
+                    return
+                meeting = self.meetings[meeting_id] = ZoomActiveMeeting()
+            meeting.topic = obj.get("topic", meeting.topic)
+            meeting.start_time = obj.get("start_time", meeting.start_time)
+
+            participant_key = get_participant_key(obj.get("participant") or {})
+            if participant_key and event_type == PARTICIPANT_JOINED_EVENT:
+                meeting.participants.add(participant_key)
+            elif participant_key and event_type == PARTICIPANT_LEFT_EVENT:
+                meeting.participants.discard(participant_key)
+
+        self._async_schedule_save()
+        for update_callback in self._listeners:
+            update_callback()
+
+    @callback
+    def _async_schedule_save(self) -> None:
+        """Schedule a write of the snapshot."""
+        self._save_pending = True
+        self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+
+    @callback
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return the snapshot of active and recently ended meetings to persist."""
+        self._save_pending = False
+        return {
+            "meetings": {
+                meeting_id: meeting.as_dict()
+                for meeting_id, meeting in self.meetings.items()
+            },
+            "recently_ended": list(self._recently_ended),
+        }
@@ -0,0 +1,229 @@
+"""Performance counters for Zoom."""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+from collections import Counter, defaultdict, deque
+import time
+from typing import Any
+
+from homeassistant.util import dt as dt_util
+
+# Upper bounds (in milliseconds) of the latency histogram buckets
+LATENCY_BUCKETS_MS = (1, 5, 10, 50, 100, 500, 1000, 5000)
+
+# Stages of handling a webhook request that are timed
+STAGE_PARSE = "parse"
+STAGE_VERIFY = "verify"
+STAGE_DISCOVERY = "discovery"
+STAGE_FIRE = "fire"
+STAGE_TOTAL = "total"
+WEBHOOK_STAGES = (STAGE_PARSE, STAGE_VERIFY, STAGE_DISCOVERY, STAGE_FIRE, STAGE_TOTAL)
+
+# Number of webhook request summaries kept for diagnostics
+RECENT_REQUESTS = 50
+
+# Upper bounds (in milliseconds) of the webhook delivery lag histogram buckets
+DELIVERY_LAG_BUCKETS_MS = (100, 250, 500, 1000, 2500, 5000, 10000, 30000, 60000)
+# Number of the most recent webhook events the delivery lag is computed over
+DELIVERY_LAG_WINDOW = 200
+
+
+def _round(ms: float | None) -> float | None:
+    """Round a latency for display."""
+    return None if ms is None else round(ms, 1)
+
+
+class LatencyHistogram:
+    """Histogram of latencies with fixed buckets."""
+
+    __slots__ = ("buckets", "count", "max", "total")
+
+    def __init__(self) -> None:
+        """Initialize."""
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.buckets = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+
+    def observe(self, seconds: float) -> None:
+        """Record a latency."""
+        ms = seconds * 1000
+        self.count += 1
+        self.total += ms
+        if ms > self.max:
+            self.max = ms
+        self.buckets[bisect_left(LATENCY_BUCKETS_MS, ms)] += 1
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a dict representation of the histogram."""
+        buckets = {
+            f"<={bound}ms": count
+            for bound, count in zip(LATENCY_BUCKETS_MS, self.buckets[:-1], strict=True)
+        }
+        buckets[f">{LATENCY_BUCKETS_MS[-1]}ms"] = self.buckets[-1]
+        return {
+            "count": self.count,
+            "mean_ms": round(self.total / self.count, 3) if self.count else None,
+            "max_ms": round(self.max, 3),
+            "buckets": buckets,
+        }
+
+
+class SlidingLatencyHistogram:
+    """
+    Histogram of the latencies of the last `window` observations.
+
+    Bucket counts are updated as observations enter and leave the window, and a
+    monotonic queue tracks the maximum, so observing is O(1) amortized and
+    percentiles don't need the samples to be sorted.
+    """
+
+    __slots__ = ("_max_queue", "_samples", "buckets", "count")
+
+    def __init__(self, window: int = DELIVERY_LAG_WINDOW) -> None:
+        """Initialize."""
+        self.count = 0
+        self.buckets = [0] * (len(DELIVERY_LAG_BUCKETS_MS) + 1)
+        # (sequence number, latency in ms, bucket index) of the observations
+        self._samples: deque[tuple[int, float, int]] = deque(maxlen=window)
+        # Observations that can still become the maximum, in decreasing order
+        self._max_queue: deque[tuple[int, float]] = deque()
+
+    def observe(self, ms: float) -> None:
+        """Record a latency in milliseconds."""
+        samples = self._samples
+        if len(samples) == samples.maxlen:
+            self.buckets[samples[0][2]] -= 1
+        bucket = bisect_left(DELIVERY_LAG_BUCKETS_MS, ms)
+        samples.append((self.count, ms, bucket))
+        self.buckets[bucket] += 1
+
+        max_queue = self._max_queue
+        while max_queue and max_queue[-1][1] <= ms:
+            max_queue.pop()
+        max_queue.append((self.count, ms))
+        if max_queue[0][0] < samples[0][0]:
+            max_queue.popleft()
+        self.count += 1
+
+    @property
+    def samples(self) -> int:
+        """Return the number of observations in the window."""
+        return len(self._samples)
+
+    @property
+    def max(self) -> float | None:
+        """Return the maximum latency in the window."""
+        return self._max_queue[0][1] if self._max_queue else None
+
+    def percentile(self, percent: float) -> float | None:
+        """Return the upper bound of the bucket holding a percentile of the window."""
+        if not (samples := len(self._samples)):
+            return None
+        rank = samples * percent / 100
+        seen = 0
+        for bound, count in zip(
+            DELIVERY_LAG_BUCKETS_MS, self.buckets[:-1], strict=True
+        ):
+            seen += count
+            if seen >= rank:
+                # The maximum is a tighter bound when it falls in this bucket
+                return min(bound, self._max_queue[0][1])
+        return self._max_queue[0][1]
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a dict representation of the histogram."""
+        return {
+            "samples": self.samples,
+            "p50_ms": _round(self.percentile(50)),
+            "p95_ms": _round(self.percentile(95)),
+            "max_ms": _round(self.max),
+        }
+
+
+class ApiCallStats:
+    """Counters for calls to a Zoom API endpoint."""
+
+    __slots__ = ("calls", "errors", "latency")
+
+    def __init__(self) -> None:
+        """Initialize."""
+        self.calls = 0
+        self.errors = 0
+        self.latency = LatencyHistogram()
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a dict representation of the counters."""
+        return {
+            "calls": self.calls,
+            "errors": self.errors,
+            "error_rate": round(self.errors / self.calls, 3) if self.calls else None,
+            "latency": self.latency.as_dict(),
+        }
+
+
+class ZoomWebhookMetrics:
+    """Counters for the webhook view, shared by all config entries."""
+
+    def __init__(self) -> None:
+        """Initialize."""
+        self.outcomes: Counter[str] = Counter()
+        self.stages = {stage: LatencyHistogram() for stage in WEBHOOK_STAGES}
+        # (received at, outcome, event type, body size, duration) of the last requests
+        self.recent: deque[tuple[float, str, str | None, int, float]] = deque(
+            maxlen=RECENT_REQUESTS
+        )
+
+    def record_request(
+        self, outcome: str, duration: float, event_type: str | None, size: int
+    ) -> None:
+        """Record the outcome of a webhook request."""
+        self.outcomes[outcome] += 1
+        self.stages[STAGE_TOTAL].observe(duration)
+        self.recent.append((time.time(), outcome, event_type, size, duration))
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a dict representation of the counters."""
+        return {
+            "requests": dict(self.outcomes),
+            "stages": {
+                stage: histogram.as_dict() for stage, histogram in self.stages.items()
+            },
+            "recent_requests": [
+                {
+                    "received_at": dt_util.utc_from_timestamp(received_at).isoformat(),
+                    "outcome": outcome,
+                    "event": event_type,
+                    "bytes": size,
+                    "duration_ms": round(duration * 1000, 3),
+                }
+                for received_at, outcome, event_type, size, duration in self.recent
+            ],
+        }
+
+
+class ZoomEntryMetrics:
+    """Counters for a single config entry."""
+
+    def __init__(self) -> None:
+        """Initialize."""
+        self.api: defaultdict[str, ApiCallStats] = defaultdict(ApiCallStats)
+        self.polls = 0
+        self.poll_failures = 0
+        # Presence events dropped because a newer one was already applied
+        self.stale_presence_events = 0
+        # Webhook requests signed with this config entry's secret token that were
+        # rejected for a stale timestamp
+        self.stale_timestamps = 0
+        self.delivery_lag = SlidingLatencyHistogram()
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a dict representation of the counters."""
+        return {
+            "api": {name: stats.as_dict() for name, stats in self.api.items()},
+            "polls": {"count": self.polls, "failures": self.poll_failures},
+            "stale_presence_events": self.stale_presence_events,
+            "stale_timestamps": self.stale_timestamps,
+            "delivery_lag": self.delivery_lag.as_dict(),
+        }
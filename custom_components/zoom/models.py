@@ -0,0 +1,56 @@
+"""Records parsed from Zoom API responses."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from sys import intern
+from typing import Any
+
+
+def _intern(value: Any) -> str | None:
+    """Intern a string that many records share, like a presence status."""
+    return intern(value) if isinstance(value, str) else None
+
+
+@dataclass(frozen=True, slots=True)
+class ZoomProfile:
+    """The fields of a Zoom user profile that the integration uses."""
+
+    id: str | None = None
+    first_name: str | None = None
+    last_name: str | None = None
+    email: str | None = None
+    account_id: str | None = None
+    presence_status: str | None = None
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> ZoomProfile:
+        """Create a profile from an API response."""
+        return cls(
+            id=data.get("id"),
+            first_name=data.get("first_name"),
+            last_name=data.get("last_name"),
+            email=data.get("email"),
+            account_id=data.get("account_id"),
+            presence_status=_intern(data.get("presence_status")),
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class ZoomContact(ZoomProfile):
+    """A contact of the authenticated user."""
+
+    contact_type: str | None = None
+
+    @classmethod
+    def from_contact_dict(cls, data: dict[str, Any], contact_type: str) -> ZoomContact:
+        """Create a contact from an item of the contact list API response."""
+        return cls(
+            id=data.get("id"),
+            first_name=data.get("first_name"),
+            last_name=data.get("last_name"),
+            email=data.get("email"),
+            account_id=data.get("account_id"),
+            presence_status=_intern(data.get("presence_status")),
+            contact_type=intern(contact_type),
+        )
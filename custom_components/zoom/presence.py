@@ -0,0 +1,202 @@
+"""Presence statistics for Zoom."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from logging import getLogger
+from typing import Any
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+import homeassistant.util.dt as dt_util
+
+from .const import DOMAIN
+
+_LOGGER = getLogger(__name__)
+
+STORAGE_VERSION = 1
+# Delay before writing the statistics so bursts of presence events result in one
+# write
+SAVE_DELAY = 10
+# Number of days, including today, that make up the rolling week
+DAYS_KEPT = 7
+
+
+@dataclass
+class ZoomPresenceDay:
+    """Time spent in each presence status during a day."""
+
+    statuses: dict[str, float] = field(default_factory=dict)
+    # Seconds spent in a status that turns the presence binary sensor on
+    on_seconds: float = 0
+    # Number of times the presence binary sensor turned on
+    meetings: int = 0
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a dict representation of the day."""
+        return {
+            "statuses": self.statuses,
+            "on_seconds": self.on_seconds,
+            "meetings": self.meetings,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> ZoomPresenceDay:
+        """Create a day from a dict."""
+        return cls(
+            statuses=dict(data.get("statuses", {})),
+            on_seconds=data.get("on_seconds", 0),
+            meetings=data.get("meetings", 0),
+        )
+
+
+def _local_date(timestamp: float) -> date:
+    """Return the local date of a timestamp."""
+    return dt_util.as_local(dt_util.utc_from_timestamp(timestamp)).date()
+
+
+class ZoomPresenceStats:
+    """
+    Keep running totals of the time spent in each presence status.
+
+    Each status change only adds the time since the previous change to the day it
+    was spent in, so the totals never have to be computed from the recorder.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        """Initialize."""
+        self._hass = hass
+        self._entry_id = entry_id
+        self._store: Store[dict[str, Any]] = Store(
+            hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}.presence"
+        )
+        self._listeners: list[CALLBACK_TYPE] = []
+        self._save_pending = False
+        self.status: str | None = None
+        self.is_on = False
+        # When the time spent in the current status was last added to the totals
+        self._since: float | None = None
+        self.days: dict[date, ZoomPresenceDay] = {}
+
+    async def async_load(self) -> None:
+        """Restore the totals from the last persisted snapshot."""
+        if not (data := await self._store.async_load()):
+            return
+        self.days = {
+            date.fromisoformat(day): ZoomPresenceDay.from_dict(totals)
+            for day, totals in data.get("days", {}).items()
+        }
+        # Whatever happened while Home Assistant wasn't running is unknown, so time
+        # is only counted again once the status has been fetched. A meeting that is
+        # still going on then isn't counted twice.
+        self.is_on = data.get("is_on", False)
+        _LOGGER.debug(
+            "Restored presence statistics of %s day(s) for config entry %s",
+            len(self.days),
+            self._entry_id,
+        )
+
+    async def async_unload(self) -> None:
+        """
+        Write a pending snapshot right away.
+
+        Otherwise the delayed write could recreate the snapshot after the config
+        entry has been removed.
+        """
+        if self._save_pending:
+            await self._store.async_save(self._data_to_save())
+
+    async def async_remove(self) -> None:
+        """Remove the persisted snapshot."""
+        await self._store.async_remove()
+
+    @callback
+    def async_add_listener(self, update_callback: CALLBACK_TYPE) -> Callable[[], None]:
+        """Listen for presence status changes."""
+        self._listeners.append(update_callback)
+
+        @callback
+        def remove_listener() -> None:
+            """Remove update listener."""
+            self._listeners.remove(update_callback)
+
+        return remove_listener
+
+    @callback
+    def async_set_status(self, status: str | None, is_on: bool) -> None:
+        """Record a presence status change."""
+        if status == self.status and is_on == self.is_on:
+            return
+        now = dt_util.utcnow().timestamp()
+        self._accumulate(now)
+        if is_on and not self.is_on:
+            self._day(_local_date(now)).meetings += 1
+        self.status = status
+        self.is_on = is_on
+        self._since = now
+
+        self._save_pending = True
+        self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+        for update_callback in self._listeners:
+            update_callback()
+
+    @callback
+    def async_totals(self, days: int) -> ZoomPresenceDay:
+        """Return the totals of the last days, including the current status."""
+        now = dt_util.utcnow().timestamp()
+        self._accumulate(now)
+        first_day = _local_date(now) - timedelta(days=days - 1)
+        totals = ZoomPresenceDay()
+        for day, day_totals in self.days.items():
+            if day < first_day:
+                continue
+            for status, seconds in day_totals.statuses.items():
+                totals.statuses[status] = totals.statuses.get(status, 0) + seconds
+            totals.on_seconds += day_totals.on_seconds
+            totals.meetings += day_totals.meetings
+        return totals
+
+    def _day(self, day: date) -> ZoomPresenceDay:
+        """Return the totals of a day, forgetting days that left the rolling week."""
+        if (totals := self.days.get(day)) is None:
+            totals = self.days[day] = ZoomPresenceDay()
+            first_day = day - timedelta(days=DAYS_KEPT - 1)
+            for old_day in [old_day for old_day in self.days if old_day < first_day]:
+                del self.days[old_day]
+        return totals
+
+    def _accumulate(self, now: float) -> None:
+        """Add the time spent in the current status until now to the totals."""
+        if self._since is None:
+            return
+        start = self._since
+        self._since = now
+        if self.status is None:
+            return
+        # Split the time at local midnights so it is added to the right days
+        while start < now:
+            day = _local_date(start)
+            end = min(
+                now, dt_util.start_of_local_day(day + timedelta(days=1)).timestamp()
+            )
+            totals = self._day(day)
+            totals.statuses[self.status] = (
+                totals.statuses.get(self.status, 0) + end - start
+            )
+            if self.is_on:
+                totals.on_seconds += end - start
+            start = end
+
+    @callback
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return the snapshot of the totals to persist."""
+        self._save_pending = False
+        self._accumulate(dt_util.utcnow().timestamp())
+        return {
+            "is_on": self.is_on,
+            "days": {
+                day.isoformat(): totals.as_dict() for day, totals in self.days.items()
+            },
+        }
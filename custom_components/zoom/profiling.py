@@ -0,0 +1,195 @@
+"""Opt-in profiling of the Zoom webhook and API paths."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+from logging import getLogger
+import time
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.components import persistent_notification
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP
+from homeassistant.core import (
+    CALLBACK_TYPE,
+    Event,
+    HassJob,
+    HomeAssistant,
+    ServiceCall,
+    callback,
+)
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.event import async_call_later
+from homeassistant.helpers.service import async_register_admin_service
+import voluptuous as vol
+
+from .const import DATA_PROFILER, DOMAIN
+from .metrics import LatencyHistogram
+
+if TYPE_CHECKING:
+    from cProfile import Profile
+
+_LOGGER = getLogger(__name__)
+
+CONF_CPROFILE = "cprofile"
+CONF_DURATION = "duration"
+
+SERVICE_START_PROFILING = "start_profiling"
+SERVICE_STOP_PROFILING = "stop_profiling"
+
+START_PROFILING_SCHEMA = vol.Schema(
+    {
+        vol.Optional(CONF_DURATION): vol.All(
+            cv.time_period, cv.positive_timedelta, vol.Range(max=timedelta(hours=1))
+        ),
+        vol.Optional(CONF_CPROFILE, default=False): cv.boolean,
+    }
+)
+
+
+class ZoomProfiler:
+    """
+    Collect timing spans while profiling is enabled.
+
+    Callers check `enabled` before recording anything, so the hooks cost a single
+    attribute lookup while profiling is off. Spans are named after what they time:
+    webhook.total (the whole request), webhook.parse, webhook.verify (finding the
+    config entry with a matching signature), webhook.discovery (checking whether
+    an event entity is needed), webhook.fire and api.<endpoint>.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize."""
+        self._hass = hass
+        self.enabled = False
+        self.spans: dict[str, LatencyHistogram] = {}
+        self.last_report: dict[str, Any] | None = None
+        self._started_at: float | None = None
+        self._cprofile: Profile | None = None
+        self._cancel_stop: CALLBACK_TYPE | None = None
+        self._stop_job = HassJob(
+            self._async_stop_later, f"{DOMAIN} stop profiling", cancel_on_shutdown=True
+        )
+
+    def record(self, name: str, duration: float) -> None:
+        """Record a span."""
+        if (histogram := self.spans.get(name)) is None:
+            histogram = self.spans[name] = LatencyHistogram()
+        histogram.observe(duration)
+
+    @callback
+    def async_start(
+        self, duration: timedelta | None = None, cprofile: bool = False
+    ) -> None:
+        """Start profiling, optionally stopping automatically after duration."""
+        if self.enabled:
+            raise ServiceValidationError("Zoom profiling is already running")
+        self.spans = {}
+        self._started_at = time.time()
+        if cprofile:
+            # Only imported when asked for so it never weighs on normal operation
+            from cProfile import Profile
+
+            self._cprofile = Profile()
+            self._cprofile.enable()
+        if duration:
+            self._cancel_stop = async_call_later(self._hass, duration, self._stop_job)
+        self.enabled = True
+        _LOGGER.info("Started Zoom profiling")
+
+    async def async_stop(self) -> dict[str, Any]:
+        """Stop profiling and report the collected spans."""
+        if not self.enabled:
+            raise ServiceValidationError("Zoom profiling isn't running")
+        self.enabled = False
+        if self._cancel_stop:
+            self._cancel_stop()
+            self._cancel_stop = None
+
+        assert self._started_at is not None
+        report: dict[str, Any] = {
+            "started_at": self._started_at,
+            "duration": round(time.time() - self._started_at, 3),
+            "spans": {
+                name: histogram.as_dict() for name, histogram in self.spans.items()
+            },
+            "stats_file": None,
+        }
+        if cprofile := self._cprofile:
+            self._cprofile = None
+            cprofile.disable()
+            stats_file = self._hass.config.path(
+                f"{DOMAIN}_profile.{int(self._started_at)}.cprof"
+            )
+            await self._hass.async_add_executor_job(cprofile.dump_stats, stats_file)
+            report["stats_file"] = stats_file
+
+        self.last_report = report
+        persistent_notification.async_create(
+            self._hass,
+            _format_report(report),
+            title="Zoom profiling",
+            notification_id=f"{DOMAIN}_profiling",
+        )
+        _LOGGER.info("Stopped Zoom profiling: %s", report)
+        return report
+
+    async def _async_stop_later(self, _now: Any) -> None:
+        """Stop profiling when the requested duration is over."""
+        self._cancel_stop = None
+        if self.enabled:
+            await self.async_stop()
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a dict representation of the profiler."""
+        return {"enabled": self.enabled, "last_report": self.last_report}
+
+
+def _format_report(report: dict[str, Any]) -> str:
+    """Format a profiling report as markdown."""
+    lines = [
+        f"Collected for {report['duration']} seconds.",
+        "",
+        "| Span | Count | Mean (ms) | Max (ms) |",
+        "|-|-|-|-|",
+    ]
+    lines.extend(
+        f"| {name} | {span['count']} | {span['mean_ms']} | {span['max_ms']} |"
+        for name, span in sorted(report["spans"].items())
+    )
+    if report["stats_file"]:
+        lines.extend(["", f"cProfile stats were written to `{report['stats_file']}`."])
+    return "\n".join(lines)
+
+
+@callback
+def async_setup_profiling(hass: HomeAssistant) -> ZoomProfiler:
+    """Create the profiler and register the services that control it."""
+    profiler = hass.data[DATA_PROFILER] = ZoomProfiler(hass)
+
+    async def async_start_profiling(call: ServiceCall) -> None:
+        """Start profiling."""
+        profiler.async_start(call.data.get(CONF_DURATION), call.data[CONF_CPROFILE])
+
+    async def async_stop_profiling(call: ServiceCall) -> None:
+        """Stop profiling."""
+        await profiler.async_stop()
+
+    async_register_admin_service(
+        hass,
+        DOMAIN,
+        SERVICE_START_PROFILING,
+        async_start_profiling,
+        START_PROFILING_SCHEMA,
+    )
+    async_register_admin_service(
+        hass, DOMAIN, SERVICE_STOP_PROFILING, async_stop_profiling
+    )
+
+    async def async_stop_on_shutdown(_event: Event) -> None:
+        """Stop profiling so cProfile is disabled and its stats are written."""
+        if profiler.enabled:
+            await profiler.async_stop()
+
+    hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, async_stop_on_shutdown)
+    return profiler
@@ -0,0 +1,208 @@
+"""Staggered presence polling for Zoom."""
+
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from collections.abc import Callable, Coroutine
+from datetime import timedelta
+from logging import getLogger
+from random import uniform
+from typing import Any
+
+from aiohttp import ClientConnectionError, ClientResponseError
+from homeassistant.core import CALLBACK_TYPE, HassJob, HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+
+from .const import DOMAIN
+from .metrics import LatencyHistogram
+
+_LOGGER = getLogger(__name__)
+
+# Every registered poller is polled once per interval
+POLL_INTERVAL = timedelta(seconds=30)
+# Fraction of the time between two polls that each poll is moved by at random
+POLL_JITTER = 0.1
+# Polls in flight at once, leaving the rest of the shared API request limit to
+# everything else
+MAX_CONCURRENT_POLLS = 5
+
+
+def is_unreachable_error(err: BaseException) -> bool:
+    """Return whether an error means Zoom can't be reached at all."""
+    if isinstance(err, ClientResponseError):
+        return err.status >= 500
+    return isinstance(err, (ClientConnectionError, TimeoutError))
+
+
+class _Poller:
+    """A registered poll function."""
+
+    __slots__ = ("name", "poll", "task", "unreachable")
+
+    def __init__(
+        self,
+        name: str,
+        poll: Callable[[], Coroutine[Any, Any, None]],
+        unreachable: CALLBACK_TYPE | None,
+    ) -> None:
+        """Initialize."""
+        self.name = name
+        self.poll = poll
+        self.unreachable = unreachable
+        self.task: asyncio.Task[None] | None = None
+
+
+class ZoomPollScheduler:
+    """
+    Spread the presence polls of all config entries evenly over the poll interval.
+
+    A single timer polls the registered pollers round robin, one every
+    interval / pollers seconds, instead of every binary sensor polling on its own
+    timer and all of them firing together.
+
+    A poll that raises an error meaning Zoom can't be reached starts an outage:
+    every poller is told Zoom is unreachable, and only one poll per interval
+    probes whether it is back. Once a probe succeeds, all other pollers are polled
+    right away in a single reconciliation pass.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize."""
+        self._hass = hass
+        self._pollers: deque[_Poller] = deque()
+        self._semaphore = asyncio.Semaphore(MAX_CONCURRENT_POLLS)
+        self._cancel_next: CALLBACK_TYPE | None = None
+        self._next_due: float | None = None
+        self._poll_job = HassJob(
+            self._async_poll_next, f"{DOMAIN} poll", cancel_on_shutdown=True
+        )
+        self.outage = False
+        self.outages = 0
+        self.polls = 0
+        # Polls skipped because the previous poll of the same poller hadn't finished
+        self.skipped = 0
+        # How late polls started compared to their slot, and how long they took
+        self.lateness = LatencyHistogram()
+        self.durations = LatencyHistogram()
+
+    @property
+    def spacing(self) -> float:
+        """Return the number of seconds between two polls."""
+        if self.outage:
+            return POLL_INTERVAL.total_seconds()
+        return POLL_INTERVAL.total_seconds() / max(len(self._pollers), 1)
+
+    @callback
+    def async_register(
+        self,
+        name: str,
+        poll: Callable[[], Coroutine[Any, Any, None]],
+        unreachable: CALLBACK_TYPE | None = None,
+    ) -> CALLBACK_TYPE:
+        """
+        Poll once per interval until the returned callback is called.
+
+        unreachable is called when another poller finds that Zoom can't be reached.
+        """
+        poller = _Poller(name, poll, unreachable)
+        self._pollers.append(poller)
+        if self._cancel_next is None:
+            self._schedule_next()
+
+        @callback
+        def unregister() -> None:
+            """Stop polling."""
+            self._pollers.remove(poller)
+            if not self._pollers and self._cancel_next:
+                self._cancel_next()
+                self._cancel_next = None
+
+        return unregister
+
+    def _schedule_next(self) -> None:
+        """Schedule the next poll."""
+        delay = self.spacing * (1 + uniform(-POLL_JITTER, POLL_JITTER))
+        self._next_due = self._hass.loop.time() + delay
+        self._cancel_next = async_call_later(self._hass, delay, self._poll_job)
+
+    @callback
+    def _async_poll_next(self, _now: Any) -> None:
+        """Start the poll of the next poller and schedule the one after it."""
+        self._cancel_next = None
+        if not self._pollers:
+            return
+        if self._next_due is not None:
+            self.lateness.observe(max(self._hass.loop.time() - self._next_due, 0))
+
+        poller = self._pollers[0]
+        self._pollers.rotate(-1)
+        self._start_poll(poller)
+        self._schedule_next()
+
+    def _start_poll(self, poller: _Poller) -> None:
+        """Start a poll unless the last poll of the poller is still running."""
+        if poller.task and not poller.task.done():
+            self.skipped += 1
+            _LOGGER.debug(
+                "Skipping poll of %s, the last one is still running", poller.name
+            )
+            return
+        poller.task = self._hass.async_create_background_task(
+            self._async_poll(poller), f"{DOMAIN} poll {poller.name}"
+        )
+
+    async def _async_poll(self, poller: _Poller) -> None:
+        """Poll while holding a slot of the concurrent poll limit."""
+        async with self._semaphore:
+            start = self._hass.loop.time()
+            try:
+                await poller.poll()
+            except Exception as err:
+                if not is_unreachable_error(err):
+                    raise
+                self._async_start_outage()
+                return
+            finally:
+                self.polls += 1
+                self.durations.observe(self._hass.loop.time() - start)
+        if self.outage:
+            self._async_end_outage(poller)
+
+    @callback
+    def _async_start_outage(self) -> None:
+        """Tell every poller that Zoom is unreachable and only probe from now on."""
+        if self.outage:
+            return
+        self.outage = True
+        self.outages += 1
+        _LOGGER.warning(
+            "Unable to reach Zoom, checking every %s seconds until it is back",
+            POLL_INTERVAL.total_seconds(),
+        )
+        for poller in self._pollers:
+            if poller.unreachable:
+                poller.unreachable()
+
+    @callback
+    def _async_end_outage(self, probe: _Poller) -> None:
+        """Poll every poller but the successful probe to catch up on updates."""
+        self.outage = False
+        _LOGGER.info("Zoom can be reached again, polling for missed updates")
+        for poller in self._pollers:
+            if poller is not probe:
+                self._start_poll(poller)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a dict representation of the scheduler."""
+        return {
+            "interval_s": POLL_INTERVAL.total_seconds(),
+            "pollers": len(self._pollers),
+            "outage": self.outage,
+            "outages": self.outages,
+            "spacing_s": round(self.spacing, 3),
+            "polls": self.polls,
+            "skipped": self.skipped,
+            "lateness": self.lateness.as_dict(),
+            "durations": self.durations.as_dict(),
+        }
@@ -0,0 +1,283 @@
+"""Sensor platform for Zoom."""
+
+from __future__ import annotations
+
+from abc import abstractmethod
+from datetime import timedelta
+from typing import Any
+
+from homeassistant.components.sensor import (
+    SensorDeviceClass,
+    SensorEntity,
+    SensorStateClass,
+)
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_NAME, EntityCategory, UnitOfTime
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.util import slugify
+
+from .const import (
+    ATTR_EVENT_TS,
+    DOMAIN,
+    HA_ZOOM_EVENT,
+    MEETING_TRACKER,
+    METRICS,
+    PRESENCE_STATS,
+)
+from .meetings import ZoomMeetingTracker
+from .metrics import ZoomEntryMetrics
+from .presence import DAYS_KEPT, ZoomPresenceStats
+
+# How often the presence statistics sensors add the time spent in the current
+# status
+STATS_UPDATE_INTERVAL = timedelta(minutes=1)
+# How often the delivery lag sensor writes its state, so webhook events don't each
+# cause a state write
+DELIVERY_LAG_UPDATE_INTERVAL = timedelta(minutes=1)
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    config_entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up Zoom sensor entities."""
+    entry_data = hass.data[DOMAIN][config_entry.entry_id]
+    tracker: ZoomMeetingTracker = entry_data[MEETING_TRACKER]
+    stats: ZoomPresenceStats = entry_data[PRESENCE_STATS]
+    async_add_entities(
+        [
+            ZoomActiveMeetingsSensor(config_entry, tracker),
+            ZoomDeliveryLagSensor(config_entry, entry_data[METRICS]),
+            ZoomTimeInMeetingSensor(config_entry, stats, "today", 1),
+            ZoomTimeInMeetingSensor(config_entry, stats, "this_week", DAYS_KEPT),
+            ZoomMeetingsTodaySensor(config_entry, stats),
+        ]
+    )
+
+
+class ZoomActiveMeetingsSensor(SensorEntity):
+    """Number of active meetings with their participant counts."""
+
+    _attr_should_poll = False
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_icon = "mdi:account-group"
+    _attr_native_unit_of_measurement = "meetings"
+
+    def __init__(self, config_entry: ConfigEntry, tracker: ZoomMeetingTracker) -> None:
+        """Initialize the sensor."""
+        self._tracker = tracker
+        name = config_entry.data[CONF_NAME]
+        self._attr_name = f"Zoom - {name} Active Meetings"
+        self._attr_unique_id = f"{DOMAIN}_{slugify(name)}_active_meetings"
+
+    @property
+    def native_value(self) -> int:
+        """Return the number of active meetings."""
+        return len(self._tracker.meetings)
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return the participant count of each active meeting."""
+        return {
+            "participants": self._tracker.participant_count,
+            "meetings": {
+                meeting_id: {
+                    "topic": meeting.topic,
+                    "participants": len(meeting.participants),
+                }
+                for meeting_id, meeting in self._tracker.meetings.items()
+            },
+        }
+
+    async def async_added_to_hass(self) -> None:
+        """Register callbacks when entity is added."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            self._tracker.async_add_listener(self.async_write_ha_state)
+        )
+
+
+class ZoomDeliveryLagSensor(SensorEntity):
+    """
+    Time between Zoom sending a webhook event and the event being fired.
+
+    The state is the median over the most recent events, so it can be compared to
+    the webhook stage timings in diagnostics to tell whether slowness comes from
+    Zoom's delivery or from Home Assistant. Events are recorded as they arrive but
+    the state is only written every DELIVERY_LAG_UPDATE_INTERVAL.
+    """
+
+    _attr_should_poll = False
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_device_class = SensorDeviceClass.DURATION
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_native_unit_of_measurement = UnitOfTime.MILLISECONDS
+    _attr_icon = "mdi:timer-sand"
+
+    def __init__(self, config_entry: ConfigEntry, metrics: ZoomEntryMetrics) -> None:
+        """Initialize the sensor."""
+        self._entry_id = config_entry.entry_id
+        self._metrics = metrics
+        self._lag = metrics.delivery_lag
+        name = config_entry.data[CONF_NAME]
+        self._attr_name = f"Zoom - {name} Webhook Delivery Lag"
+        self._attr_unique_id = f"{DOMAIN}_{slugify(name)}_delivery_lag"
+
+    @property
+    def native_value(self) -> float | None:
+        """Return the median delivery lag."""
+        return self._lag.as_dict()["p50_ms"]
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return the delivery lag distribution."""
+        lag = self._lag.as_dict()
+        return {
+            "p95": lag["p95_ms"],
+            "max": lag["max_ms"],
+            "samples": lag["samples"],
+            "stale_timestamps": self._metrics.stale_timestamps,
+        }
+
+    @callback
+    def _filter_event(self, event_data: dict[str, Any]) -> bool:
+        """Filter webhook events down to the ones for this config entry."""
+        return event_data.get("ha_config_entry_id") == self._entry_id
+
+    @callback
+    def _async_handle_event(self, event: Event) -> None:
+        """Record the delivery lag of a webhook event."""
+        # Events without a usable timestamp can't be measured
+        if not isinstance(event_ts := event.data.get(ATTR_EVENT_TS), int):
+            return
+        # event_ts is in milliseconds. Clock skew can make the lag negative.
+        lag = event.time_fired_timestamp * 1000 - event_ts
+        self._lag.observe(max(lag, 0))
+
+    @callback
+    def _async_update(self, _now: Any) -> None:
+        """Write the state with the events recorded since the last write."""
+        self.async_write_ha_state()
+
+    async def async_added_to_hass(self) -> None:
+        """Register callbacks when entity is added."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            self.hass.bus.async_listen(
+                HA_ZOOM_EVENT, self._async_handle_event, self._filter_event
+            )
+        )
+        self.async_on_remove(
+            async_track_time_interval(
+                self.hass,
+                self._async_update,
+                DELIVERY_LAG_UPDATE_INTERVAL,
+                cancel_on_shutdown=True,
+            )
+        )
+
+
+class ZoomPresenceStatsSensor(SensorEntity):
+    """Base class for sensors of the presence statistics."""
+
+    _attr_should_poll = False
+
+    def __init__(
+        self, config_entry: ConfigEntry, stats: ZoomPresenceStats, days: int
+    ) -> None:
+        """Initialize the sensor."""
+        self._stats = stats
+        self._days = days
+        self._name = config_entry.data[CONF_NAME]
+
+    @abstractmethod
+    @callback
+    def _async_update_totals(self) -> None:
+        """Update the state from the totals of the presence statistics."""
+
+    @callback
+    def _async_update(self, *_: Any) -> None:
+        """Update the state and write it."""
+        self._async_update_totals()
+        self.async_write_ha_state()
+
+    async def async_added_to_hass(self) -> None:
+        """Register callbacks when entity is added."""
+        await super().async_added_to_hass()
+        self._async_update_totals()
+        self.async_on_remove(self._stats.async_add_listener(self._async_update))
+        self.async_on_remove(
+            async_track_time_interval(
+                self.hass,
+                self._async_update,
+                STATS_UPDATE_INTERVAL,
+                cancel_on_shutdown=True,
+            )
+        )
+
+
+class ZoomTimeInMeetingSensor(ZoomPresenceStatsSensor):
+    """Time spent in a status that turns the presence binary sensor on."""
+
+    _attr_device_class = SensorDeviceClass.DURATION
+    _attr_native_unit_of_measurement = UnitOfTime.HOURS
+    _attr_suggested_display_precision = 2
+    _attr_icon = "mdi:video-account"
+
+    def __init__(
+        self,
+        config_entry: ConfigEntry,
+        stats: ZoomPresenceStats,
+        period: str,
+        days: int,
+    ) -> None:
+        """Initialize the sensor."""
+        super().__init__(config_entry, stats, days)
+        self._attr_name = (
+            f"Zoom - {self._name} Time In Meeting {period.replace('_', ' ').title()}"
+        )
+        self._attr_unique_id = (
+            f"{DOMAIN}_{slugify(self._name)}_time_in_meeting_{period}"
+        )
+        # Today's total starts over at midnight, the rolling week's can go down
+        self._attr_state_class = (
+            SensorStateClass.TOTAL_INCREASING
+            if days == 1
+            else SensorStateClass.MEASUREMENT
+        )
+
+    @callback
+    def _async_update_totals(self) -> None:
+        """Update the state from the totals of the presence statistics."""
+        totals = self._stats.async_totals(self._days)
+        self._attr_native_value = round(totals.on_seconds / 3600, 3)
+        self._attr_extra_state_attributes = {
+            "meetings": totals.meetings,
+            # Hours spent in each Zoom presence status
+            "statuses": {
+                status: round(seconds / 3600, 3)
+                for status, seconds in totals.statuses.items()
+            },
+        }
+
+
+class ZoomMeetingsTodaySensor(ZoomPresenceStatsSensor):
+    """Number of times the presence binary sensor turned on today."""
+
+    _attr_state_class = SensorStateClass.TOTAL_INCREASING
+    _attr_native_unit_of_measurement = "meetings"
+    _attr_icon = "mdi:calendar-check"
+
+    def __init__(self, config_entry: ConfigEntry, stats: ZoomPresenceStats) -> None:
+        """Initialize the sensor."""
+        super().__init__(config_entry, stats, 1)
+        self._attr_name = f"Zoom - {self._name} Meetings Today"
+        self._attr_unique_id = f"{DOMAIN}_{slugify(self._name)}_meetings_today"
+
+    @callback
+    def _async_update_totals(self) -> None:
+        """Update the state from the totals of the presence statistics."""
+        self._attr_native_value = self._stats.async_totals(self._days).meetings
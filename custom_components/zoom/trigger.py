@@ -0,0 +1,166 @@
+"""Offer Zoom webhook based automation rules."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any
+
+from homeassistant.const import CONF_PLATFORM
+from homeassistant.core import CALLBACK_TYPE, Event, HassJob, HomeAssistant, callback
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.trigger import TriggerActionType, TriggerInfo
+from homeassistant.helpers.typing import ConfigType
+import voluptuous as vol
+
+from .const import (
+    ATTR_EVENT,
+    ATTR_EVENT_TS,
+    ATTR_PAYLOAD,
+    CONF_CONFIG_ENTRY_ID,
+    CONF_EVENT_TYPE,
+    CONF_PAYLOAD,
+    DATA_TRIGGER_INDEX,
+    DOMAIN,
+    HA_ZOOM_EVENT,
+)
+
+TRIGGER_SCHEMA = cv.TRIGGER_BASE_SCHEMA.extend(
+    {
+        vol.Required(CONF_PLATFORM): DOMAIN,
+        vol.Required(CONF_EVENT_TYPE): vol.All(cv.ensure_list, [cv.string]),
+        vol.Optional(CONF_CONFIG_ENTRY_ID): cv.string,
+        # Map of dotted paths into the webhook payload to the value they must have,
+        # e.g. {"object.id": "abc123"}
+        vol.Optional(CONF_PAYLOAD): {cv.string: cv.string},
+    }
+)
+
+TriggerKey = tuple[str | None, str]
+
+
+@dataclass(slots=True)
+class ZoomTriggerMatcher:
+    """A single attached Zoom trigger."""
+
+    job: HassJob
+    trigger_data: dict[str, Any]
+    payload_filters: tuple[tuple[tuple[str, ...], str], ...]
+
+    def matches(self, payload: dict[str, Any]) -> bool:
+        """Return whether the webhook payload matches the configured fields."""
+        for path, expected in self.payload_filters:
+            value: Any = payload
+            for key in path:
+                if not isinstance(value, dict):
+                    return False
+                value = value.get(key)
+            # Zoom isn't consistent about the case of IDs, so compare loosely
+            if value is None or str(value).casefold() != expected:
+                return False
+        return True
+
+
+class ZoomTriggerIndex:
+    """Index of attached Zoom triggers by config entry and event type.
+
+    A single bus listener serves every Zoom trigger, and only the matchers indexed
+    under the incoming event's config entry and event type are evaluated.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize."""
+        self._hass = hass
+        self._matchers: dict[TriggerKey, list[ZoomTriggerMatcher]] = {}
+        self._unsub_listener: CALLBACK_TYPE | None = None
+
+    @callback
+    def async_add(self, key: TriggerKey, matcher: ZoomTriggerMatcher) -> CALLBACK_TYPE:
+        """Add a matcher to the index."""
+        self._matchers.setdefault(key, []).append(matcher)
+        if self._unsub_listener is None:
+            self._unsub_listener = self._hass.bus.async_listen(
+                HA_ZOOM_EVENT, self._async_handle_event, self._filter_event
+            )
+
+        @callback
+        def async_remove() -> None:
+            """Remove the matcher from the index."""
+            matchers = self._matchers[key]
+            matchers.remove(matcher)
+            if not matchers:
+                del self._matchers[key]
+            if not self._matchers and self._unsub_listener:
+                self._unsub_listener()
+                self._unsub_listener = None
+
+        return async_remove
+
+    @callback
+    def _filter_event(self, event_data: dict[str, Any]) -> bool:
+        """Only handle events that at least one trigger is indexed under."""
+        event_type = event_data.get(ATTR_EVENT)
+        return (
+            event_data.get("ha_config_entry_id"),
+            event_type,
+        ) in self._matchers or (None, event_type) in self._matchers
+
+    @callback
+    def _async_handle_event(self, event: Event) -> None:
+        """Run the actions of the triggers that match the event."""
+        data = event.data
+        entry_id = data.get("ha_config_entry_id")
+        event_type = data[ATTR_EVENT]
+        payload = data.get(ATTR_PAYLOAD) or {}
+
+        for key in ((entry_id, event_type), (None, event_type)):
+            for matcher in self._matchers.get(key, ()):
+                if not matcher.matches(payload):
+                    continue
+                self._hass.async_run_hass_job(
+                    matcher.job,
+                    {
+                        "trigger": {
+                            **matcher.trigger_data,
+                            "platform": DOMAIN,
+                            "event": event,
+                            CONF_EVENT_TYPE: event_type,
+                            CONF_CONFIG_ENTRY_ID: entry_id,
+                            ATTR_EVENT_TS: data.get(ATTR_EVENT_TS),
+                            ATTR_PAYLOAD: payload,
+                            "description": f"Zoom event '{event_type}'",
+                        }
+                    },
+                    event.context,
+                )
+
+
+async def async_attach_trigger(
+    hass: HomeAssistant,
+    config: ConfigType,
+    action: TriggerActionType,
+    trigger_info: TriggerInfo,
+) -> CALLBACK_TYPE:
+    """Listen for Zoom webhook events based on configuration."""
+    if (index := hass.data.get(DATA_TRIGGER_INDEX)) is None:
+        index = hass.data[DATA_TRIGGER_INDEX] = ZoomTriggerIndex(hass)
+
+    matcher = ZoomTriggerMatcher(
+        job=HassJob(action, f"{DOMAIN} trigger {trigger_info}"),
+        trigger_data=dict(trigger_info["trigger_data"]),
+        payload_filters=tuple(
+            (tuple(path.split(".")), str(expected).casefold())
+            for path, expected in config.get(CONF_PAYLOAD, {}).items()
+        ),
+    )
+    removes = [
+        index.async_add((config.get(CONF_CONFIG_ENTRY_ID), event_type), matcher)
+        for event_type in config[CONF_EVENT_TYPE]
+    ]
+
+    @callback
+    def async_remove() -> None:
+        """Remove the trigger from the index."""
+        for remove in removes:
+            remove()
+
+    return async_remove
@@ -0,0 +1,5 @@
+"""Benchmarks for HA zoom integration.
+
+These aren't collected by the test suite. Run one explicitly with
+`pytest tests/benchmarks/bench_<name>.py -s` to see its report.
+"""
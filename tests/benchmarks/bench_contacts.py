@@ -0,0 +1,95 @@
+"""Benchmark the memory held by the contact list as raw dicts and as records."""
+
+import gc
+import json
+import time
+import tracemalloc
+
+from homeassistant.util.json import json_loads
+
+from custom_components.zoom.models import ZoomContact
+
+ROUNDS = 1000
+
+
+def _contact_list_body(count: int) -> bytes:
+    """Create a contact list response like the Zoom API returns."""
+    return json.dumps(
+        {
+            "contacts": [
+                {
+                    "id": f"{i:022d}",
+                    "email": f"contact{i}@example.com",
+                    "first_name": f"First{i}",
+                    "last_name": f"Last{i}",
+                    "presence_status": "Available",
+                    "phone_number": "+1 555 0100",
+                    "phone_numbers": [],
+                    "sip_phone_number": "",
+                    "direct_numbers": [],
+                    "job_title": "Engineer",
+                    "location": "Remote",
+                    "account_id": "account123",
+                }
+                for i in range(count)
+            ]
+        }
+    ).encode()
+
+
+def _retained(build) -> tuple[int, object]:
+    """Return the bytes retained by what build returns."""
+    gc.collect()
+    tracemalloc.start()
+    result = build()
+    gc.collect()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return size, result
+
+
+def test_contact_records() -> None:
+    """Compare raw contact dicts with slotted, interned and indexed records."""
+    print()
+    print(
+        f"{'contacts':>8} {'dicts KiB':>10} {'records KiB':>12} "
+        f"{'scan us':>8} {'index us':>9}"
+    )
+    for count in (100, 1000, 5000):
+        body = _contact_list_body(count)
+
+        def _dicts(body: bytes = body) -> list[dict]:
+            contacts = json_loads(body)["contacts"]
+            for item in contacts:
+                item.update({"contact_type": "external"})
+            return contacts
+
+        def _records(
+            body: bytes = body,
+        ) -> tuple[list[ZoomContact], dict[str, ZoomContact]]:
+            contacts = [
+                ZoomContact.from_contact_dict(item, "external")
+                for item in json_loads(body)["contacts"]
+            ]
+            return contacts, {contact.id: contact for contact in contacts}
+
+        # Warm up so lazily created state isn't counted against the dicts
+        _records()
+        dicts_size, dicts = _retained(_dicts)
+        records_size, (_, by_id) = _retained(_records)
+
+        last_id = f"{count - 1:022d}"
+        start = time.perf_counter()
+        for _ in range(ROUNDS):
+            next(item for item in dicts if item["id"] == last_id)
+        scan = (time.perf_counter() - start) / ROUNDS
+        start = time.perf_counter()
+        for _ in range(ROUNDS):
+            by_id[last_id]  # noqa: B018
+        index = (time.perf_counter() - start) / ROUNDS
+
+        print(
+            f"{count:>8} {dicts_size / 1024:>10.1f} {records_size / 1024:>12.1f} "
+            f"{scan * 1e6:>8.2f} {index * 1e6:>9.3f}"
+        )
+        assert records_size < dicts_size
@@ -0,0 +1,78 @@
+"""Benchmark how much importing the integration adds to Home Assistant boot."""
+
+from pathlib import Path
+import subprocess
+import sys
+
+from pytest import fixture
+
+ROOT = Path(__file__).parents[2]
+MARKER = "zoom-import-start"
+
+# Modules Home Assistant has already imported by the time it loads the integration,
+# including the integration's dependencies (http and auth)
+BOOT_MODULES = (
+    "homeassistant.core",
+    "homeassistant.config_entries",
+    "homeassistant.helpers.config_validation",
+    "homeassistant.helpers.entity_platform",
+    "homeassistant.helpers.config_entry_oauth2_flow",
+    "homeassistant.components.http",
+    "homeassistant.components.auth",
+)
+ROUNDS = 5
+
+
+@fixture(name="my_profile")
+def my_profile_fixture():
+    """Don't import the integration in this process."""
+    yield
+
+
+def _import_times(module: str) -> dict[str, int]:
+    """Return the self import time in microseconds of each module loaded by module."""
+    code = "; ".join(
+        [
+            *(f"import {boot_module}" for boot_module in BOOT_MODULES),
+            "import sys",
+            f"sys.stderr.write('{MARKER}\\n')",
+            f"import {module}",
+        ]
+    )
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=ROOT,
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    times: dict[str, int] = {}
+    lines = result.stderr.splitlines()
+    # Format: "import time: <self us> | <cumulative us> | <indented module name>"
+    for line in lines[lines.index(MARKER) + 1 :]:
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, _, name = line[len("import time:") :].split("|")
+        times[name.strip()] = int(self_us)
+    return times
+
+
+def _report(module: str) -> dict[str, int]:
+    """Print the best of several runs for importing module after boot."""
+    runs = [_import_times(module) for _ in range(ROUNDS)]
+    best = min(runs, key=lambda times: sum(times.values()))
+    print(f"\n{module}: {sum(best.values()) / 1000:.1f} ms, {len(best)} new modules")
+    for name, self_us in sorted(best.items(), key=lambda item: -item[1])[:10]:
+        print(f"  {self_us / 1000:>7.2f} ms  {name}")
+    return best
+
+
+def test_import_time() -> None:
+    """Report the import cost of the integration and its lazily loaded modules."""
+    times = _report("custom_components.zoom")
+    # Only needed once a user starts a config or options flow
+    assert "custom_components.zoom.config_flow" not in times
+
+    _report("custom_components.zoom.config_flow")
+    for platform in ("binary_sensor", "event", "sensor", "trigger"):
+        _report(f"custom_components.zoom.{platform}")
@@ -0,0 +1,135 @@
+"""Benchmark how long large webhook payloads block the event loop."""
+
+import asyncio
+import hashlib
+import hmac
+import json
+import time
+
+from homeassistant.core import HomeAssistant
+from homeassistant.setup import async_setup_component
+from homeassistant.util.json import json_loads
+from pytest import mark
+
+from custom_components.zoom.const import (
+    ATTR_EVENT,
+    ATTR_EVENT_TS,
+    ATTR_PAYLOAD,
+    CONF_SECRET_TOKEN,
+    DATA_WEBHOOK_METRICS,
+    DOMAIN,
+    HA_URL,
+)
+
+from ..const import MOCK_CONFIG, MOCK_ENTRY
+
+REQUESTS = 10
+
+
+def _participants_body(count: int) -> str:
+    """Create a meeting event with many participants."""
+    return json.dumps(
+        {
+            ATTR_EVENT: "meeting.participant_joined",
+            ATTR_EVENT_TS: int(time.time() * 1000),
+            ATTR_PAYLOAD: {
+                "account_id": "account123",
+                "object": {
+                    "id": "meeting123",
+                    "participants": [
+                        {
+                            "user_id": f"{i:08d}",
+                            "user_name": f"Participant {i}",
+                            "email": f"participant{i}@example.com",
+                            "join_time": "2024-01-01T10:01:00Z",
+                        }
+                        for i in range(count)
+                    ],
+                },
+            },
+        }
+    )
+
+
+def _decode_time(body: str) -> float:
+    """Return the time it takes to decode a body."""
+    data = body.encode()
+    start = time.perf_counter()
+    json_loads(data)
+    return time.perf_counter() - start
+
+
+async def _max_loop_block(
+    hass: HomeAssistant, client, body: str, secret_token: str
+) -> float:
+    """Post a body REQUESTS times and return the longest event loop iteration."""
+    # Sign the body before measuring so only the server side blocks the loop
+    timestamp = str(int(time.time()))
+    signature = hmac.new(
+        secret_token.encode(),
+        f"v0:{timestamp}:{body}".encode(),
+        hashlib.sha256,
+    ).hexdigest()
+    data = body.encode()
+    stop = asyncio.Event()
+    worst = 0.0
+
+    async def _ticker() -> None:
+        nonlocal worst
+        while not stop.is_set():
+            start = time.perf_counter()
+            await asyncio.sleep(0)
+            worst = max(worst, time.perf_counter() - start)
+
+    ticker = asyncio.create_task(_ticker())
+    for _ in range(REQUESTS):
+        await client.post(
+            HA_URL,
+            data=data,
+            headers={
+                "Content-Type": "application/json",
+                "x-zm-signature": f"v0={signature}",
+                "x-zm-request-timestamp": timestamp,
+            },
+        )
+    await hass.async_block_till_done()
+    stop.set()
+    await ticker
+    return worst
+
+
+@mark.usefixtures("enable_custom_integrations")
+async def test_loop_block(hass: HomeAssistant, hass_client) -> None:
+    """
+    Measure the longest loop iteration while large webhook requests are handled.
+
+    Signed requests go all the way to firing the event, unless their payload is too
+    large to accept. Requests signed with an unknown secret token are rejected, and
+    shouldn't block the loop for long however large they are.
+    """
+    MOCK_ENTRY.add_to_hass(hass)
+    assert await async_setup_component(hass, DOMAIN, {})
+    await hass.async_block_till_done()
+    client = await hass_client()
+
+    print()
+    print(
+        f"{'bytes':>9} {'decode':>7} {'signed':>7} {'unsigned':>9}"
+        "  (ms, max loop block for the requests)"
+    )
+    for count in (100, 1000, 10000, 40000):
+        body = _participants_body(count)
+        signed = await _max_loop_block(
+            hass, client, body, MOCK_CONFIG[CONF_SECRET_TOKEN]
+        )
+        unsigned = await _max_loop_block(hass, client, body, "unknown")
+        print(
+            f"{len(body):>9} {_decode_time(body) * 1000:>7.3f} "
+            f"{signed * 1000:>7.3f} {unsigned * 1000:>9.3f}"
+        )
+
+    outcomes = hass.data[DATA_WEBHOOK_METRICS].outcomes
+    assert outcomes["unmatched_signature"] == 4 * REQUESTS
+    # Each participant counts as a list item with four keys, so the two larger
+    # participant lists are over MAX_PAYLOAD_KEYS and rejected once decoded
+    assert outcomes["accepted"] == outcomes["invalid_schema"] == 2 * REQUESTS
@@ -0,0 +1,180 @@
+"""Benchmark the memory retained by Zoom entities and the payloads they keep."""
+
+import gc
+import time
+import tracemalloc
+from unittest.mock import patch
+
+from homeassistant.const import CONF_NAME
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.entity_platform import async_get_platforms
+from homeassistant.setup import async_setup_component
+from pytest import mark
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.zoom.const import (
+    ATTR_EVENT,
+    ATTR_EVENT_TS,
+    ATTR_PAYLOAD,
+    CONF_CONNECTIVITY_ON_STATUSES,
+    CONF_EVENT_TYPES,
+    CONF_SECRET_TOKEN,
+    CONNECTIVITY_EVENT,
+    DEFAULT_CONNECTIVITY_ON_STATUSES,
+    DOMAIN,
+    HA_ZOOM_EVENT,
+)
+
+from ..const import MOCK_CONFIG, MOCK_TOKEN
+
+# Presence profile returned by the Zoom API for the binary sensors
+CONTACT_PROFILE = {
+    "id": "test",
+    "email": "user@example.com",
+    "first_name": "Test",
+    "last_name": "User",
+    "presence_status": "Available",
+    "phone_number": "+1 555 0100",
+    "sip_phone_number": "",
+    "direct_numbers": [],
+    "job_title": "Engineer",
+    "location": "Remote",
+}
+
+
+def _meeting_payload(i: int) -> dict:
+    """Create a meeting event payload of a typical size (~1 kB serialized)."""
+    return {
+        "account_id": "account123",
+        "object": {
+            "id": str(100000000 + i),
+            "uuid": f"{i:024d}==",
+            "host_id": "x1yCzABCDEfg23HiJKl4mN",
+            "topic": f"Meeting {i}",
+            "type": 2,
+            "start_time": "2024-01-01T10:00:00Z",
+            "timezone": "America/New_York",
+            "duration": 60,
+            "participant": {
+                "user_id": f"{i:08d}",
+                "user_name": f"Participant {i}",
+                "id": f"participant{i}",
+                "participant_uuid": f"uuid-{i:032d}",
+                "join_time": "2024-01-01T10:01:00Z",
+                "email": f"participant{i}@example.com",
+            },
+        },
+    }
+
+
+def _retained(before: tracemalloc.Snapshot) -> tuple[int, tracemalloc.Snapshot]:
+    """Return the bytes retained since a snapshot and a new snapshot."""
+    gc.collect()
+    after = tracemalloc.take_snapshot()
+    stats = after.compare_to(before, "filename")
+    return sum(stat.size_diff for stat in stats), after
+
+
+def _top_files(after: tracemalloc.Snapshot, before: tracemalloc.Snapshot) -> str:
+    """Return the files holding the most retained memory."""
+    stats = after.compare_to(before, "filename")[:5]
+    return "\n".join(
+        f"      {stat.size_diff / 1024:>9.1f} KiB  "
+        f"{stat.traceback[0].filename.rsplit('site-packages/', 1)[-1]}"
+        for stat in stats
+    )
+
+
+@mark.usefixtures("enable_custom_integrations")
+@mark.parametrize(
+    ("entry_count", "event_types", "webhooks"),
+    [(1, 10, 100), (10, 10, 1000), (10, 50, 1000)],
+)
+async def test_memory_footprint(
+    hass: HomeAssistant, entry_count: int, event_types: int, webhooks: int
+) -> None:
+    """Report retained memory per entity and per webhook event."""
+    entry_ids = []
+    for i in range(entry_count):
+        entry = MockConfigEntry(
+            domain=DOMAIN,
+            version=2,
+            data={
+                **MOCK_CONFIG,
+                CONF_NAME: f"room {i}",
+                CONF_SECRET_TOKEN: f"token{i}",
+                "auth_implementation": DOMAIN,
+                "token": MOCK_TOKEN,
+            },
+            options={
+                CONF_CONNECTIVITY_ON_STATUSES: DEFAULT_CONNECTIVITY_ON_STATUSES,
+                CONF_EVENT_TYPES: [f"bench.event_{j}" for j in range(event_types)],
+            },
+            unique_id=f"zoom_room_{i}",
+        )
+        entry.add_to_hass(hass)
+        entry_ids.append(entry.entry_id)
+
+    tracemalloc.start()
+    gc.collect()
+    start = tracemalloc.take_snapshot()
+
+    with patch(
+        "custom_components.zoom.api.ZoomAPI.async_get_contact_user_profile",
+        return_value=CONTACT_PROFILE,
+    ):
+        assert await async_setup_component(hass, DOMAIN, {})
+        await hass.async_block_till_done(wait_background_tasks=True)
+
+    entities = [
+        entity
+        for platform in async_get_platforms(hass, DOMAIN)
+        for entity in platform.entities.values()
+    ]
+    setup_bytes, after_setup = _retained(start)
+
+    # Replay webhooks round robin across config entries and event types, with a
+    # presence update for every config entry in between
+    for i in range(webhooks):
+        entry_id = entry_ids[i % entry_count]
+        hass.bus.async_fire(
+            HA_ZOOM_EVENT,
+            {
+                ATTR_EVENT: f"bench.event_{i % event_types}",
+                ATTR_EVENT_TS: int(time.time() * 1000) + i,
+                ATTR_PAYLOAD: _meeting_payload(i),
+                "ha_config_entry_id": entry_id,
+            },
+        )
+        if i % event_types == 0:
+            hass.bus.async_fire(
+                HA_ZOOM_EVENT,
+                {
+                    ATTR_EVENT: CONNECTIVITY_EVENT,
+                    ATTR_EVENT_TS: int(time.time() * 1000) + i,
+                    ATTR_PAYLOAD: {
+                        "object": {"id": "test", "presence_status": "In_Meeting"}
+                    },
+                    "ha_config_entry_id": entry_id,
+                },
+            )
+    await hass.async_block_till_done()
+
+    # Build the restore data of every entity like the restore state dump does
+    for entity in entities:
+        if hasattr(entity, "extra_restore_state_data"):
+            entity.extra_restore_state_data  # noqa: B018
+    replay_bytes, after_replay = _retained(after_setup)
+    tracemalloc.stop()
+
+    print(
+        f"\n{entry_count} entries x {event_types} event types, {webhooks} webhooks, "
+        f"{len(entities)} entities:\n"
+        f"  setup:  {setup_bytes / 1024:>9.1f} KiB, "
+        f"{setup_bytes / len(entities):>8.0f} B per entity\n"
+        f"{_top_files(after_setup, start)}\n"
+        f"  replay: {replay_bytes / 1024:>9.1f} KiB, "
+        f"{replay_bytes / len(entities):>8.0f} B per entity, "
+        f"{replay_bytes / webhooks:>8.0f} B per webhook\n"
+        f"{_top_files(after_replay, after_setup)}"
+    )
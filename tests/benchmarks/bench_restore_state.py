@@ -0,0 +1,77 @@
+"""Benchmark the size and serialization time of event entity restore data."""
+
+import time
+
+from homeassistant.helpers.json import json_bytes
+
+from custom_components.zoom.event import ZoomEventExtraStoredData, compact_payload
+
+ENTITY_COUNT = 50
+ROUNDS = 20
+
+
+def _recording_payload(file_count: int) -> dict:
+    """Create a recording.completed style payload with many recording files."""
+    return {
+        "account_id": "account123",
+        "object": {
+            "id": 123456789,
+            "uuid": "4444AAAiAAAAAiAiAiiAii==",
+            "host_id": "x1yCzABCDEfg23HiJKl4mN",
+            "topic": "Weekly sync",
+            "start_time": "2024-01-01T10:00:00Z",
+            "duration": 60,
+            "total_size": 529758,
+            "recording_files": [
+                {
+                    "id": f"file{i}",
+                    "meeting_id": "4444AAAiAAAAAiAiAiiAii==",
+                    "recording_start": "2024-01-01T10:00:00Z",
+                    "recording_end": "2024-01-01T11:00:00Z",
+                    "file_type": "MP4",
+                    "file_size": 7220,
+                    "play_url": f"https://example.zoom.us/rec/play/{i}",
+                    "download_url": f"https://example.zoom.us/rec/download/{i}",
+                    "status": "completed",
+                    "recording_type": "shared_screen_with_speaker_view",
+                }
+                for i in range(file_count)
+            ],
+        },
+    }
+
+
+def _measure(extra_data: list[ZoomEventExtraStoredData]) -> tuple[int, float]:
+    """Return the serialized size and average dump time of the restore data."""
+    start = time.perf_counter()
+    for _ in range(ROUNDS):
+        size = len(json_bytes([data.as_dict() for data in extra_data]))
+    return size, (time.perf_counter() - start) / ROUNDS
+
+
+def test_restore_state_size() -> None:
+    """Compare full and compacted restore data for many event entities."""
+    print()
+    print(
+        f"{'files':>6} {'full bytes':>12} {'compact bytes':>14} "
+        f"{'full ms':>9} {'compact ms':>11}"
+    )
+    for file_count in (1, 10, 100, 1000):
+        payload = _recording_payload(file_count)
+        full = [
+            ZoomEventExtraStoredData(last_payload=payload, last_event_ts=1)
+            for _ in range(ENTITY_COUNT)
+        ]
+        compact = [
+            ZoomEventExtraStoredData(
+                last_payload=compact_payload(payload), last_event_ts=1
+            )
+            for _ in range(ENTITY_COUNT)
+        ]
+        full_size, full_time = _measure(full)
+        compact_size, compact_time = _measure(compact)
+        print(
+            f"{file_count:>6} {full_size:>12} {compact_size:>14} "
+            f"{full_time * 1000:>9.3f} {compact_time * 1000:>11.3f}"
+        )
+        assert compact_size <= full_size
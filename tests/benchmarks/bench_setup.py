@@ -0,0 +1,83 @@
+"""Benchmark setting up many Zoom config entries against a slow Zoom API."""
+
+import asyncio
+from http import HTTPStatus
+import time
+from unittest.mock import patch
+
+from homeassistant.const import CONF_NAME
+from homeassistant.core import HomeAssistant
+from homeassistant.setup import async_setup_component
+from pytest import fixture, mark
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+from pytest_homeassistant_custom_component.test_util.aiohttp import (
+    AiohttpClientMockResponse,
+)
+
+from custom_components.zoom.const import (
+    CONF_SECRET_TOKEN,
+    DOMAIN,
+    MAX_CONCURRENT_API_REQUESTS,
+)
+
+from ..const import MOCK_CONFIG, MOCK_TOKEN
+
+# Simulated round trip time of a request to api.zoom.us
+API_LATENCY = 0.05
+
+
+@fixture(name="my_profile")
+def my_profile_fixture():
+    """Let profile requests go through the (simulated) API."""
+    yield
+
+
+@mark.usefixtures("enable_custom_integrations")
+@mark.parametrize("entry_count", [1, 10, 50, 100])
+async def test_setup_time(hass: HomeAssistant, entry_count: int) -> None:
+    """Measure the total setup time as the number of config entries grows."""
+    for i in range(entry_count):
+        MockConfigEntry(
+            domain=DOMAIN,
+            version=2,
+            data={
+                **MOCK_CONFIG,
+                CONF_NAME: f"room {i}",
+                CONF_SECRET_TOKEN: f"token{i}",
+                "auth_implementation": DOMAIN,
+                "token": MOCK_TOKEN,
+            },
+            unique_id=f"zoom_room_{i}",
+        ).add_to_hass(hass)
+
+    in_flight = max_in_flight = requests = 0
+
+    async def _async_request(*args, **kwargs):
+        nonlocal in_flight, max_in_flight, requests
+        requests += 1
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(API_LATENCY)
+        in_flight -= 1
+        return AiohttpClientMockResponse(
+            "get",
+            "zoom_url",
+            status=HTTPStatus.OK,
+            json={"id": "test", "presence_status": "Available"},
+        )
+
+    with patch(
+        "homeassistant.helpers.config_entry_oauth2_flow.OAuth2Session.async_request",
+        side_effect=_async_request,
+    ):
+        start = time.perf_counter()
+        assert await async_setup_component(hass, DOMAIN, {})
+        # Include the initial presence fetches that run in the background
+        await hass.async_block_till_done(wait_background_tasks=True)
+        elapsed = time.perf_counter() - start
+
+    print(
+        f"\n{entry_count:>4} entries: {elapsed * 1000:>8.1f} ms total, "
+        f"{requests} requests, {max_in_flight} max in flight"
+    )
+    assert max_in_flight <= MAX_CONCURRENT_API_REQUESTS
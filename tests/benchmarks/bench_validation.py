@@ -0,0 +1,76 @@
+"""Benchmark webhook request validation against the voluptuous schema it replaced."""
+
+import json
+import time
+
+from homeassistant.util.json import json_loads
+import voluptuous as vol
+
+from custom_components.zoom.common import validate_webhook_data
+from custom_components.zoom.const import ATTR_EVENT, ATTR_EVENT_TS, ATTR_PAYLOAD
+
+# The schema the webhook view validated requests with before
+WEBHOOK_RESPONSE_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_EVENT): vol.Coerce(str),
+        vol.Required(ATTR_PAYLOAD): dict,
+        vol.Required(ATTR_EVENT_TS): vol.Coerce(int),
+    },
+    extra=vol.ALLOW_EXTRA,
+)
+ROUNDS = 2000
+
+
+def _request(participants: int) -> dict:
+    """Create a decoded meeting event with many participants."""
+    return {
+        ATTR_EVENT: "meeting.participant_joined",
+        ATTR_EVENT_TS: 1700000000000,
+        ATTR_PAYLOAD: {
+            "account_id": "account123",
+            "object": {
+                "id": "meeting123",
+                "participants": [
+                    {
+                        "user_id": f"{i:08d}",
+                        "user_name": f"Participant {i}",
+                        "email": f"participant{i}@example.com",
+                    }
+                    for i in range(participants)
+                ],
+            },
+        },
+    }
+
+
+def _measure(function, data) -> float:
+    """Return the average time it takes to call function with data."""
+    start = time.perf_counter()
+    for _ in range(ROUNDS):
+        function(data)
+    return (time.perf_counter() - start) / ROUNDS
+
+
+def test_validation() -> None:
+    """
+    Compare the voluptuous schema with the hand written validator.
+
+    The schema only looked at the top level of a request, while the validator walks
+    the whole payload to bound its size, so decoding is shown for scale.
+    """
+    print()
+    print(
+        f"{'participants':>12} {'decode us':>10} {'schema us':>10} {'validator us':>13}"
+    )
+    for participants in (0, 10, 100, 1000):
+        data = _request(participants)
+        assert validate_webhook_data(data) == WEBHOOK_RESPONSE_SCHEMA(data)
+
+        body = json.dumps(data).encode()
+        decode = _measure(json_loads, body)
+        schema = _measure(WEBHOOK_RESPONSE_SCHEMA, data)
+        validator = _measure(validate_webhook_data, data)
+        print(
+            f"{participants:>12} {decode * 1e6:>10.2f} {schema * 1e6:>10.2f} "
+            f"{validator * 1e6:>13.2f}"
+        )
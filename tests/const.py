@@ -4,9 +4,13 @@ from datetime import timedelta
 
 from homeassistant.components.event import DOMAIN as EVENT_DOMAIN
 from homeassistant.const import CONF_CLIENT_ID, CONF_CLIENT_SECRET, CONF_NAME
+from homeassistant.core import HomeAssistant
 from homeassistant.helpers import entity_registry as er
 import homeassistant.util.dt as dt_util
-from pytest_homeassistant_custom_component.common import MockConfigEntry
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_fire_time_changed,
+)
 
 from custom_components.zoom.const import (
     CONF_SECRET_TOKEN,
@@ -14,6 +18,7 @@ from custom_components.zoom.const import (
     DOMAIN,
     VALIDATION_EVENT,
 )
+from custom_components.zoom.event import DISCOVERY_BATCH_WINDOW
 
 # Event types that are pre-created and disabled by default
 _PRECREATED_DISABLED_EVENTS = {VALIDATION_EVENT, CONNECTIVITY_EVENT}
@@ -31,6 +36,14 @@ def get_non_precreated_event_entities(
     ]
 
 
+async def async_flush_event_discovery(hass: HomeAssistant) -> None:
+    """Move time past the discovery window so queued event entities are added."""
+    async_fire_time_changed(
+        hass, dt_util.utcnow() + timedelta(seconds=DISCOVERY_BATCH_WINDOW + 1)
+    )
+    await hass.async_block_till_done()
+
+
 MOCK_CONFIG = {
     CONF_NAME: "test",
     CONF_CLIENT_ID: "client_id",
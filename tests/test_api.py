@@ -1,6 +1,7 @@
 """Test zoom API."""
+import asyncio
 from http import HTTPStatus
-from unittest.mock import patch
+from unittest.mock import AsyncMock, patch
 
 from homeassistant.const import CONF_CLIENT_ID, CONF_CLIENT_SECRET
 from homeassistant.helpers import config_entry_oauth2_flow
@@ -16,6 +17,9 @@ from custom_components.zoom.const import (
     OAUTH2_AUTHORIZE,
     OAUTH2_TOKEN,
 )
+from custom_components.zoom.coordinator import ZoomContactListDataUpdateCoordinator
+from custom_components.zoom.metrics import ZoomEntryMetrics
+from custom_components.zoom.models import ZoomContact
 
 from .const import MOCK_ENTRY, MOCK_TOKEN
 
@@ -58,11 +62,20 @@ async def test_api(hass):
             status=HTTPStatus.OK,
             json={
                 "next_page_token": "",
-                "contacts": [{"id": "test", "first_name": "test"}],
+                "contacts": [
+                    {"id": "test", "first_name": "test", "presence_status": "Away"}
+                ],
             },
         ),
     ):
-        await api.async_get_contacts()
+        assert await api.async_get_contacts() == [
+            ZoomContact(
+                id="test",
+                first_name="test",
+                presence_status="Away",
+                contact_type="external",
+            )
+        ]
 
     with patch(
         "homeassistant.helpers.config_entry_oauth2_flow.OAuth2Session.async_request",
@@ -74,3 +87,75 @@ async def test_api(hass):
         ),
     ):
         await api.async_get_my_user_profile()
+
+
+async def test_api_concurrency_limited(hass):
+    """Test that requests from API clients sharing a semaphore are capped."""
+    MOCK_ENTRY.add_to_hass(hass)
+    implementation = ZoomOAuth2Implementation(
+        hass,
+        DOMAIN,
+        MOCK_ENTRY.data[CONF_CLIENT_ID],
+        MOCK_ENTRY.data[CONF_CLIENT_SECRET],
+        OAUTH2_AUTHORIZE,
+        OAUTH2_TOKEN,
+        MOCK_ENTRY.data[CONF_SECRET_TOKEN],
+        "test",
+    )
+    semaphore = asyncio.Semaphore(2)
+    metrics = ZoomEntryMetrics()
+    apis = [
+        ZoomAPI(
+            config_entry_oauth2_flow.OAuth2Session(hass, MOCK_ENTRY, implementation),
+            semaphore,
+            metrics,
+        )
+        for _ in range(5)
+    ]
+    in_flight = max_in_flight = 0
+
+    async def _async_request(*args, **kwargs):
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return AiohttpClientMockResponse(
+            "get", "zoom_url", status=HTTPStatus.OK, json={"id": "test"}
+        )
+
+    with patch(
+        "homeassistant.helpers.config_entry_oauth2_flow.OAuth2Session.async_request",
+        side_effect=_async_request,
+    ):
+        profiles = await asyncio.gather(
+            *(api.async_get_contact_user_profile("test") for api in apis)
+        )
+
+    assert profiles == [{"id": "test"}] * 5
+    assert max_in_flight == 2
+
+    stats = metrics.api["contact_profile"]
+    assert stats.calls == 5
+    assert stats.errors == 0
+    assert stats.latency.count == 5
+
+
+async def test_contact_list_indexed(hass):
+    """Test that contacts are indexed by ID along with the contact list."""
+    # Build the strings at runtime like the JSON decoder does
+    contacts = [
+        ZoomContact.from_contact_dict(
+            {"id": id, "presence_status": "".join(("Avail", "able"))}, "external"
+        )
+        for id in ("a", "b")
+    ]
+    # Strings that many contacts share are only kept once
+    assert contacts[0].presence_status is contacts[1].presence_status
+    api = AsyncMock(spec=ZoomAPI)
+    api.async_get_contacts.return_value = contacts
+    coordinator = ZoomContactListDataUpdateCoordinator(hass, api)
+    await coordinator.async_refresh()
+
+    assert coordinator.data == contacts
+    assert coordinator.contacts_by_id["b"] is contacts[1]
@@ -0,0 +1,221 @@
+"""Test Zoom binary sensor platform."""
+
+import asyncio
+from unittest.mock import patch
+
+from aiohttp import ClientConnectionError
+from homeassistant.const import (
+    EVENT_STATE_CHANGED,
+    STATE_OFF,
+    STATE_ON,
+    STATE_UNAVAILABLE,
+)
+from homeassistant.core import Event, HomeAssistant, State
+from homeassistant.setup import async_setup_component
+import homeassistant.util.dt as dt_util
+import pytest
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_capture_events,
+    async_fire_time_changed,
+    mock_restore_cache_with_extra_data,
+)
+
+from custom_components.zoom.const import (
+    ATTR_EVENT,
+    ATTR_EVENT_TS,
+    ATTR_LAST_EVENT_TS,
+    ATTR_PAYLOAD,
+    CONF_CONNECTIVITY_ON_STATUSES,
+    CONNECTIVITY_EVENT,
+    DATA_POLL_SCHEDULER,
+    DEFAULT_CONNECTIVITY_ON_STATUSES,
+    DOMAIN,
+    HA_ZOOM_EVENT,
+    METRICS,
+)
+from custom_components.zoom.scheduler import POLL_INTERVAL
+
+from .const import MOCK_ENTRY
+
+BINARY_SENSOR_ENTITY_ID = "binary_sensor.zoom_test"
+
+
+@pytest.mark.usefixtures("enable_custom_integrations")
+async def test_initial_status_fetched_in_background(hass: HomeAssistant) -> None:
+    """Test that platform setup doesn't wait for the initial presence status."""
+    release = asyncio.Event()
+
+    async def _get_contact_user_profile(self, id):
+        await release.wait()
+        return {"id": id, "presence_status": "In_Meeting"}
+
+    MOCK_ENTRY.add_to_hass(hass)
+    with patch(
+        "custom_components.zoom.api.ZoomAPI.async_get_contact_user_profile",
+        _get_contact_user_profile,
+    ):
+        assert await async_setup_component(hass, DOMAIN, {})
+        await hass.async_block_till_done(wait_background_tasks=False)
+
+        # Setup finished while the status request is still pending
+        assert hass.states.get(BINARY_SENSOR_ENTITY_ID).state == STATE_OFF
+
+        release.set()
+        await hass.async_block_till_done(wait_background_tasks=True)
+
+    assert hass.states.get(BINARY_SENSOR_ENTITY_ID).state == STATE_ON
+    assert hass.states.get(BINARY_SENSOR_ENTITY_ID).attributes["status"] == (
+        "In_Meeting"
+    )
+
+
+def _fire_presence_event(
+    hass: HomeAssistant,
+    event_ts: int,
+    status: str,
+    entry_id: str = MOCK_ENTRY.entry_id,
+) -> None:
+    """Fire a presence event for the authenticated user."""
+    hass.bus.async_fire(
+        HA_ZOOM_EVENT,
+        {
+            ATTR_EVENT: CONNECTIVITY_EVENT,
+            ATTR_EVENT_TS: event_ts,
+            ATTR_PAYLOAD: {"object": {"id": "test", "presence_status": status}},
+            "ha_config_entry_id": entry_id,
+        },
+    )
+
+
+@pytest.mark.usefixtures("enable_custom_integrations")
+async def test_out_of_order_presence_events(hass: HomeAssistant) -> None:
+    """Test that presence events older than the last applied one are dropped."""
+    MOCK_ENTRY.add_to_hass(hass)
+    with patch(
+        "custom_components.zoom.api.ZoomAPI.async_get_contact_user_profile",
+        return_value={"id": "test", "presence_status": "Available"},
+    ):
+        assert await async_setup_component(hass, DOMAIN, {})
+        await hass.async_block_till_done(wait_background_tasks=True)
+    metrics = hass.data[DOMAIN][MOCK_ENTRY.entry_id][METRICS]
+
+    _fire_presence_event(hass, 2000, "In_Meeting")
+    await hass.async_block_till_done()
+    assert hass.states.get(BINARY_SENSOR_ENTITY_ID).state == STATE_ON
+
+    # A delayed event and a retry of the applied one don't change the state
+    _fire_presence_event(hass, 1000, "Available")
+    _fire_presence_event(hass, 2000, "In_Meeting")
+    await hass.async_block_till_done()
+    assert hass.states.get(BINARY_SENSOR_ENTITY_ID).state == STATE_ON
+    assert metrics.stale_presence_events == 2
+
+    _fire_presence_event(hass, 3000, "Available")
+    await hass.async_block_till_done()
+    assert hass.states.get(BINARY_SENSOR_ENTITY_ID).state == STATE_OFF
+    assert metrics.stale_presence_events == 2
+
+
+@pytest.mark.usefixtures("enable_custom_integrations")
+async def test_last_presence_event_restored(hass: HomeAssistant) -> None:
+    """Test that the last presence event timestamp survives a restart."""
+    mock_restore_cache_with_extra_data(
+        hass,
+        [(State(BINARY_SENSOR_ENTITY_ID, STATE_ON), {ATTR_LAST_EVENT_TS: 5000})],
+    )
+    MOCK_ENTRY.add_to_hass(hass)
+    with patch(
+        "custom_components.zoom.api.ZoomAPI.async_get_contact_user_profile",
+        return_value={"id": "test", "presence_status": "In_Meeting"},
+    ):
+        assert await async_setup_component(hass, DOMAIN, {})
+        await hass.async_block_till_done(wait_background_tasks=True)
+
+    _fire_presence_event(hass, 4000, "Available")
+    await hass.async_block_till_done()
+    assert hass.states.get(BINARY_SENSOR_ENTITY_ID).state == STATE_ON
+    assert hass.data[DOMAIN][MOCK_ENTRY.entry_id][METRICS].stale_presence_events == 1
+
+
+def _state_changes(events: list[Event]) -> int:
+    """Return the number of state changes of the binary sensor."""
+    return sum(
+        1 for event in events if event.data["entity_id"] == BINARY_SENSOR_ENTITY_ID
+    )
+
+
+@pytest.mark.usefixtures("enable_custom_integrations")
+async def test_unchanged_presence_not_written(hass: HomeAssistant) -> None:
+    """Test that the state is only written when it or its attributes change."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        version=2,
+        data=MOCK_ENTRY.data,
+        options={CONF_CONNECTIVITY_ON_STATUSES: DEFAULT_CONNECTIVITY_ON_STATUSES},
+        entry_id="unchanged",
+        unique_id="zoom_unchanged",
+    )
+    entry.add_to_hass(hass)
+    with patch(
+        "custom_components.zoom.api.ZoomAPI.async_get_contact_user_profile",
+        return_value={"id": "test", "presence_status": "Available"},
+    ):
+        assert await async_setup_component(hass, DOMAIN, {})
+        await hass.async_block_till_done(wait_background_tasks=True)
+    changed = async_capture_events(hass, EVENT_STATE_CHANGED)
+
+    _fire_presence_event(hass, 1000, "In_Meeting", entry.entry_id)
+    await hass.async_block_till_done()
+    last_reported = hass.states.get(BINARY_SENSOR_ENTITY_ID).last_reported
+    # A repeated status isn't written at all
+    _fire_presence_event(hass, 2000, "In_Meeting", entry.entry_id)
+    await hass.async_block_till_done()
+    assert hass.states.get(BINARY_SENSOR_ENTITY_ID).last_reported == last_reported
+
+    # A status that only changes the attributes is written
+    _fire_presence_event(hass, 3000, "Presenting", entry.entry_id)
+    await hass.async_block_till_done()
+    assert _state_changes(changed) == 2
+    state = hass.states.get(BINARY_SENSOR_ENTITY_ID)
+    assert state.state == STATE_ON
+    assert state.attributes["status"] == "Presenting"
+
+    # Changing which statuses are on applies to the current status
+    hass.config_entries.async_update_entry(
+        entry, options={CONF_CONNECTIVITY_ON_STATUSES: ["In_Meeting"]}
+    )
+    await hass.async_block_till_done()
+    assert hass.states.get(BINARY_SENSOR_ENTITY_ID).state == STATE_OFF
+    assert _state_changes(changed) == 3
+
+
+@pytest.mark.usefixtures("enable_custom_integrations")
+async def test_status_reconciled_after_outage(hass: HomeAssistant) -> None:
+    """Test the status is fetched again once Zoom can be reached."""
+    MOCK_ENTRY.add_to_hass(hass)
+    with patch(
+        "custom_components.zoom.api.ZoomAPI.async_get_contact_user_profile",
+        return_value={"id": "test", "presence_status": "Available"},
+    ):
+        assert await async_setup_component(hass, DOMAIN, {})
+        await hass.async_block_till_done(wait_background_tasks=True)
+    scheduler = hass.data[DATA_POLL_SCHEDULER]
+
+    with patch(
+        "custom_components.zoom.api.ZoomAPI.async_get_contact_user_profile",
+        side_effect=ClientConnectionError,
+    ):
+        async_fire_time_changed(hass, dt_util.utcnow() + POLL_INTERVAL * 2)
+        await hass.async_block_till_done(wait_background_tasks=True)
+    assert hass.states.get(BINARY_SENSOR_ENTITY_ID).state == STATE_UNAVAILABLE
+    assert scheduler.outage
+
+    with patch(
+        "custom_components.zoom.api.ZoomAPI.async_get_contact_user_profile",
+        return_value={"id": "test", "presence_status": "In_Meeting"},
+    ):
+        async_fire_time_changed(hass, dt_util.utcnow() + POLL_INTERVAL * 4)
+        await hass.async_block_till_done(wait_background_tasks=True)
+    assert hass.states.get(BINARY_SENSOR_ENTITY_ID).state == STATE_ON
+    assert not scheduler.outage
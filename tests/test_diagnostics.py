@@ -0,0 +1,106 @@
+"""Test Zoom diagnostics."""
+
+import hashlib
+import hmac
+import json
+import time
+
+from aiohttp.test_utils import TestClient
+from homeassistant.core import HomeAssistant
+from homeassistant.setup import async_setup_component
+import pytest
+from pytest_homeassistant_custom_component.components.diagnostics import (
+    get_diagnostics_for_config_entry,
+)
+
+from custom_components.zoom.const import (
+    ATTR_EVENT,
+    ATTR_EVENT_TS,
+    ATTR_PAYLOAD,
+    CONF_SECRET_TOKEN,
+    DOMAIN,
+    HA_URL,
+)
+from custom_components.zoom.limiter import DEFAULT_SOURCE_RATE, GLOBAL_RATE_FACTOR
+
+from .const import MOCK_CONFIG, MOCK_ENTRY
+
+
+@pytest.mark.usefixtures("enable_custom_integrations")
+async def test_diagnostics(hass: HomeAssistant, hass_client: pytest.fixture) -> None:
+    """Test diagnostics include performance counters and no secrets."""
+    MOCK_ENTRY.add_to_hass(hass)
+    assert await async_setup_component(hass, "diagnostics", {})
+    assert await async_setup_component(hass, DOMAIN, {})
+    await hass.async_block_till_done()
+
+    client: TestClient = await hass_client()
+
+    # One accepted event and one request that isn't from Zoom
+    timestamp = str(int(time.time()))
+    body = json.dumps(
+        {
+            ATTR_EVENT: "meeting.started",
+            ATTR_EVENT_TS: int(time.time()),
+            ATTR_PAYLOAD: {"object": {"id": "meeting123"}},
+        }
+    )
+    signature = hmac.new(
+        MOCK_CONFIG[CONF_SECRET_TOKEN].encode(),
+        f"v0:{timestamp}:{body}".encode(),
+        hashlib.sha256,
+    ).hexdigest()
+    await client.post(
+        HA_URL,
+        data=body,
+        headers={
+            "Content-Type": "application/json",
+            "x-zm-signature": f"v0={signature}",
+            "x-zm-request-timestamp": timestamp,
+        },
+    )
+    await client.post(HA_URL, data=body)
+
+    diagnostics = await get_diagnostics_for_config_entry(hass, hass_client, MOCK_ENTRY)
+
+    assert diagnostics["webhook"]["requests"] == {
+        "accepted": 1,
+        "missing_headers": 1,
+    }
+    stages = diagnostics["webhook"]["stages"]
+    for stage in ("parse", "verify", "discovery", "fire"):
+        assert stages[stage]["count"] == 1
+    assert stages["total"]["count"] == 2
+    assert sum(stages["total"]["buckets"].values()) == 2
+
+    # Summaries of the last requests are kept instead of logging them
+    recent = diagnostics["webhook"]["recent_requests"]
+    assert [(req["outcome"], req["event"]) for req in recent] == [
+        ("accepted", "meeting.started"),
+        ("missing_headers", None),
+    ]
+    assert recent[0]["bytes"] == len(body)
+
+    assert diagnostics["poll_scheduler"]["pollers"] == 1
+    assert diagnostics["webhook_limiter"] == {
+        "allowed_networks": {MOCK_ENTRY.entry_id: []},
+        "source_rate": DEFAULT_SOURCE_RATE,
+        "global_rate": DEFAULT_SOURCE_RATE * GLOBAL_RATE_FACTOR,
+        "tracked_sources": 1,
+    }
+    assert diagnostics["polls"] == {"count": 0, "failures": 0}
+    assert diagnostics["stale_presence_events"] == 0
+    assert diagnostics["stale_timestamps"] == 0
+    assert diagnostics["delivery_lag"]["samples"] == 1
+    assert diagnostics["entities"]["by_domain"] == {
+        "binary_sensor": 1,
+        "event": 2,
+        "sensor": 5,
+    }
+    assert diagnostics["startup_timings"].keys() == {"profile", "platforms", "total"}
+
+    # Secrets and identifying data are redacted
+    entry_data = diagnostics["entry"]["data"]
+    for key in ("client_id", "client_secret", CONF_SECRET_TOKEN, "token"):
+        assert entry_data[key] == "**REDACTED**"
+    assert diagnostics["entry"]["title"] == "**REDACTED**"
@@ -7,7 +7,9 @@ from homeassistant.components.event import DOMAIN as EVENT_DOMAIN
 from homeassistant.const import CONF_NAME, EntityCategory
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.entity_platform import EntityPlatform
 from homeassistant.setup import async_setup_component
+from pytest_homeassistant_custom_component.common import MockConfigEntry
 
 from custom_components.zoom.const import (
     ATTR_EVENT,
@@ -15,15 +17,27 @@ from custom_components.zoom.const import (
     ATTR_LAST_EVENT_TS,
     ATTR_LAST_PAYLOAD,
     ATTR_PAYLOAD,
+    CONF_CONNECTIVITY_ON_STATUSES,
+    CONF_EVENT_TYPES,
     CONNECTIVITY_EVENT,
+    DEFAULT_CONNECTIVITY_ON_STATUSES,
     DOMAIN,
+    EVENT_TYPES,
     HA_ZOOM_EVENT,
     SIGNAL_NEW_ZOOM_EVENT_TYPE,
     VALIDATION_EVENT,
 )
-from custom_components.zoom.event import ZoomEventExtraStoredData
+from custom_components.zoom.event import (
+    MAX_RESTORED_PAYLOAD_SIZE,
+    ZoomEventExtraStoredData,
+    compact_payload,
+)
 
-from .const import MOCK_ENTRY, get_non_precreated_event_entities
+from .const import (
+    MOCK_ENTRY,
+    async_flush_event_discovery,
+    get_non_precreated_event_entities,
+)
 
 # Use meeting.started for tests since it's enabled by default
 # (CONNECTIVITY_EVENT is disabled by default as it's redundant with binary_sensor)
@@ -120,7 +134,7 @@ async def test_event_entity_created_on_signal(hass: HomeAssistant) -> None:
         TEST_EVENT_TYPE,
         event_data,
     )
-    await hass.async_block_till_done()
+    await async_flush_event_discovery(hass)
 
     # Now we should have one event entity (excluding pre-created disabled entities)
     event_entities = get_non_precreated_event_entities(ent_reg, MOCK_ENTRY.entry_id)
@@ -147,7 +161,7 @@ async def test_event_entity_has_correct_attributes(hass: HomeAssistant) -> None:
         TEST_EVENT_TYPE,
         event_data,
     )
-    await hass.async_block_till_done()
+    await async_flush_event_discovery(hass)
 
     # Get the entity (excluding pre-created disabled entities)
     event_entities = get_non_precreated_event_entities(ent_reg, MOCK_ENTRY.entry_id)
@@ -180,7 +194,7 @@ async def test_event_entity_handles_webhook_event(hass: HomeAssistant) -> None:
         TEST_EVENT_TYPE,
         initial_event_data,
     )
-    await hass.async_block_till_done()
+    await async_flush_event_discovery(hass)
 
     # Get entity registry entry (excluding pre-created disabled entities)
     ent_reg = er.async_get(hass)
@@ -220,7 +234,7 @@ async def test_event_entity_filters_by_config_entry(hass: HomeAssistant) -> None
         TEST_EVENT_TYPE,
         event_data,
     )
-    await hass.async_block_till_done()
+    await async_flush_event_discovery(hass)
 
     ent_reg = er.async_get(hass)
     event_entities = get_non_precreated_event_entities(ent_reg, MOCK_ENTRY.entry_id)
@@ -257,7 +271,7 @@ async def test_event_entity_filters_by_event_type(hass: HomeAssistant) -> None:
         TEST_EVENT_TYPE,
         event_data,
     )
-    await hass.async_block_till_done()
+    await async_flush_event_discovery(hass)
 
     ent_reg = er.async_get(hass)
     event_entities = get_non_precreated_event_entities(ent_reg, MOCK_ENTRY.entry_id)
@@ -299,7 +313,7 @@ async def test_existing_entities_restored_on_startup(hass: HomeAssistant) -> Non
         TEST_EVENT_TYPE,
         event_data,
     )
-    await hass.async_block_till_done()
+    await async_flush_event_discovery(hass)
 
     # Verify entity was created
     ent_reg = er.async_get(hass)
@@ -316,8 +330,27 @@ async def test_existing_entities_restored_on_startup(hass: HomeAssistant) -> Non
     assert len(event_entities) == 1
 
     # Reload the entry - entities should be recreated from registry
-    await hass.config_entries.async_setup(MOCK_ENTRY.entry_id)
-    await hass.async_block_till_done()
+    with patch(
+        "homeassistant.helpers.entity_platform.EntityPlatform.async_add_entities",
+        autospec=True,
+        side_effect=EntityPlatform.async_add_entities,
+    ) as mock_add_entities:
+        await hass.config_entries.async_setup(MOCK_ENTRY.entry_id)
+        await hass.async_block_till_done()
+
+    # The event platform adds every known event type once in a single batch
+    event_batches = [
+        call.args[1]
+        for call in mock_add_entities.call_args_list
+        if call.args[0].domain == EVENT_DOMAIN
+    ]
+    assert len(event_batches) == 1
+    added_event_types = [entity.event_types[0] for entity in event_batches[0]]
+    assert sorted(added_event_types) == sorted(set(added_event_types))
+    assert TEST_EVENT_TYPE in added_event_types
+
+    # The registry index is shared with the webhook view
+    assert TEST_EVENT_TYPE in hass.data[DOMAIN][MOCK_ENTRY.entry_id][EVENT_TYPES]
 
     # Verify entity still exists with same entity_id
     event_entities = get_non_precreated_event_entities(ent_reg, MOCK_ENTRY.entry_id)
@@ -371,3 +404,181 @@ class TestZoomEventExtraStoredData:
         data = ZoomEventExtraStoredData.from_dict({})
         assert data.last_payload is None
         assert data.last_event_ts is None
+
+
+@pytest.mark.usefixtures("enable_custom_integrations")
+async def test_new_event_types_added_in_one_batch(hass: HomeAssistant) -> None:
+    """Test that event types discovered together are added as one deduplicated batch."""
+    MOCK_ENTRY.add_to_hass(hass)
+    assert await async_setup_component(hass, DOMAIN, {})
+    await hass.async_block_till_done()
+
+    from homeassistant.helpers.dispatcher import async_dispatcher_send
+
+    signal = f"{SIGNAL_NEW_ZOOM_EVENT_TYPE}|{MOCK_ENTRY.entry_id}"
+    event_types = ["meeting.started", "meeting.ended", "meeting.participant_joined"]
+    for event_type in event_types:
+        async_dispatcher_send(
+            hass,
+            signal,
+            event_type,
+            _create_test_event_data(MOCK_ENTRY.entry_id, event_type=event_type),
+        )
+    # A retry of an already queued event type must not produce a second entity
+    async_dispatcher_send(
+        hass,
+        signal,
+        "meeting.started",
+        _create_test_event_data(MOCK_ENTRY.entry_id, event_ts=2000000000),
+    )
+    await hass.async_block_till_done()
+
+    # Nothing is added until the discovery window has passed
+    ent_reg = er.async_get(hass)
+    assert not get_non_precreated_event_entities(ent_reg, MOCK_ENTRY.entry_id)
+
+    with patch(
+        "homeassistant.helpers.entity_platform.EntityPlatform.async_add_entities",
+        autospec=True,
+    ) as add_entities_mock:
+        await async_flush_event_discovery(hass)
+
+    assert add_entities_mock.call_count == 1
+    entities = add_entities_mock.call_args.args[1]
+    assert sorted(entity.unique_id.split("|")[1] for entity in entities) == sorted(
+        event_types
+    )
+
+    # The latest data seen while the event type was queued is used
+    started = next(e for e in entities if e.unique_id.endswith("meeting.started"))
+    assert started._init_data[ATTR_EVENT_TS] == 2000000000
+
+    # Event types that already have an entity or were already queued are ignored
+    with patch(
+        "homeassistant.helpers.entity_platform.EntityPlatform.async_add_entities",
+        autospec=True,
+    ) as add_entities_mock:
+        async_dispatcher_send(hass, signal, CONNECTIVITY_EVENT)
+        async_dispatcher_send(
+            hass,
+            signal,
+            "meeting.ended",
+            _create_test_event_data(
+                MOCK_ENTRY.entry_id, event_type="meeting.ended", event_ts=3000000000
+            ),
+        )
+        await async_flush_event_discovery(hass)
+
+    assert add_entities_mock.call_count == 0
+
+    # Until an added entity listens for its events, their type isn't in the index and
+    # the latest event becomes the initial data of the entity
+    known_event_types = hass.data[DOMAIN][MOCK_ENTRY.entry_id][EVENT_TYPES]
+    assert "meeting.ended" not in known_event_types
+    ended = next(e for e in entities if e.unique_id.endswith("meeting.ended"))
+    assert ended._init_data[ATTR_EVENT_TS] == 3000000000
+
+
+@pytest.mark.usefixtures("enable_custom_integrations")
+async def test_event_entities_preprovisioned_from_options(hass: HomeAssistant) -> None:
+    """Test that event types listed in the options get entities at setup."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data=MOCK_ENTRY.data,
+        options={
+            CONF_CONNECTIVITY_ON_STATUSES: DEFAULT_CONNECTIVITY_ON_STATUSES,
+            CONF_EVENT_TYPES: ["meeting.started", "meeting.ended"],
+        },
+        entry_id="preprovisioned",
+        unique_id="zoom_preprovisioned",
+        version=2,
+    )
+    entry.add_to_hass(hass)
+    assert await async_setup_component(hass, DOMAIN, {})
+    await hass.async_block_till_done()
+
+    ent_reg = er.async_get(hass)
+    event_entities = get_non_precreated_event_entities(ent_reg, entry.entry_id)
+    assert sorted(e.unique_id.split("|")[1] for e in event_entities) == [
+        "meeting.ended",
+        "meeting.started",
+    ]
+    assert all(e.disabled_by is None for e in event_entities)
+
+    # Event types added to the options later get entities without a reload
+    hass.config_entries.async_update_entry(
+        entry,
+        options={
+            **entry.options,
+            CONF_EVENT_TYPES: [
+                "meeting.started",
+                "meeting.ended",
+                "recording.completed",
+            ],
+        },
+    )
+    await async_flush_event_discovery(hass)
+
+    event_entities = get_non_precreated_event_entities(ent_reg, entry.entry_id)
+    assert len(event_entities) == 3
+
+
+def test_compact_payload() -> None:
+    """Test that restore data payloads are bounded in size."""
+    small = {"account_id": "account123", "object": {"id": "meeting123"}}
+    assert compact_payload(small) is small
+    assert compact_payload(None) is None
+
+    large = {
+        "account_id": "account123",
+        "object": {
+            "id": "meeting123",
+            "topic": "Test Meeting",
+            "participants": [{"id": str(i)} for i in range(1000)],
+        },
+        "extra": {"data": "x" * MAX_RESTORED_PAYLOAD_SIZE},
+    }
+    assert compact_payload(large) == {
+        "account_id": "account123",
+        "object": {"id": "meeting123", "topic": "Test Meeting"},
+    }
+
+    # Payloads whose scalar fields alone are too large aren't stored at all
+    assert compact_payload({"data": "x" * MAX_RESTORED_PAYLOAD_SIZE}) is None
+
+
+@pytest.mark.usefixtures("enable_custom_integrations")
+async def test_restore_data_only_rebuilt_on_change(hass: HomeAssistant) -> None:
+    """Test that restore data is reused until a new event arrives."""
+    MOCK_ENTRY.add_to_hass(hass)
+    assert await async_setup_component(hass, DOMAIN, {})
+    await hass.async_block_till_done()
+
+    from homeassistant.helpers.dispatcher import async_dispatcher_send
+
+    async_dispatcher_send(
+        hass,
+        f"{SIGNAL_NEW_ZOOM_EVENT_TYPE}|{MOCK_ENTRY.entry_id}",
+        TEST_EVENT_TYPE,
+        _create_test_event_data(MOCK_ENTRY.entry_id, event_ts=1000000000),
+    )
+    await async_flush_event_discovery(hass)
+
+    ent_reg = er.async_get(hass)
+    entity_id = get_non_precreated_event_entities(ent_reg, MOCK_ENTRY.entry_id)[
+        0
+    ].entity_id
+    entity = hass.data["entity_components"][EVENT_DOMAIN].get_entity(entity_id)
+
+    restore_data = entity.extra_restore_state_data
+    assert entity.extra_restore_state_data is restore_data
+
+    hass.bus.async_fire(
+        HA_ZOOM_EVENT,
+        _create_test_event_data(MOCK_ENTRY.entry_id, event_ts=2000000000),
+    )
+    await hass.async_block_till_done()
+
+    new_restore_data = entity.extra_restore_state_data
+    assert new_restore_data is not restore_data
+    assert new_restore_data.last_event_ts == 1000000000
@@ -1,13 +1,26 @@
 """Test zoom init."""
+import asyncio
+from unittest.mock import patch
+
 import pytest
 
 from homeassistant import config_entries
+from homeassistant.const import CONF_ID
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.config_entry_oauth2_flow import DATA_IMPLEMENTATIONS
 from homeassistant.setup import async_setup_component
+from homeassistant.util.async_ import get_scheduled_timer_handles
+from pytest_homeassistant_custom_component.common import MockConfigEntry
 
-from custom_components.zoom.common import ZoomOAuth2Implementation
-from custom_components.zoom.const import DOMAIN
+from custom_components.zoom.common import ZoomOAuth2Implementation, _get_keyed_hmac
+from custom_components.zoom.const import (
+    CONF_SECRET_TOKEN,
+    DOMAIN,
+    HA_URL,
+    STARTUP_TIMINGS,
+    USER_PROFILE_COORDINATOR,
+)
+from custom_components.zoom.models import ZoomProfile
 
 from .const import MOCK_CONFIG, MOCK_ENTRY
 
@@ -52,7 +65,91 @@ async def test_entry_setup_and_unload(hass: HomeAssistant) -> None:
         {},
     )
     assert MOCK_ENTRY.state == config_entries.ConfigEntryState.LOADED
+    # Key a HMAC with the secret token as a webhook request would
+    _get_keyed_hmac(MOCK_CONFIG[CONF_SECRET_TOKEN])
 
     assert await hass.config_entries.async_unload(MOCK_ENTRY.entry_id)
     await hass.async_block_till_done()
     assert MOCK_ENTRY.state == config_entries.ConfigEntryState.NOT_LOADED
+    # The secret token isn't kept in the signature cache
+    assert _get_keyed_hmac.cache_info().currsize == 0
+
+
+@pytest.mark.usefixtures("enable_custom_integrations")
+async def test_reload_does_not_leak(hass: HomeAssistant) -> None:
+    """Test that reloading an entry releases everything the previous setup created."""
+    MOCK_ENTRY.add_to_hass(hass)
+    assert await async_setup_component(hass, DOMAIN, {})
+    await hass.async_block_till_done()
+    assert MOCK_ENTRY.state == config_entries.ConfigEntryState.LOADED
+
+    def _active_timers() -> int:
+        return sum(
+            not handle.cancelled() for handle in get_scheduled_timer_handles(hass.loop)
+        )
+
+    listeners = hass.bus.async_listeners()
+    timers = _active_timers()
+    tasks = len(asyncio.all_tasks())
+
+    for _ in range(3):
+        assert await hass.config_entries.async_reload(MOCK_ENTRY.entry_id)
+        await hass.async_block_till_done()
+        assert MOCK_ENTRY.state == config_entries.ConfigEntryState.LOADED
+
+        assert hass.bus.async_listeners() == listeners
+        assert _active_timers() == timers
+        assert len(asyncio.all_tasks()) == tasks
+
+    # The webhook view is only registered once no matter how often we reload
+    webhook_routes = [
+        route
+        for route in hass.http.app.router.routes()
+        if route.resource.canonical == HA_URL and route.method == "POST"
+    ]
+    assert len(webhook_routes) == 1
+
+    # Unloading removes the platforms' listeners and pollers as well
+    assert await hass.config_entries.async_unload(MOCK_ENTRY.entry_id)
+    await hass.async_block_till_done()
+    assert _active_timers() < timers
+    assert MOCK_ENTRY.entry_id not in hass.data[DOMAIN]
+
+
+@pytest.mark.usefixtures("enable_custom_integrations")
+async def test_startup_fetches_profile_once(hass: HomeAssistant) -> None:
+    """Test that setup fetches the profile once and only writes changed data."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={**MOCK_ENTRY.data, CONF_ID: "test"},
+        entry_id="startup",
+        unique_id="zoom_startup",
+        version=2,
+    )
+    entry.add_to_hass(hass)
+
+    with (
+        patch(
+            "custom_components.zoom.ZoomAPI.async_get_my_user_profile",
+            return_value={"id": "test"},
+        ) as profile_mock,
+        patch.object(
+            hass.config_entries,
+            "async_update_entry",
+            wraps=hass.config_entries.async_update_entry,
+        ) as update_entry_mock,
+    ):
+        assert await async_setup_component(hass, DOMAIN, {})
+        await hass.async_block_till_done()
+
+    assert entry.state == config_entries.ConfigEntryState.LOADED
+    assert profile_mock.call_count == 1
+    assert not any(call.kwargs.get("data") for call in update_entry_mock.call_args_list)
+
+    coordinator = hass.data[DOMAIN][entry.entry_id][USER_PROFILE_COORDINATOR]
+    assert coordinator.data == ZoomProfile(id="test")
+    assert set(hass.data[DOMAIN][entry.entry_id][STARTUP_TIMINGS]) == {
+        "profile",
+        "platforms",
+        "total",
+    }
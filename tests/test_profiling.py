@@ -0,0 +1,95 @@
+"""Test Zoom profiling services."""
+
+from datetime import timedelta
+from pathlib import Path
+
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.setup import async_setup_component
+import homeassistant.util.dt as dt_util
+import pytest
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+
+from custom_components.zoom.const import DATA_PROFILER, DOMAIN, HA_URL
+
+from .const import MOCK_ENTRY
+
+
+@pytest.mark.usefixtures("enable_custom_integrations")
+async def test_profiling(
+    hass: HomeAssistant, hass_client: pytest.fixture, tmp_path: Path
+) -> None:
+    """Test spans are only collected between starting and stopping profiling."""
+    hass.config.config_dir = str(tmp_path)
+    MOCK_ENTRY.add_to_hass(hass)
+    assert await async_setup_component(hass, DOMAIN, {})
+    await hass.async_block_till_done()
+
+    profiler = hass.data[DATA_PROFILER]
+    client = await hass_client()
+
+    # Nothing is collected while profiling is off
+    await client.post(HA_URL, data="{}")
+    assert not profiler.enabled
+    assert profiler.spans == {}
+
+    await hass.services.async_call(
+        DOMAIN, "start_profiling", {"cprofile": True}, blocking=True
+    )
+    assert profiler.enabled
+    with pytest.raises(ServiceValidationError):
+        await hass.services.async_call(DOMAIN, "start_profiling", {}, blocking=True)
+
+    await client.post(HA_URL, data="{}")
+    await hass.services.async_call(DOMAIN, "stop_profiling", {}, blocking=True)
+
+    assert not profiler.enabled
+    report = profiler.last_report
+    assert report["spans"]["webhook.total"]["count"] == 1
+    assert Path(report["stats_file"]).parent == tmp_path
+    assert Path(report["stats_file"]).exists()
+
+    with pytest.raises(ServiceValidationError):
+        await hass.services.async_call(DOMAIN, "stop_profiling", {}, blocking=True)
+
+
+@pytest.mark.usefixtures("enable_custom_integrations")
+async def test_profiling_stops_after_duration(hass: HomeAssistant) -> None:
+    """Test profiling stops by itself once the requested duration is over."""
+    MOCK_ENTRY.add_to_hass(hass)
+    assert await async_setup_component(hass, DOMAIN, {})
+    await hass.async_block_till_done()
+
+    profiler = hass.data[DATA_PROFILER]
+    await hass.services.async_call(
+        DOMAIN, "start_profiling", {"duration": 60}, blocking=True
+    )
+    assert profiler.enabled
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=61))
+    await hass.async_block_till_done()
+
+    assert not profiler.enabled
+    assert profiler.last_report["stats_file"] is None
+
+
+@pytest.mark.usefixtures("enable_custom_integrations")
+async def test_profiling_stops_on_shutdown(hass: HomeAssistant, tmp_path: Path) -> None:
+    """Test a running profiling session writes its stats when Home Assistant stops."""
+    hass.config.config_dir = str(tmp_path)
+    MOCK_ENTRY.add_to_hass(hass)
+    assert await async_setup_component(hass, DOMAIN, {})
+    await hass.async_block_till_done()
+
+    profiler = hass.data[DATA_PROFILER]
+    await hass.services.async_call(
+        DOMAIN, "start_profiling", {"cprofile": True}, blocking=True
+    )
+    assert profiler.enabled
+
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_STOP)
+    await hass.async_block_till_done()
+
+    assert not profiler.enabled
+    assert Path(profiler.last_report["stats_file"]).exists()
@@ -0,0 +1,116 @@
+"""Test Zoom poll scheduler."""
+
+import asyncio
+from unittest.mock import patch
+
+from aiohttp import ClientConnectionError
+from homeassistant.core import HomeAssistant
+import homeassistant.util.dt as dt_util
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+
+from custom_components.zoom.scheduler import POLL_INTERVAL, ZoomPollScheduler
+
+
+async def _async_next_slot(hass: HomeAssistant, wait_for_poll: bool = True) -> None:
+    """Move time past the next poll slot, however it was jittered."""
+    async_fire_time_changed(hass, dt_util.utcnow() + POLL_INTERVAL * 2)
+    await hass.async_block_till_done(wait_background_tasks=wait_for_poll)
+
+
+async def test_polls_spread_round_robin(hass: HomeAssistant) -> None:
+    """Test pollers are polled one at a time, each once per interval."""
+    scheduler = ZoomPollScheduler(hass)
+    polled = []
+
+    def _poller(name: str):
+        async def _poll() -> None:
+            polled.append(name)
+
+        return _poll
+
+    with patch("custom_components.zoom.scheduler.uniform", return_value=0):
+        unregister = [scheduler.async_register(name, _poller(name)) for name in "abc"]
+        assert scheduler.spacing == POLL_INTERVAL.total_seconds() / 3
+
+        for _ in range(4):
+            await _async_next_slot(hass)
+        assert polled == ["a", "b", "c", "a"]
+        assert scheduler.as_dict()["polls"] == 4
+
+        # Removed pollers aren't polled anymore
+        unregister[1]()
+        for _ in range(2):
+            await _async_next_slot(hass)
+        assert polled[4:] == ["c", "a"]
+
+        for remove in (unregister[0], unregister[2]):
+            remove()
+        await _async_next_slot(hass)
+        assert len(polled) == 6
+        assert scheduler.as_dict()["pollers"] == 0
+
+
+async def test_slow_poll_skipped(hass: HomeAssistant) -> None:
+    """Test a poller isn't polled again while its last poll is still running."""
+    scheduler = ZoomPollScheduler(hass)
+    release = asyncio.Event()
+
+    async def _poll() -> None:
+        await release.wait()
+
+    unregister = scheduler.async_register("slow", _poll)
+    await _async_next_slot(hass, wait_for_poll=False)
+    await _async_next_slot(hass, wait_for_poll=False)
+    assert scheduler.skipped == 1
+
+    release.set()
+    await hass.async_block_till_done(wait_background_tasks=True)
+    await _async_next_slot(hass)
+    unregister()
+    assert scheduler.as_dict()["polls"] == 2
+    assert scheduler.as_dict()["durations"]["count"] == 2
+
+
+async def test_outage_reconciled_in_one_pass(hass: HomeAssistant) -> None:
+    """Test only one poll per interval probes Zoom while it can't be reached."""
+    scheduler = ZoomPollScheduler(hass)
+    reachable = False
+    polled = []
+    unreachable = []
+
+    def _poller(name: str):
+        async def _poll() -> None:
+            polled.append(name)
+            if not reachable:
+                raise ClientConnectionError
+
+        return _poll
+
+    with patch("custom_components.zoom.scheduler.uniform", return_value=0):
+        unregister = [
+            scheduler.async_register(
+                name, _poller(name), lambda name=name: unreachable.append(name)
+            )
+            for name in "abc"
+        ]
+        await _async_next_slot(hass)
+        assert polled == ["a"]
+        # Every poller is told, not only the one whose poll failed
+        assert sorted(unreachable) == ["a", "b", "c"]
+        assert scheduler.outage
+        assert scheduler.spacing == POLL_INTERVAL.total_seconds()
+
+        await _async_next_slot(hass)
+        assert polled == ["a", "b"]
+        assert scheduler.as_dict()["outages"] == 1
+
+        # The probe that reaches Zoom again is followed by everyone else's poll
+        reachable = True
+        await _async_next_slot(hass)
+        assert polled[2] == "c"
+        assert sorted(polled[3:]) == ["a", "b"]
+        assert not scheduler.outage
+        assert scheduler.spacing == POLL_INTERVAL.total_seconds() / 3
+
+        for remove in unregister:
+            remove()
@@ -0,0 +1,373 @@
+"""Test Zoom sensor platform."""
+
+from datetime import date, timedelta
+import time
+from unittest.mock import patch
+
+from freezegun.api import FrozenDateTimeFactory
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import HomeAssistant
+from homeassistant.setup import async_setup_component
+import homeassistant.util.dt as dt_util
+import pytest
+from pytest_homeassistant_custom_component.common import (
+    async_capture_events,
+    async_fire_time_changed,
+)
+
+from custom_components.zoom.const import (
+    ATTR_EVENT,
+    ATTR_EVENT_TS,
+    ATTR_PAYLOAD,
+    CONNECTIVITY_EVENT,
+    DOMAIN,
+    HA_ZOOM_EVENT,
+    MEETING_ENDED_EVENT,
+    MEETING_STARTED_EVENT,
+    METRICS,
+    PARTICIPANT_JOINED_EVENT,
+    PARTICIPANT_LEFT_EVENT,
+)
+from custom_components.zoom.sensor import DELIVERY_LAG_UPDATE_INTERVAL
+
+from .const import MOCK_ENTRY
+
+ACTIVE_MEETINGS_ENTITY_ID = "sensor.zoom_test_active_meetings"
+DELIVERY_LAG_ENTITY_ID = "sensor.zoom_test_webhook_delivery_lag"
+TIME_TODAY_ENTITY_ID = "sensor.zoom_test_time_in_meeting_today"
+TIME_WEEK_ENTITY_ID = "sensor.zoom_test_time_in_meeting_this_week"
+MEETINGS_TODAY_ENTITY_ID = "sensor.zoom_test_meetings_today"
+
+
+def _fire_meeting_event(
+    hass: HomeAssistant,
+    event_type: str,
+    meeting_id: str = "meeting123",
+    participant_id: str | None = None,
+    entry_id: str = MOCK_ENTRY.entry_id,
+) -> None:
+    """Fire a meeting webhook event on the bus."""
+    obj = {"id": meeting_id, "topic": "Test Meeting"}
+    if participant_id:
+        obj["participant"] = {"user_id": participant_id, "user_name": "Test User"}
+    hass.bus.async_fire(
+        HA_ZOOM_EVENT,
+        {
+            ATTR_EVENT: event_type,
+            ATTR_EVENT_TS: 1234567890,
+            ATTR_PAYLOAD: {"account_id": "account123", "object": obj},
+            "ha_config_entry_id": entry_id,
+        },
+    )
+
+
+@pytest.mark.usefixtures("enable_custom_integrations")
+async def test_active_meetings_sensor(hass: HomeAssistant) -> None:
+    """Test that the active meetings sensor follows meeting events."""
+    MOCK_ENTRY.add_to_hass(hass)
+    assert await async_setup_component(hass, DOMAIN, {})
+    await hass.async_block_till_done()
+
+    state = hass.states.get(ACTIVE_MEETINGS_ENTITY_ID)
+    assert state.state == "0"
+
+    _fire_meeting_event(hass, MEETING_STARTED_EVENT)
+    _fire_meeting_event(hass, PARTICIPANT_JOINED_EVENT, participant_id="user1")
+    _fire_meeting_event(hass, PARTICIPANT_JOINED_EVENT, participant_id="user2")
+    # Participants of a meeting that started before we were listening
+    _fire_meeting_event(
+        hass, PARTICIPANT_JOINED_EVENT, meeting_id="meeting456", participant_id="user3"
+    )
+    # Events for other config entries are ignored
+    _fire_meeting_event(hass, MEETING_STARTED_EVENT, "meeting789", entry_id="other")
+    await hass.async_block_till_done()
+
+    state = hass.states.get(ACTIVE_MEETINGS_ENTITY_ID)
+    assert state.state == "2"
+    assert state.attributes["participants"] == 3
+    assert state.attributes["meetings"]["meeting123"] == {
+        "topic": "Test Meeting",
+        "participants": 2,
+    }
+    assert state.attributes["meetings"]["meeting456"]["participants"] == 1
+
+    _fire_meeting_event(hass, PARTICIPANT_LEFT_EVENT, participant_id="user1")
+    _fire_meeting_event(hass, MEETING_ENDED_EVENT, meeting_id="meeting456")
+    await hass.async_block_till_done()
+
+    state = hass.states.get(ACTIVE_MEETINGS_ENTITY_ID)
+    assert state.state == "1"
+    assert state.attributes["meetings"] == {
+        "meeting123": {"topic": "Test Meeting", "participants": 1}
+    }
+
+
+@pytest.mark.usefixtures("enable_custom_integrations")
+async def test_active_meetings_late_events(hass: HomeAssistant) -> None:
+    """Test events delivered after meeting.ended don't bring the meeting back."""
+    MOCK_ENTRY.add_to_hass(hass)
+    assert await async_setup_component(hass, DOMAIN, {})
+    await hass.async_block_till_done()
+
+    _fire_meeting_event(hass, MEETING_STARTED_EVENT)
+    _fire_meeting_event(hass, PARTICIPANT_JOINED_EVENT, participant_id="user1")
+    _fire_meeting_event(hass, MEETING_ENDED_EVENT)
+    _fire_meeting_event(hass, PARTICIPANT_LEFT_EVENT, participant_id="user1")
+    _fire_meeting_event(hass, PARTICIPANT_JOINED_EVENT, participant_id="user2")
+    # Leaving a meeting we never saw doesn't add it either
+    _fire_meeting_event(
+        hass, PARTICIPANT_LEFT_EVENT, meeting_id="meeting456", participant_id="user3"
+    )
+    await hass.async_block_till_done()
+    assert hass.states.get(ACTIVE_MEETINGS_ENTITY_ID).state == "0"
+
+    # Recurring meetings reuse their ID, so the meeting can start again
+    _fire_meeting_event(hass, MEETING_STARTED_EVENT)
+    await hass.async_block_till_done()
+    assert hass.states.get(ACTIVE_MEETINGS_ENTITY_ID).state == "1"
+
+
+@pytest.mark.usefixtures("enable_custom_integrations")
+async def test_active_meetings_restored_from_snapshot(
+    hass: HomeAssistant, hass_storage: dict, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test that active meetings are rebuilt from the persisted snapshot."""
+    hass_storage[f"{DOMAIN}.{MOCK_ENTRY.entry_id}.meetings"] = {
+        "version": 1,
+        "minor_version": 1,
+        "key": f"{DOMAIN}.{MOCK_ENTRY.entry_id}.meetings",
+        "data": {
+            "meetings": {
+                "meeting123": {
+                    "topic": "Restored Meeting",
+                    "start_time": "2024-01-01T00:00:00Z",
+                    "participants": ["user1", "user2"],
+                }
+            },
+            "recently_ended": ["meeting456"],
+        },
+    }
+    MOCK_ENTRY.add_to_hass(hass)
+    assert await async_setup_component(hass, DOMAIN, {})
+    await hass.async_block_till_done()
+
+    state = hass.states.get(ACTIVE_MEETINGS_ENTITY_ID)
+    assert state.state == "1"
+    assert state.attributes["meetings"]["meeting123"] == {
+        "topic": "Restored Meeting",
+        "participants": 2,
+    }
+
+    _fire_meeting_event(hass, PARTICIPANT_LEFT_EVENT, participant_id="user2")
+    # Meetings that ended before the restart stay ended
+    _fire_meeting_event(
+        hass, PARTICIPANT_JOINED_EVENT, meeting_id="meeting456", participant_id="user3"
+    )
+    await hass.async_block_till_done()
+    state = hass.states.get(ACTIVE_MEETINGS_ENTITY_ID)
+    assert state.state == "1"
+    assert state.attributes["participants"] == 1
+
+    # Ended meetings are persisted along with the active ones
+    _fire_meeting_event(hass, MEETING_ENDED_EVENT)
+    await _async_move_to(hass, freezer, dt_util.utcnow() + timedelta(minutes=1))
+    assert hass_storage[f"{DOMAIN}.{MOCK_ENTRY.entry_id}.meetings"]["data"] == {
+        "meetings": {},
+        "recently_ended": ["meeting456", "meeting123"],
+    }
+
+
+@pytest.mark.usefixtures("enable_custom_integrations")
+async def test_delivery_lag_sensor(hass: HomeAssistant) -> None:
+    """Test that the delivery lag sensor tracks the lag of recent webhook events."""
+    MOCK_ENTRY.add_to_hass(hass)
+    assert await async_setup_component(hass, DOMAIN, {})
+    await hass.async_block_till_done()
+
+    state = hass.states.get(DELIVERY_LAG_ENTITY_ID)
+    assert state.state == "unknown"
+    assert state.attributes["samples"] == 0
+
+    hass.data[DOMAIN][MOCK_ENTRY.entry_id][METRICS].stale_timestamps += 1
+    state_changes = async_capture_events(hass, EVENT_STATE_CHANGED)
+    now_ms = int(time.time() * 1000)
+    for lag_ms in (*([200] * 18), 3000, 40000):
+        hass.bus.async_fire(
+            HA_ZOOM_EVENT,
+            {
+                ATTR_EVENT: MEETING_STARTED_EVENT,
+                ATTR_EVENT_TS: now_ms - lag_ms,
+                ATTR_PAYLOAD: {},
+                "ha_config_entry_id": MOCK_ENTRY.entry_id,
+            },
+        )
+    # Events for other config entries are ignored
+    hass.bus.async_fire(
+        HA_ZOOM_EVENT,
+        {
+            ATTR_EVENT: MEETING_STARTED_EVENT,
+            ATTR_EVENT_TS: 0,
+            ATTR_PAYLOAD: {},
+            "ha_config_entry_id": "other",
+        },
+    )
+    # Events without a usable timestamp are ignored
+    hass.bus.async_fire(
+        HA_ZOOM_EVENT,
+        {
+            ATTR_EVENT: MEETING_STARTED_EVENT,
+            ATTR_EVENT_TS: "soon",
+            ATTR_PAYLOAD: {},
+            "ha_config_entry_id": MOCK_ENTRY.entry_id,
+        },
+    )
+    hass.bus.async_fire(
+        HA_ZOOM_EVENT,
+        {
+            ATTR_EVENT: MEETING_STARTED_EVENT,
+            ATTR_PAYLOAD: {},
+            "ha_config_entry_id": MOCK_ENTRY.entry_id,
+        },
+    )
+    await hass.async_block_till_done()
+
+    # The state is only written on the next update, once for all the events
+    assert hass.states.get(DELIVERY_LAG_ENTITY_ID).attributes["samples"] == 0
+    async_fire_time_changed(hass, dt_util.utcnow() + DELIVERY_LAG_UPDATE_INTERVAL)
+    await hass.async_block_till_done()
+    assert [
+        event
+        for event in state_changes
+        if event.data["entity_id"] == DELIVERY_LAG_ENTITY_ID
+    ] == [state_changes[-1]]
+
+    state = hass.states.get(DELIVERY_LAG_ENTITY_ID)
+    # Percentiles are reported as the upper bound of their histogram bucket
+    assert float(state.state) == 250
+    assert state.attributes["p95"] == 5000
+    assert 40000 <= state.attributes["max"] < 41000
+    assert state.attributes["samples"] == 20
+    assert state.attributes["stale_timestamps"] == 1
+
+
+def _fire_presence_event(hass: HomeAssistant, status: str) -> None:
+    """Fire a presence event for the authenticated user."""
+    hass.bus.async_fire(
+        HA_ZOOM_EVENT,
+        {
+            ATTR_EVENT: CONNECTIVITY_EVENT,
+            ATTR_EVENT_TS: int(dt_util.utcnow().timestamp() * 1000),
+            ATTR_PAYLOAD: {"object": {"id": "test", "presence_status": status}},
+            "ha_config_entry_id": MOCK_ENTRY.entry_id,
+        },
+    )
+
+
+async def _async_move_to(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory, when
+) -> None:
+    """Move time forward and let the time interval listeners run."""
+    freezer.move_to(when)
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+
+
+@pytest.mark.usefixtures("enable_custom_integrations")
+async def test_presence_statistics_sensors(
+    hass: HomeAssistant, hass_storage: dict, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test that time in meeting and meeting counts follow status changes."""
+    start = dt_util.start_of_local_day(date(2026, 1, 5)) + timedelta(hours=23)
+    freezer.move_to(start)
+    MOCK_ENTRY.add_to_hass(hass)
+    with patch(
+        "custom_components.zoom.api.ZoomAPI.async_get_contact_user_profile",
+        return_value={"id": "test", "presence_status": "Available"},
+    ):
+        assert await async_setup_component(hass, DOMAIN, {})
+        await hass.async_block_till_done(wait_background_tasks=True)
+    assert hass.states.get(TIME_TODAY_ENTITY_ID).state == "0.0"
+    assert hass.states.get(MEETINGS_TODAY_ENTITY_ID).state == "0"
+
+    _fire_presence_event(hass, "In_Meeting")
+    await hass.async_block_till_done()
+    assert hass.states.get(MEETINGS_TODAY_ENTITY_ID).state == "1"
+
+    # Time in the current status is added while it lasts
+    await _async_move_to(hass, freezer, start + timedelta(minutes=30))
+    assert hass.states.get(TIME_TODAY_ENTITY_ID).state == "0.5"
+
+    _fire_presence_event(hass, "Available")
+    await hass.async_block_till_done()
+
+    # Today's totals start over at midnight, the week's don't
+    await _async_move_to(hass, freezer, start + timedelta(minutes=75))
+    assert hass.states.get(TIME_TODAY_ENTITY_ID).state == "0.0"
+    assert hass.states.get(TIME_TODAY_ENTITY_ID).attributes["statuses"] == {
+        "Available": 0.25
+    }
+    assert hass.states.get(MEETINGS_TODAY_ENTITY_ID).state == "0"
+    state = hass.states.get(TIME_WEEK_ENTITY_ID)
+    assert state.state == "0.5"
+    assert state.attributes["meetings"] == 1
+    assert state.attributes["statuses"] == {"Available": 0.75, "In_Meeting": 0.5}
+
+    # The totals are persisted
+    data = hass_storage[f"{DOMAIN}.{MOCK_ENTRY.entry_id}.presence"]["data"]
+    assert data["days"]["2026-01-05"]["on_seconds"] == 1800
+    assert data["is_on"] is False
+
+
+@pytest.mark.usefixtures("enable_custom_integrations")
+async def test_presence_statistics_restored(
+    hass: HomeAssistant, hass_storage: dict, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test that the totals survive a restart during a meeting."""
+    start = dt_util.start_of_local_day(date(2026, 1, 5)) + timedelta(hours=12)
+    freezer.move_to(start)
+    hass_storage[f"{DOMAIN}.{MOCK_ENTRY.entry_id}.presence"] = {
+        "version": 1,
+        "minor_version": 1,
+        "key": f"{DOMAIN}.{MOCK_ENTRY.entry_id}.presence",
+        "data": {
+            "is_on": True,
+            "days": {
+                "2026-01-05": {
+                    "statuses": {"In_Meeting": 3600},
+                    "on_seconds": 3600,
+                    "meetings": 2,
+                }
+            },
+        },
+    }
+    MOCK_ENTRY.add_to_hass(hass)
+    with patch(
+        "custom_components.zoom.api.ZoomAPI.async_get_contact_user_profile",
+        return_value={"id": "test", "presence_status": "In_Meeting"},
+    ):
+        assert await async_setup_component(hass, DOMAIN, {})
+        await hass.async_block_till_done(wait_background_tasks=True)
+
+    # The meeting that was going on before the restart isn't counted again
+    assert hass.states.get(MEETINGS_TODAY_ENTITY_ID).state == "2"
+    await _async_move_to(hass, freezer, start + timedelta(minutes=30))
+    assert hass.states.get(TIME_TODAY_ENTITY_ID).state == "1.5"
+
+
+@pytest.mark.usefixtures("enable_custom_integrations")
+async def test_snapshots_not_written_after_removal(
+    hass: HomeAssistant, hass_storage: dict, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test pending snapshot writes don't recreate them after the entry is removed."""
+    MOCK_ENTRY.add_to_hass(hass)
+    assert await async_setup_component(hass, DOMAIN, {})
+    await hass.async_block_till_done()
+
+    _fire_meeting_event(hass, MEETING_STARTED_EVENT)
+    _fire_presence_event(hass, "In_Meeting")
+    await hass.async_block_till_done()
+
+    assert await hass.config_entries.async_remove(MOCK_ENTRY.entry_id)
+    await _async_move_to(hass, freezer, dt_util.utcnow() + timedelta(minutes=1))
+    assert f"{DOMAIN}.{MOCK_ENTRY.entry_id}.meetings" not in hass_storage
+    assert f"{DOMAIN}.{MOCK_ENTRY.entry_id}.presence" not in hass_storage
@@ -0,0 +1,111 @@
+"""Test Zoom automation triggers."""
+
+from homeassistant.components.automation import DOMAIN as AUTOMATION_DOMAIN
+from homeassistant.core import HomeAssistant
+from homeassistant.setup import async_setup_component
+import pytest
+from pytest_homeassistant_custom_component.common import async_mock_service
+
+from custom_components.zoom.const import (
+    ATTR_EVENT,
+    ATTR_EVENT_TS,
+    ATTR_PAYLOAD,
+    DATA_TRIGGER_INDEX,
+    DOMAIN,
+    HA_ZOOM_EVENT,
+)
+
+from .const import MOCK_ENTRY
+
+
+def _fire_zoom_event(
+    hass: HomeAssistant,
+    event_type: str,
+    meeting_id: str = "meeting123",
+    entry_id: str = MOCK_ENTRY.entry_id,
+) -> None:
+    """Fire a Zoom webhook event on the bus."""
+    hass.bus.async_fire(
+        HA_ZOOM_EVENT,
+        {
+            ATTR_EVENT: event_type,
+            ATTR_EVENT_TS: 1234567890,
+            ATTR_PAYLOAD: {"object": {"id": meeting_id}},
+            "ha_config_entry_id": entry_id,
+        },
+    )
+
+
+@pytest.mark.usefixtures("enable_custom_integrations")
+async def test_zoom_trigger(hass: HomeAssistant) -> None:
+    """Test that Zoom triggers only run for matching events."""
+    calls = async_mock_service(hass, "test", "automation")
+    listeners_before = hass.bus.async_listeners().get(HA_ZOOM_EVENT, 0)
+    assert await async_setup_component(
+        hass,
+        AUTOMATION_DOMAIN,
+        {
+            AUTOMATION_DOMAIN: [
+                {
+                    "trigger": {
+                        "platform": DOMAIN,
+                        "event_type": "meeting.started",
+                        "config_entry_id": MOCK_ENTRY.entry_id,
+                        "payload": {"object.id": "MEETING123"},
+                    },
+                    "action": {
+                        "service": "test.automation",
+                        "data_template": {
+                            "id": "{{ trigger.payload.object.id }}",
+                            "event_type": "{{ trigger.event_type }}",
+                        },
+                    },
+                },
+                {
+                    "trigger": {
+                        "platform": DOMAIN,
+                        "event_type": ["meeting.started", "meeting.ended"],
+                    },
+                    "action": {
+                        "service": "test.automation",
+                        "data_template": {"id": "any_{{ trigger.event_type }}"},
+                    },
+                },
+            ]
+        },
+    )
+    await hass.async_block_till_done()
+
+    # All Zoom triggers share a single bus listener
+    assert hass.bus.async_listeners()[HA_ZOOM_EVENT] == listeners_before + 1
+
+    _fire_zoom_event(hass, "meeting.started")
+    await hass.async_block_till_done()
+    assert sorted(call.data["id"] for call in calls) == [
+        "any_meeting.started",
+        "meeting123",
+    ]
+
+    # Payload fields, config entry and event type must all match
+    calls.clear()
+    _fire_zoom_event(hass, "meeting.started", meeting_id="other")
+    _fire_zoom_event(hass, "meeting.started", entry_id="other_entry")
+    _fire_zoom_event(hass, "meeting.participant_joined")
+    await hass.async_block_till_done()
+    assert [call.data["id"] for call in calls] == [
+        "any_meeting.started",
+        "any_meeting.started",
+    ]
+
+    calls.clear()
+    _fire_zoom_event(hass, "meeting.ended")
+    await hass.async_block_till_done()
+    assert [call.data["id"] for call in calls] == ["any_meeting.ended"]
+
+    # Removing the automations removes the shared listener
+    await hass.services.async_call(
+        AUTOMATION_DOMAIN, "turn_off", {"entity_id": "all"}, blocking=True
+    )
+    await hass.async_block_till_done()
+    assert hass.bus.async_listeners().get(HA_ZOOM_EVENT, 0) == listeners_before
+    assert not hass.data[DATA_TRIGGER_INDEX]._matchers
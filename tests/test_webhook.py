@@ -3,29 +3,55 @@
 import hashlib
 import hmac
 import json
+import logging
 import time
 from unittest.mock import patch
 
 import pytest
-from aiohttp import ClientSession
+import voluptuous as vol
+from aiohttp import ClientResponseError, ClientSession
 from aiohttp.test_utils import TestClient
 
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.const import CONF_NAME
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers import entity_registry as er
 from homeassistant.setup import async_setup_component
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_capture_events,
+)
 
+from custom_components.zoom.common import (
+    MAX_PAYLOAD_DEPTH,
+    MAX_PAYLOAD_KEYS,
+    MAX_STALE_ATTRIBUTED_SIZE,
+    validate_webhook_data,
+)
 from custom_components.zoom.const import (
     ATTR_EVENT,
     ATTR_EVENT_TS,
     ATTR_PAYLOAD,
+    CONF_ALLOWED_NETWORKS,
+    CONF_CONNECTIVITY_ON_STATUSES,
     CONF_SECRET_TOKEN,
+    CONF_WEBHOOK_RATE_LIMIT,
     CONNECTIVITY_EVENT,
+    DATA_WEBHOOK_METRICS,
+    DEFAULT_CONNECTIVITY_ON_STATUSES,
     DOMAIN,
     HA_URL,
+    METRICS,
     VALIDATION_EVENT,
 )
+from custom_components.zoom.limiter import BURST_SECONDS
 
-from .const import MOCK_CONFIG, MOCK_ENTRY, get_non_precreated_event_entities
+from .const import (
+    MOCK_CONFIG,
+    MOCK_ENTRY,
+    async_flush_event_discovery,
+    get_non_precreated_event_entities,
+)
 
 # Test secret token
 SECRET_TOKEN = MOCK_CONFIG[CONF_SECRET_TOKEN]
@@ -144,6 +170,23 @@ async def test_webhook_stale_timestamp(
     )
 
     assert response.status == 200
+    # The request is counted against the config entry that signed it
+    assert hass.data[DOMAIN][MOCK_ENTRY.entry_id][METRICS].stale_timestamps == 1
+
+    # Bodies too large to be worth attributing are rejected without being counted
+    payload["payload"]["padding"] = "x" * MAX_STALE_ATTRIBUTED_SIZE
+    body = json.dumps(payload)
+    response = await client.post(
+        HA_URL,
+        data=body,
+        headers={
+            "Content-Type": "application/json",
+            "x-zm-signature": _generate_signature(SECRET_TOKEN, stale_timestamp, body),
+            "x-zm-request-timestamp": stale_timestamp,
+        },
+    )
+    assert response.status == 200
+    assert hass.data[DOMAIN][MOCK_ENTRY.entry_id][METRICS].stale_timestamps == 1
     # No new entities should be created due to stale timestamp
     ent_reg = er.async_get(hass)
     event_entities = get_non_precreated_event_entities(ent_reg, MOCK_ENTRY.entry_id)
@@ -244,6 +287,19 @@ async def test_webhook_wrong_signature(
     event_entities = get_non_precreated_event_entities(ent_reg, MOCK_ENTRY.entry_id)
     assert len(event_entities) == 0
 
+    # Bodies are only decoded once their signature matches a secret token
+    body = "not valid json {"
+    await client.post(
+        HA_URL,
+        data=body,
+        headers={
+            "Content-Type": "application/json",
+            "x-zm-signature": _generate_signature("wrong_token", timestamp, body),
+            "x-zm-request-timestamp": timestamp,
+        },
+    )
+    assert hass.data[DATA_WEBHOOK_METRICS].outcomes == {"unmatched_signature": 2}
+
 
 @pytest.mark.usefixtures("enable_custom_integrations")
 async def test_webhook_valid_event_creates_entity(
@@ -275,7 +331,7 @@ async def test_webhook_valid_event_creates_entity(
     )
 
     assert response.status == 200
-    await hass.async_block_till_done()
+    await async_flush_event_discovery(hass)
 
     # Event entity should be created (excluding pre-created disabled entities)
     ent_reg = er.async_get(hass)
@@ -284,6 +340,41 @@ async def test_webhook_valid_event_creates_entity(
     assert TEST_WEBHOOK_EVENT in event_entities[0].unique_id
 
 
+@pytest.mark.usefixtures("enable_custom_integrations")
+async def test_webhook_entry_not_set_up(
+    hass: HomeAssistant, hass_client: pytest.fixture
+) -> None:
+    """Test events for a config entry that failed to set up are only fired."""
+    MOCK_ENTRY.add_to_hass(hass)
+    with patch(
+        "custom_components.zoom.ZoomAPI.async_get_my_user_profile",
+        side_effect=ClientResponseError(None, (), status=401),
+    ):
+        assert await async_setup_component(hass, DOMAIN, {})
+        await hass.async_block_till_done()
+    assert MOCK_ENTRY.state is ConfigEntryState.SETUP_ERROR
+
+    client: TestClient = await hass_client()
+    events_fired = async_capture_events(hass, "zoom_webhook")
+
+    timestamp = str(int(time.time()))
+    body = json.dumps(
+        _create_webhook_payload(TEST_WEBHOOK_EVENT, payload=_create_meeting_payload())
+    )
+    response = await client.post(
+        HA_URL,
+        data=body,
+        headers={
+            "Content-Type": "application/json",
+            "x-zm-signature": _generate_signature(SECRET_TOKEN, timestamp, body),
+            "x-zm-request-timestamp": timestamp,
+        },
+    )
+    assert response.status == 200
+    await hass.async_block_till_done()
+    assert len(events_fired) == 1
+
+
 @pytest.mark.usefixtures("enable_custom_integrations")
 async def test_webhook_url_validation(
     hass: HomeAssistant, hass_client: pytest.fixture
@@ -395,7 +486,7 @@ async def test_webhook_no_duplicate_entities(
         },
     )
     assert response.status == 200
-    await hass.async_block_till_done()
+    await async_flush_event_discovery(hass)
 
     # Send second event of same type
     timestamp2 = str(int(time.time()))
@@ -424,6 +515,43 @@ async def test_webhook_no_duplicate_entities(
     assert len(event_entities) == 1
 
 
+@pytest.mark.usefixtures("enable_custom_integrations")
+async def test_webhook_latest_event_kept_while_queued(
+    hass: HomeAssistant, hass_client: pytest.fixture
+) -> None:
+    """Test a new entity starts out with the last event received while queued."""
+    MOCK_ENTRY.add_to_hass(hass)
+    assert await async_setup_component(hass, DOMAIN, {})
+    await hass.async_block_till_done()
+
+    client: TestClient = await hass_client()
+
+    for event_ts in (1000, 2000):
+        timestamp = str(int(time.time()))
+        body = json.dumps(
+            _create_webhook_payload(
+                "recording.completed", event_ts, _create_meeting_payload()
+            )
+        )
+        response = await client.post(
+            HA_URL,
+            data=body,
+            headers={
+                "Content-Type": "application/json",
+                "x-zm-signature": _generate_signature(SECRET_TOKEN, timestamp, body),
+                "x-zm-request-timestamp": timestamp,
+            },
+        )
+        assert response.status == 200
+    await async_flush_event_discovery(hass)
+
+    ent_reg = er.async_get(hass)
+    event_entities = get_non_precreated_event_entities(ent_reg, MOCK_ENTRY.entry_id)
+    assert len(event_entities) == 1
+    state = hass.states.get(event_entities[0].entity_id)
+    assert state.attributes[ATTR_EVENT_TS] == 2000
+
+
 @pytest.mark.usefixtures("enable_custom_integrations")
 async def test_webhook_fires_ha_event(
     hass: HomeAssistant, hass_client: pytest.fixture
@@ -470,6 +598,176 @@ async def test_webhook_fires_ha_event(
     assert events_fired[0].data["ha_config_entry_id"] == MOCK_ENTRY.entry_id
 
 
+@pytest.mark.usefixtures("enable_custom_integrations")
+async def test_webhook_streamed_body(
+    hass: HomeAssistant, hass_client: pytest.fixture
+) -> None:
+    """Test the signature of a body received in chunks is verified as it arrives."""
+    MOCK_ENTRY.add_to_hass(hass)
+    assert await async_setup_component(hass, DOMAIN, {})
+    await hass.async_block_till_done()
+
+    client: TestClient = await hass_client()
+    events_fired = async_capture_events(hass, "zoom_webhook")
+
+    timestamp = str(int(time.time()))
+    payload = _create_webhook_payload(
+        TEST_WEBHOOK_EVENT,
+        payload={**_create_meeting_payload(), "padding": "x" * 100000},
+    )
+    body = json.dumps(payload)
+    signature = _generate_signature(SECRET_TOKEN, timestamp, body)
+
+    async def _chunks():
+        for index in range(0, len(body), 4096):
+            yield body[index : index + 4096].encode()
+
+    headers = {
+        "Content-Type": "application/json",
+        "x-zm-signature": signature,
+        "x-zm-request-timestamp": timestamp,
+    }
+    response = await client.post(HA_URL, data=_chunks(), headers=headers)
+    assert response.status == 200
+    await hass.async_block_till_done()
+    assert len(events_fired) == 1
+    assert events_fired[0].data[ATTR_PAYLOAD]["padding"] == "x" * 100000
+
+    # Bodies larger than Home Assistant accepts are rejected without being kept
+    with patch("custom_components.zoom.common.MAX_CLIENT_SIZE", 50000):
+        response = await client.post(HA_URL, data=_chunks(), headers=headers)
+    assert response.status == 200
+    await hass.async_block_till_done()
+    assert len(events_fired) == 1
+
+
+@pytest.mark.usefixtures("enable_custom_integrations")
+async def test_webhook_floods_shed(
+    hass: HomeAssistant, hass_client: pytest.fixture
+) -> None:
+    """Test floods are shed before the body is read."""
+    now = 0.0
+    with patch("custom_components.zoom.limiter.monotonic", side_effect=lambda: now):
+        entry = MockConfigEntry(
+            domain=DOMAIN,
+            data=MOCK_ENTRY.data,
+            options={
+                CONF_CONNECTIVITY_ON_STATUSES: DEFAULT_CONNECTIVITY_ON_STATUSES,
+                CONF_WEBHOOK_RATE_LIMIT: 2,
+            },
+            entry_id="rate",
+            unique_id="zoom_rate",
+            version=2,
+        )
+        entry.add_to_hass(hass)
+        assert await async_setup_component(hass, DOMAIN, {})
+        await hass.async_block_till_done()
+
+        client: TestClient = await hass_client()
+        outcomes = hass.data[DATA_WEBHOOK_METRICS].outcomes
+        burst = 2 * BURST_SECONDS
+
+        for _ in range(burst):
+            response = await client.post(HA_URL, data="{}")
+            assert response.status == 200
+        response = await client.post(HA_URL, data="{}")
+        assert response.status == 429
+        assert outcomes == {
+            "missing_headers": burst,
+            "source_rate_limited": 1,
+        }
+
+        # The bucket refills over time
+        now = 1.0
+        response = await client.post(HA_URL, data="{}")
+        assert response.status == 200
+
+
+async def _async_post_signed(client: TestClient, secret_token: str) -> None:
+    """Post a signed webhook request."""
+    timestamp = str(int(time.time()))
+    body = json.dumps(
+        _create_webhook_payload(TEST_WEBHOOK_EVENT, payload=_create_meeting_payload())
+    )
+    response = await client.post(
+        HA_URL,
+        data=body,
+        headers={
+            "Content-Type": "application/json",
+            "x-zm-signature": _generate_signature(secret_token, timestamp, body),
+            "x-zm-request-timestamp": timestamp,
+        },
+    )
+    # Requests from outside the allowed networks look like any other rejection
+    assert response.status == 200
+
+
+@pytest.mark.usefixtures("enable_custom_integrations")
+async def test_webhook_allowed_networks(
+    hass: HomeAssistant, hass_client: pytest.fixture
+) -> None:
+    """Test requests from outside the allowed networks of a config entry are shed."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data=MOCK_ENTRY.data,
+        options={CONF_CONNECTIVITY_ON_STATUSES: DEFAULT_CONNECTIVITY_ON_STATUSES},
+        entry_id="networks",
+        unique_id="zoom_networks",
+        version=2,
+    )
+    entry.add_to_hass(hass)
+    assert await async_setup_component(hass, DOMAIN, {})
+    await hass.async_block_till_done()
+
+    client: TestClient = await hass_client()
+    outcomes = hass.data[DATA_WEBHOOK_METRICS].outcomes
+
+    async def _set_allowed_networks(value: str) -> dict:
+        result = await hass.config_entries.options.async_init(entry.entry_id)
+        return await hass.config_entries.options.async_configure(
+            result["flow_id"],
+            {
+                CONF_CONNECTIVITY_ON_STATUSES: DEFAULT_CONNECTIVITY_ON_STATUSES,
+                CONF_ALLOWED_NETWORKS: value,
+            },
+        )
+
+    result = await _set_allowed_networks("3.7.35.0/25, not a network")
+    assert result["errors"] == {CONF_ALLOWED_NETWORKS: "invalid_network"}
+
+    result = await _set_allowed_networks("3.7.35.0/25, 2001:db8::1")
+    await hass.async_block_till_done()
+    assert entry.options[CONF_ALLOWED_NETWORKS] == ["3.7.35.0/25", "2001:db8::1/128"]
+    # Every config entry restricts the networks, so the body isn't even read
+    await _async_post_signed(client, SECRET_TOKEN)
+    assert outcomes == {"forbidden_source": 1}
+
+    # The test client connects from localhost
+    await _set_allowed_networks("3.7.35.0/25, 127.0.0.0/8")
+    await hass.async_block_till_done()
+    await _async_post_signed(client, SECRET_TOKEN)
+    assert outcomes == {"forbidden_source": 1, "accepted": 1}
+
+    # The allowed networks of one config entry don't apply to another
+    other_entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={**MOCK_ENTRY.data, CONF_NAME: "other", CONF_SECRET_TOKEN: "other"},
+        options={CONF_CONNECTIVITY_ON_STATUSES: DEFAULT_CONNECTIVITY_ON_STATUSES},
+        entry_id="other",
+        unique_id="zoom_other",
+        version=2,
+    )
+    other_entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(other_entry.entry_id)
+    await hass.async_block_till_done()
+    await _set_allowed_networks("3.7.35.0/25")
+    await hass.async_block_till_done()
+
+    await _async_post_signed(client, "other")
+    await _async_post_signed(client, SECRET_TOKEN)
+    assert outcomes == {"forbidden_source": 2, "accepted": 2}
+
+
 @pytest.mark.usefixtures("enable_custom_integrations")
 async def test_webhook_validation_does_not_fire_event(
     hass: HomeAssistant, hass_client: pytest.fixture
@@ -512,3 +810,65 @@ async def test_webhook_validation_does_not_fire_event(
 
     # No events should be fired for validation
     assert len(events_fired) == 0
+
+
+@pytest.mark.usefixtures("enable_custom_integrations")
+async def test_webhook_rejections_logged_sparingly(
+    hass: HomeAssistant, hass_client: pytest.fixture, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test repeated rejections are rate limited and bodies truncated in the log."""
+    MOCK_ENTRY.add_to_hass(hass)
+    assert await async_setup_component(hass, DOMAIN, {})
+    await hass.async_block_till_done()
+
+    client: TestClient = await hass_client()
+    body = json.dumps({"junk": "x" * 1000})
+
+    for _ in range(3):
+        await client.post(HA_URL, data=body)
+
+    messages = [
+        record.getMessage()
+        for record in caplog.records
+        if record.name == "custom_components.zoom.common"
+        and record.levelno >= logging.INFO
+    ]
+    assert len(messages) == 1
+    assert "x" * 1000 not in messages[0]
+    assert f"({len(body)} bytes)" in messages[0]
+
+    # Once the interval has passed the next rejection is logged along with how many
+    # weren't
+    caplog.clear()
+    with patch("custom_components.zoom.common.REJECTION_LOG_INTERVAL", 0):
+        await client.post(HA_URL, data=body)
+    assert "(2 similar request(s) since the last message)" in caplog.text
+
+
+def test_validate_webhook_data() -> None:
+    """Test webhook requests are validated without copying them."""
+    data = _create_webhook_payload(TEST_WEBHOOK_EVENT, 1234, _create_meeting_payload())
+    assert validate_webhook_data(data) is data
+
+    coerced = validate_webhook_data({**data, ATTR_EVENT: 1, ATTR_EVENT_TS: "1234"})
+    assert coerced[ATTR_EVENT] == "1"
+    assert coerced[ATTR_EVENT_TS] == 1234
+
+    for invalid in (
+        [],
+        {ATTR_EVENT: TEST_WEBHOOK_EVENT, ATTR_EVENT_TS: 1234},
+        {**data, ATTR_PAYLOAD: []},
+        {**data, ATTR_EVENT_TS: "soon"},
+    ):
+        with pytest.raises(vol.Invalid):
+            validate_webhook_data(invalid)
+
+    # Payloads that would cost too much to handle are rejected
+    nested: dict = {}
+    for _ in range(MAX_PAYLOAD_DEPTH):
+        nested = {"child": nested}
+    with pytest.raises(vol.Invalid, match="nested"):
+        validate_webhook_data({**data, ATTR_PAYLOAD: nested})
+    wide = {"items": [{"id": i} for i in range(MAX_PAYLOAD_KEYS // 2)]}
+    with pytest.raises(vol.Invalid, match="keys"):
+        validate_webhook_data({**data, ATTR_PAYLOAD: wide})